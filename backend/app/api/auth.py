@@ -1,12 +1,21 @@
 """API authentication middleware."""
 
+import hmac
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.db.base import get_db
 from app.db.models import ApiToken
-from app.security.crypto import verify_password
+from app.security.crypto import (
+    get_token_pepper,
+    hash_token,
+    is_legacy_token_hash,
+    token_lookup_key,
+    verify_token,
+)
 
 security = HTTPBearer()
 
@@ -15,15 +24,48 @@ def verify_api_token(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> ApiToken:
-    """Verify API token and return the associated ApiToken object."""
+    """
+    Verify API token and return the associated ApiToken object.
+
+    Every comparison against stored token material must be constant-time:
+    digests are compared with hmac.compare_digest (bcrypt's checkpw for legacy
+    hashes), never with ==.
+
+    Raises:
+        HTTPException: 401 if the token is invalid, 503 if SECRET_AES_KEY is not
+            configured (tokens are peppered with a key derived from it)
+    """
+    try:
+        pepper = get_token_pepper()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="API authentication is not configured",
+        ) from e
+
     token = credentials.credentials
+    lookup = token_lookup_key(token)
 
-    # Look up all API tokens and check against hashed versions
-    api_tokens = db.query(ApiToken).filter(ApiToken.is_active.is_(True)).all()  # type: ignore[attr-defined]
+    # Narrow to the single candidate row via the indexed lookup key, then verify once
+    api_token = db.execute(
+        select(ApiToken).where(
+            ApiToken.token_lookup == lookup,
+            ApiToken.is_active.is_(True),
+        )
+    ).scalar_one_or_none()
 
-    for api_token in api_tokens:
-        if verify_password(token, api_token.token_hash):
-            return api_token
+    if (
+        api_token is not None
+        and api_token.token_lookup is not None
+        # Re-check exactly: SQL equality may follow a case-insensitive collation
+        and hmac.compare_digest(api_token.token_lookup.encode(), lookup.encode())
+        and verify_token(token, api_token.token_hash, pepper)
+    ):
+        if is_legacy_token_hash(api_token.token_hash):
+            # Upgrade bcrypt hashes once so later requests take the fast path
+            api_token.token_hash = hash_token(token, pepper)
+            db.commit()
+        return api_token
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
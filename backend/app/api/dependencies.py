@@ -0,0 +1,18 @@
+"""FastAPI dependencies for the API routes."""
+
+from fastapi import Request
+
+from app.clients.length_client import AsyncLengthClient, create_length_http_client
+
+
+def get_length_client(request: Request) -> AsyncLengthClient:
+    """
+    FastAPI dependency providing an AsyncLengthClient.
+
+    Uses the AsyncClient stored on app.state by the application lifespan,
+    creating it on first use if the lifespan has not run.
+    """
+    state = request.app.state
+    if getattr(state, "length_http_client", None) is None:
+        state.length_http_client = create_length_http_client()
+    return AsyncLengthClient(client=state.length_http_client)
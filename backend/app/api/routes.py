@@ -1,19 +1,39 @@
 """API routes for CLI access."""
 
+import asyncio
+from collections.abc import Awaitable
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api.auth import get_current_api_token
+from app.api.dependencies import get_length_client
+from app.clients.length_client import AsyncLengthClient, LengthServiceError
+from app.config import get_settings
 from app.db.base import get_db
-from app.db.dao import create_run, create_tweet
+from app.db.dao import create_run, create_tweets_bulk, get_account_for_update
 from app.db.models import Account, ApiToken
 from app.db.schema import RunCreate, TweetCreate
 from app.services.budget import within_budget
 from app.services.canonicalize import canonicalize
 from app.services.duplicate_detection import check_duplicate
-from app.services.generate import generate_thread
-from app.services.images import alt_text_from, pick_hero, validate_and_process
+from app.services.generate import (
+    GeneratedSingle,
+    GeneratedThread,
+    GenerationSettings,
+    ScrapeResult,
+    generate_single,
+    generate_thread,
+    post_texts,
+)
+from app.services.images import (
+    ProcessedImage,
+    alt_text_from,
+    avalidate_and_process,
+    pick_hero,
+)
 from app.services.scraper import scrape
 
 router = APIRouter(prefix="/api", tags=["api"])
@@ -36,13 +56,72 @@ class SubmitRequest(BaseModel):
     force: bool = False
 
 
+class TweetOut(BaseModel):
+    """A posted tweet in the submit response."""
+
+    text: str
+    permalink: str
+
+
 class SubmitResponse(BaseModel):
     """Response model for submit endpoint."""
 
     status: str
     run_id: int
     review_url: str | None = None
-    tweets: list | None = None
+    tweets: list[TweetOut] | None = None
+
+
+# Validates a whole tweet list in one call instead of one model init per tweet
+_tweet_list_adapter = TypeAdapter(list[TweetOut])
+
+
+def _reject_duplicate(
+    db: Session, account_id: int, canonical_url: str, request: SubmitRequest
+) -> None:
+    """
+    Raise 409 if the duplicate rules block this submission.
+
+    Args:
+        db: Database session
+        account_id: Target account ID
+        canonical_url: Canonicalized submission URL
+        request: Submit request (mode and force flag)
+
+    Raises:
+        HTTPException: If a previous run blocks the submission
+    """
+    duplicate_check = check_duplicate(
+        db=db,
+        account_id=account_id,
+        canonical_url=canonical_url,
+        mode=request.mode,
+        force=request.force,
+    )
+    if duplicate_check.should_block:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Duplicate submission. Previous run ID: {duplicate_check.previous_run_id}",
+        )
+
+
+async def _process_hero_or_none(hero_url: str | None) -> ProcessedImage | None:
+    """
+    Download and process a hero image, skipping it on any failure.
+
+    Args:
+        hero_url: Hero image URL, or None if no image was requested
+
+    Returns:
+        Processed image, or None if there is none or processing failed
+    """
+    if hero_url is None:
+        return None
+    try:
+        # Download in a thread, re-encode in the image process pool
+        return await avalidate_and_process(hero_url)
+    except Exception:
+        return None  # Silently skip if image processing fails
 
 
 @router.post("/submit", response_model=SubmitResponse)
@@ -50,6 +129,7 @@ async def api_submit(
     request: SubmitRequest,
     db: Session = Depends(get_db),
     api_token: ApiToken = Depends(get_current_api_token),
+    length_client: AsyncLengthClient = Depends(get_length_client),
 ) -> SubmitResponse:
     """Submit a URL for conversion via API."""
     # Find account if specified
@@ -72,111 +152,136 @@ async def api_submit(
             )
         account_id = account.id
 
-    # 1. Canonicalize URL
-    canonical_url = canonicalize(str(request.url))
+    # 1. Canonicalize URL (may chase redirects over the network)
+    canonical_url = await asyncio.to_thread(canonicalize, str(request.url))
 
-    # 2. Check for duplicates
-    duplicate_check = check_duplicate(
-        db=db,
-        account_id=account_id,
-        canonical_url=canonical_url,
-        mode=request.mode,
-        force=request.force,
-    )
+    # 2. Check for duplicates before paying for scraping and generation
+    _reject_duplicate(db, account_id, canonical_url, request)
 
-    if duplicate_check.is_duplicate and duplicate_check.blocks_submission:  # type: ignore[attr-defined]
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"Duplicate submission. Previous run ID: {duplicate_check.previous_run_id}",
-        )
+    # 3. Scrape the content (blocking I/O, so keep it off the event loop)
+    scraped = await asyncio.to_thread(scrape, str(request.url))
 
-    # 3. Scrape the content
-    scraped = scrape(str(request.url))
-
-    # 4. Process hero image if requested
-    hero_image_bytes = None
-    hero_alt_text = None
+    # 4-5. Process the hero image (if requested) while the content is generated;
+    # neither depends on the other, so the image fetch hides under the LLM call
+    hero_url = None
     if request.image and scraped.hero_candidates:
-        hero = pick_hero(scraped.hero_candidates)
-        if hero:
-            try:
-                hero_image_bytes, _, _ = validate_and_process(hero.url)  # type: ignore[misc, attr-defined]
-                hero_alt_text = alt_text_from(scraped.title, scraped.title)
-            except Exception:
-                pass  # Silently skip if image processing fails
-
-    # 5. Generate the content
-    # Note: This is a simplified version - in production you'd pass proper settings
-    generation_result = generate_thread(
-        scraped_content=scraped,
-        settings={  # type: ignore[arg-type]
-            "type": request.type,
-            "style": request.style or "extractive",
-            "hook": request.hook,
-            "thread_cap": request.thread_cap,
-            "single_cap": request.single_cap,
-        },
-    )  # type: ignore[call-arg]
+        hero_url = pick_hero(scraped.hero_candidates)
+
+    generation_input = ScrapeResult(
+        title=scraped.title, text=scraped.text, word_count=scraped.word_count
+    )
+    generation_settings = GenerationSettings(
+        mode=request.type,
+        style=request.style,
+        hook=request.hook and request.type == "thread",
+    )
+    generate: Awaitable[GeneratedThread | GeneratedSingle]
+    if request.type == "single":
+        generate = asyncio.to_thread(generate_single, generation_input, generation_settings)
+    else:
+        generate = asyncio.to_thread(generate_thread, generation_input, generation_settings)
+    hero_image, generation_result = await asyncio.gather(_process_hero_or_none(hero_url), generate)
+    tweet_texts = post_texts(generation_result, request.single_cap)
+
+    hero_image_bytes = hero_image.data if hero_image is not None else None
+    hero_alt_text = alt_text_from(scraped.title, scraped.title) if hero_image_bytes else None
 
     # 6. Check budget
     mode = request.mode
     if not within_budget(generation_result.cost_usd):
         mode = "review"  # Force review if over budget
 
-    # 7. Create the run
-    run = create_run(
-        db,
-        RunCreate(
-            account_id=account_id,
-            url=str(request.url),
-            canonical_url=canonical_url,
-            mode=mode,
-            type=request.type,
-            status="review" if mode == "review" else "approved",
-            cost_estimate=generation_result.cost_usd,
-            tokens_in=generation_result.tokens_in,
-            tokens_out=generation_result.tokens_out,
-            scraped_title=scraped.title,
-            scraped_text=scraped.text,
-            word_count=scraped.word_count,
-            settings_json={
-                "style": request.style,
-                "hook": request.hook,
-                "reference": request.reference,
-                "utm": request.utm,
-            },
-        ),
-    )
+    # 6b. Optionally validate tweet lengths with the official counter (without
+    # blocking the loop)
+    if get_settings().api_length_check:
+        try:
+            length_results = await length_client.check_batch(tweet_texts)
+            lengths_ok = all(result.is_valid for result in length_results)
+        except LengthServiceError:
+            lengths_ok = False  # Unverified lengths must be reviewed by a human
+        if not lengths_ok:
+            mode = "review"
+
+    # 7. Lock the account, re-check duplicates and store the run with its tweets in
+    # one transaction, so concurrent submits of the same URL cannot both pass.
+    # End the read-only transaction of the earlier lookups first: the lock is taken
+    # when the new transaction begins (BEGIN IMMEDIATE on SQLite).
+    db.commit()
+    try:
+        get_account_for_update(db, account_id)
+        _reject_duplicate(db, account_id, canonical_url, request)
 
-    # 8. Create tweets
-    for idx, tweet_text in enumerate(generation_result.tweets):
-        create_tweet(
+        run = create_run(
             db,
-            TweetCreate(
-                run_id=run.id,
-                idx=idx,
-                role="content",
-                text=tweet_text,
-                media_alt=hero_alt_text if idx == 0 and hero_image_bytes else None,
+            RunCreate(
+                account_id=account_id,
+                url=str(request.url),
+                mode=mode,
+                type=request.type,
+                settings_json=orjson.dumps(
+                    {
+                        "style": request.style,
+                        "hook": request.hook,
+                        "reference": request.reference,
+                        "utm": request.utm,
+                    }
+                ).decode(),
             ),
+            commit=False,
+        )
+        run.canonical_url = canonical_url
+        run.status = "review" if mode == "review" else "approved"
+        run.cost_estimate = generation_result.cost_usd
+        run.tokens_in = generation_result.tokens_in
+        run.tokens_out = generation_result.tokens_out
+        run.scraped_title = scraped.title
+        run.scraped_text = scraped.text
+        run.word_count = scraped.word_count
+
+        # Capture before the commit expires the instance (avoids a reload query)
+        run_id = run.id
+        run_status = run.status
+
+        # 8. Create tweets
+        create_tweets_bulk(
+            db,
+            [
+                TweetCreate(
+                    run_id=run_id,
+                    idx=idx,
+                    role="content",
+                    text=tweet_text,
+                    media_alt=hero_alt_text if idx == 0 and hero_image_bytes else None,
+                )
+                for idx, tweet_text in enumerate(tweet_texts)
+            ],
+            commit=False,
         )
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
 
     # 9. If auto mode and approved, post immediately (simplified)
-    if mode == "auto" and run.status == "approved":
+    if mode == "auto" and run_status == "approved":
         # In a real implementation, this would trigger posting
         # For now, we'll just return success
+        # Built from the generated texts rather than lazy-loading run.tweets
+        permalink_prefix = f"https://twitter.com/user/status/{run_id}"
         return SubmitResponse(
             status="completed",
-            run_id=run.id,
-            tweets=[
-                {"text": t.text, "permalink": f"https://twitter.com/user/status/{run.id}{idx}"}
-                for idx, t in enumerate(run.tweets)
-            ],
+            run_id=run_id,
+            tweets=_tweet_list_adapter.validate_python(
+                [
+                    {"text": text, "permalink": f"{permalink_prefix}/{idx}"}
+                    for idx, text in enumerate(tweet_texts)
+                ]
+            ),
         )
 
     # Return review URL
     return SubmitResponse(
         status="review",
-        run_id=run.id,
-        review_url=f"/review/{run.id}",
+        run_id=run_id,
+        review_url=f"/review/{run_id}",
     )
@@ -1,13 +1,12 @@
 """Command-line interface for Threadify."""
 
-import json
+from functools import lru_cache
 from pathlib import Path
 
-import httpx
+import orjson
 import typer
 from rich import print as rprint
 from rich.console import Console
-from rich.table import Table
 
 VERSION = "0.1.0"
 DEFAULT_API_URL = "http://localhost:8000"
@@ -21,8 +20,9 @@ def get_config_path() -> Path:
     return Path.home() / ".threadify" / "config.json"
 
 
+@lru_cache(maxsize=1)
 def load_config() -> dict[str, str]:
-    """Load configuration from file."""
+    """Load configuration from file (read once; cleared by save_config)."""
     config_path = get_config_path()
     if not config_path.exists():
         rprint("[red]No configuration found.[/red]")
@@ -30,8 +30,7 @@ def load_config() -> dict[str, str]:
         raise typer.Exit(1)
 
     try:
-        with open(config_path) as f:
-            return json.load(f)  # type: ignore[no-any-return]
+        return orjson.loads(config_path.read_bytes())  # type: ignore[no-any-return]
     except Exception as e:
         rprint(f"[red]Error loading config:[/red] {e}")
         raise typer.Exit(1) from e
@@ -47,8 +46,9 @@ def save_config(api_token: str, api_url: str) -> None:
         "api_url": api_url,
     }
 
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    config_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+
+    load_config.cache_clear()
 
 
 @app.command("configure")
@@ -88,6 +88,10 @@ def submit(
     force: bool = typer.Option(False, "--force", "-f", help="Force submission even if duplicate"),
 ) -> None:
     """Submit a blog post URL for conversion to Twitter/X thread or post."""
+    # Imported here so lightweight commands (version, configure, --help) start fast
+    import httpx
+    from rich.table import Table
+
     # Load configuration
     config = load_config()
 
@@ -124,14 +128,9 @@ def submit(
 
     with console.status("[cyan]Submitting URL...[/cyan]"):
         try:
-            response = httpx.post(
-                f"{api_url}/api/submit",
-                json=payload,
-                headers=headers,
-                timeout=60.0,
-                follow_redirects=False,
-            )
-            response.raise_for_status()
+            with httpx.Client(timeout=60.0, follow_redirects=False) as client:
+                response = client.post(f"{api_url}/api/submit", json=payload, headers=headers)
+                response.raise_for_status()
         except httpx.HTTPError as e:
             rprint(f"[red]Error submitting URL:[/red] {e}")
             if hasattr(e, "response") and e.response:
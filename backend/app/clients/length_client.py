@@ -30,16 +30,77 @@ class LengthServiceError(Exception):
     pass
 
 
+def _parse_result(data: dict[str, Any]) -> LengthCheckResult:
+    """Map a camelCase result from the Node service to LengthCheckResult."""
+    return LengthCheckResult(
+        is_valid=data["isValid"],
+        weighted_length=data["weightedLength"],
+        permillage=data["permillage"],
+        valid_range=LengthValidRange(
+            start=data["validRange"]["start"], end=data["validRange"]["end"]
+        ),
+    )
+
+
+def _raise_for_bad_request(response: httpx.Response) -> None:
+    """Raise LengthServiceError for a 400 response from the service."""
+    if response.status_code == 400:
+        try:
+            error = response.json().get("error", "Unknown error")
+        except (ValueError, AttributeError):
+            error = response.text or "Unknown error"
+        raise LengthServiceError(f"Invalid request: {error}")
+
+
+def _parse_batch(response: httpx.Response, count: int) -> list[LengthCheckResult]:
+    """
+    Check a batch response and map its results, one per submitted text.
+
+    Raises:
+        LengthServiceError: If the service answered 400 or with an unexpected body
+        httpx.HTTPStatusError: For any other error status (wrapped by the callers)
+    """
+    _raise_for_bad_request(response)
+    response.raise_for_status()
+    try:
+        results = [_parse_result(result) for result in response.json()["results"]]
+    except (ValueError, KeyError, TypeError) as e:
+        raise LengthServiceError(f"Malformed response from length service: {e}") from e
+    if len(results) != count:
+        raise LengthServiceError(f"Length service returned {len(results)} results for {count}")
+    return results
+
+
+# Process-wide pooled client shared by every LengthClient (created on first use)
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            timeout=5.0, limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    return _shared_client
+
+
 class LengthClient:
     """Client for the Twitter text length validation service."""
 
-    def __init__(self, base_url: str | None = None, timeout: float = 5.0) -> None:
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 5.0,
+        client: httpx.Client | None = None,
+    ) -> None:
         """
         Initialize the length client.
 
         Args:
             base_url: Base URL of the length service (defaults to config)
             timeout: Request timeout in seconds
+            client: Optional HTTP client (defaults to the shared pooled client)
         """
         if base_url is None:
             settings = get_settings()
@@ -47,11 +108,15 @@ class LengthClient:
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+        self._client = client if client is not None else _get_shared_client()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """
+        Release the client.
+
+        This is a no-op: the shared pool stays open for other instances, and an
+        injected client is owned by the caller.
+        """
 
     def __enter__(self) -> "LengthClient":
         """Context manager entry."""
@@ -65,6 +130,9 @@ class LengthClient:
         """
         Check if a tweet text is valid according to Twitter's rules.
 
+        Thin wrapper over check_batch; prefer check_batch when validating
+        several tweets so they share one round-trip.
+
         Args:
             text: Tweet text to validate
 
@@ -72,36 +140,92 @@ class LengthClient:
             LengthCheckResult with validation details
 
         Raises:
-            LengthServiceError: If the service returns an error
-            httpx.HTTPError: If the request fails
+            LengthServiceError: If the service returns an error or the request fails
+        """
+        return self.check_batch([text])[0]
+
+    def check_batch(self, texts: list[str]) -> list[LengthCheckResult]:
+        """
+        Check multiple tweet texts in a single request.
+
+        Args:
+            texts: List of tweet texts to validate
+
+        Returns:
+            List of LengthCheckResult, one for each input text
+
+        Raises:
+            LengthServiceError: If the service returns an error or the request fails
         """
         try:
-            response = self._client.post(f"{self.base_url}/length/check", json={"text": text})
-
-            if response.status_code == 400:
-                error_data = response.json()
-                raise LengthServiceError(
-                    f"Invalid request: {error_data.get('error', 'Unknown error')}"
-                )
-
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Map snake_case to camelCase from the Node service
-            return LengthCheckResult(
-                is_valid=data["isValid"],
-                weighted_length=data["weightedLength"],
-                permillage=data["permillage"],
-                valid_range=LengthValidRange(
-                    start=data["validRange"]["start"], end=data["validRange"]["end"]
-                ),
+            response = self._client.post(
+                f"{self.base_url}/length/batch", json={"texts": texts}, timeout=self.timeout
             )
 
+            return _parse_batch(response, len(texts))
+
         except httpx.HTTPError as e:
-            raise LengthServiceError(f"Failed to check length: {e}") from e
+            raise LengthServiceError(f"Failed to check batch lengths: {e}") from e
 
-    def check_batch(self, texts: list[str]) -> list[LengthCheckResult]:
+
+class AsyncLengthClient:
+    """Async client for the Twitter text length validation service."""
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: float = 5.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """
+        Initialize the async length client.
+
+        Args:
+            base_url: Base URL of the length service (defaults to config)
+            timeout: Request timeout in seconds
+            client: Optional shared AsyncClient (one is created and owned if omitted)
+        """
+        if base_url is None:
+            settings = get_settings()
+            base_url = settings.length_service_url
+
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._owns_client = client is None
+        self._client = client if client is not None else httpx.AsyncClient(timeout=timeout)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncLengthClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def check(self, text: str) -> LengthCheckResult:
+        """
+        Check if a tweet text is valid according to Twitter's rules.
+
+        Thin wrapper over check_batch; prefer check_batch when validating
+        several tweets so they share one round-trip.
+
+        Args:
+            text: Tweet text to validate
+
+        Returns:
+            LengthCheckResult with validation details
+
+        Raises:
+            LengthServiceError: If the service returns an error or the request fails
+        """
+        return (await self.check_batch([text]))[0]
+
+    async def check_batch(self, texts: list[str]) -> list[LengthCheckResult]:
         """
         Check multiple tweet texts in a single request.
 
@@ -112,35 +236,18 @@ class LengthClient:
             List of LengthCheckResult, one for each input text
 
         Raises:
-            LengthServiceError: If the service returns an error
-            httpx.HTTPError: If the request fails
+            LengthServiceError: If the service returns an error or the request fails
         """
         try:
-            response = self._client.post(f"{self.base_url}/length/batch", json={"texts": texts})
-
-            if response.status_code == 400:
-                error_data = response.json()
-                raise LengthServiceError(
-                    f"Invalid request: {error_data.get('error', 'Unknown error')}"
-                )
-
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Map results
-            return [
-                LengthCheckResult(
-                    is_valid=result["isValid"],
-                    weighted_length=result["weightedLength"],
-                    permillage=result["permillage"],
-                    valid_range=LengthValidRange(
-                        start=result["validRange"]["start"],
-                        end=result["validRange"]["end"],
-                    ),
-                )
-                for result in data["results"]
-            ]
+            response = await self._client.post(
+                f"{self.base_url}/length/batch", json={"texts": texts}, timeout=self.timeout
+            )
+            return _parse_batch(response, len(texts))
 
         except httpx.HTTPError as e:
             raise LengthServiceError(f"Failed to check batch lengths: {e}") from e
+
+
+def create_length_http_client() -> httpx.AsyncClient:
+    """Create the pooled AsyncClient shared by async length checks."""
+    return httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=32))
@@ -1,5 +1,7 @@
 """Application configuration."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -13,6 +15,9 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite:///./data/threadify.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle: int = 1800  # seconds
 
     # Security
     secret_aes_key: str | None = None
@@ -27,6 +32,12 @@ class Settings(BaseSettings):
 
     # Services
     length_service_url: str = "http://localhost:8080"
+    # Check API-submitted tweets with the length service, sending runs with invalid
+    # or unverifiable lengths to review instead of posting them
+    api_length_check: bool = False
+
+    # Image processing pool size, per server worker process
+    image_process_workers: int = 2
 
     # Auth
     basic_auth_user: str | None = None
@@ -36,6 +47,12 @@ class Settings(BaseSettings):
     tz: str = "America/Toronto"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings singleton."""
+    """
+    Get application settings singleton.
+
+    The environment and .env file are read once per process; call
+    get_settings.cache_clear() to pick up changes (e.g. in tests).
+    """
     return Settings()
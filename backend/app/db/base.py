@@ -1,20 +1,78 @@
 """SQLAlchemy database engine and session management."""
 
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Connection, Engine, create_engine, event
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 settings = get_settings()
 
+# Connection execution option: start the transaction with BEGIN IMMEDIATE on SQLite
+SQLITE_BEGIN_IMMEDIATE = "sqlite_begin_immediate"
+
+
+def engine_options(settings: Settings) -> dict[str, Any]:
+    """
+    Build create_engine keyword arguments for the configured database.
+
+    In-memory SQLite shares one connection via StaticPool; every other database
+    gets a sized connection pool with pre-ping and periodic recycling.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        Keyword arguments for create_engine
+    """
+    url = settings.database_url
+    options: dict[str, Any] = {"echo": settings.app_env == "development"}
+
+    if "sqlite" in url:
+        options["connect_args"] = {"check_same_thread": False}
+        if url in ("sqlite://", "sqlite:///:memory:"):
+            options["poolclass"] = StaticPool
+            return options
+
+    options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return options
+
+
+def _sqlite_begin(conn: Connection) -> None:
+    """Emit BEGIN IMMEDIATE when the connection asks for the write lock."""
+    if conn.get_execution_options().get(SQLITE_BEGIN_IMMEDIATE):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def configure_sqlite_transactions(engine: Engine) -> None:
+    """
+    Let a connection take the SQLite write lock when its transaction begins.
+
+    pysqlite defers BEGIN until the first write, so reads run outside any
+    transaction and hold no lock between statements. That stays the default;
+    only a connection with the SQLITE_BEGIN_IMMEDIATE execution option starts
+    with BEGIN IMMEDIATE, taking the database write lock up front, which is how
+    SQLite serializes a check-then-insert. pysqlite sees the open transaction
+    and does not issue its own BEGIN, while COMMIT and ROLLBACK work as usual.
+
+    Args:
+        engine: SQLite engine to configure
+    """
+    event.listen(engine, "begin", _sqlite_begin)
+
+
 # Create engine
-engine = create_engine(
-    settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=settings.app_env == "development",
-)
+engine = create_engine(settings.database_url, **engine_options(settings))
+if engine.dialect.name == "sqlite":
+    configure_sqlite_transactions(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
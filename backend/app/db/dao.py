@@ -1,9 +1,18 @@
 """Data Access Objects (DAO) for database operations."""
 
-from sqlalchemy.orm import Session
+import secrets
+from datetime import datetime
 
-from app.db.models import Account, Run, Tweet
-from app.db.schema import AccountCreate, RunCreate, TweetCreate
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer
+
+from app.db.base import SQLITE_BEGIN_IMMEDIATE
+from app.db.models import Account, ApiToken, Run, Tweet
+from app.db.schema import AccountCreate, ApiTokenCreate, RunCreate, TweetCreate
+from app.security.crypto import get_token_pepper, hash_token, token_lookup_key
+
+# Run statuses that count as already posted for duplicate detection
+_DUPLICATE_STATUSES = ("completed", "approved")
 
 
 # Account DAO
@@ -43,6 +52,30 @@ def get_account(db: Session, account_id: int) -> Account | None:
     return db.query(Account).filter(Account.id == account_id).first()
 
 
+def get_account_for_update(db: Session, account_id: int) -> Account | None:
+    """
+    Get account by ID and lock its row until the current transaction ends.
+
+    Concurrent submissions for the same account serialize on this lock, so a
+    duplicate check made while holding it cannot be raced by another insert.
+    SQLite has no row locks and ignores FOR UPDATE, so there the transaction
+    is started with BEGIN IMMEDIATE (see configure_sqlite_transactions), which
+    takes the database write lock before the check runs. The session must
+    therefore have no transaction in progress when this is called.
+
+    Args:
+        db: Database session
+        account_id: Account ID
+
+    Returns:
+        Account instance or None
+    """
+    db.connection(execution_options={SQLITE_BEGIN_IMMEDIATE: True})
+    return db.execute(
+        select(Account).where(Account.id == account_id).with_for_update()
+    ).scalar_one_or_none()
+
+
 def get_account_by_handle(db: Session, handle: str) -> Account | None:
     """
     Get account by handle.
@@ -54,17 +87,19 @@ def get_account_by_handle(db: Session, handle: str) -> Account | None:
     Returns:
         Account instance or None
     """
-    return db.query(Account).filter(Account.handle == handle).first()
+    return db.execute(select(Account).where(Account.handle == handle)).scalar_one_or_none()
 
 
 # Run DAO
-def create_run(db: Session, run: RunCreate) -> Run:
+def create_run(db: Session, run: RunCreate, commit: bool = True) -> Run:
     """
     Create a new run.
 
     Args:
         db: Database session
         run: Run data
+        commit: Commit immediately; pass False to only flush (assigning the ID)
+            and leave the commit to the caller's transaction
 
     Returns:
         Created run instance
@@ -77,6 +112,9 @@ def create_run(db: Session, run: RunCreate) -> Run:
         settings_json=run.settings_json,
     )
     db.add(db_run)
+    if not commit:
+        db.flush()
+        return db_run
     db.commit()
     db.refresh(db_run)
     return db_run
@@ -118,13 +156,15 @@ def get_runs_by_account(db: Session, account_id: int, limit: int = 100) -> list[
 
 
 # Tweet DAO
-def create_tweet(db: Session, tweet: TweetCreate) -> Tweet:
+def create_tweet(db: Session, tweet: TweetCreate, commit: bool = True) -> Tweet:
     """
     Create a new tweet.
 
     Args:
         db: Database session
         tweet: Tweet data
+        commit: Commit immediately; pass False to only flush (assigning the ID)
+            and leave the commit to the caller's transaction
 
     Returns:
         Created tweet instance
@@ -137,11 +177,43 @@ def create_tweet(db: Session, tweet: TweetCreate) -> Tweet:
         media_alt=tweet.media_alt,
     )
     db.add(db_tweet)
+    if not commit:
+        db.flush()
+        return db_tweet
     db.commit()
     db.refresh(db_tweet)
     return db_tweet
 
 
+def create_tweets_bulk(db: Session, tweets: list[TweetCreate], commit: bool = True) -> list[Tweet]:
+    """
+    Create several tweets in a single transaction.
+
+    Args:
+        db: Database session
+        tweets: Tweet data, one entry per tweet
+        commit: Commit immediately; pass False to leave the pending rows to the
+            caller's transaction
+
+    Returns:
+        Created tweet instances, in input order
+    """
+    db_tweets = [
+        Tweet(
+            run_id=tweet.run_id,
+            idx=tweet.idx,
+            role=tweet.role,
+            text=tweet.text,
+            media_alt=tweet.media_alt,
+        )
+        for tweet in tweets
+    ]
+    db.add_all(db_tweets)
+    if commit:
+        db.commit()
+    return db_tweets
+
+
 def get_tweet(db: Session, tweet_id: int) -> Tweet | None:
     """
     Get tweet by ID.
@@ -182,13 +254,111 @@ def find_duplicate_run(db: Session, account_id: int, canonical_url: str) -> Run
     Returns:
         Most recent matching run or None
     """
-    return (
-        db.query(Run)
-        .filter(
+    return db.execute(
+        select(Run)
+        .where(
             Run.account_id == account_id,
             Run.canonical_url == canonical_url,
-            Run.status.in_(["completed", "approved"]),
+            Run.status.in_(_DUPLICATE_STATUSES),
         )
         .order_by(Run.submitted_at.desc())
-        .first()
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def find_recent_scrape(db: Session, canonical_url: str, since: datetime) -> Run | None:
+    """
+    Find the newest run that stored scraped content for a canonical URL.
+
+    Matches runs from any account, since the scraped article does not depend on
+    who submitted it. The deferred article text is loaded with the run.
+
+    Args:
+        db: Database session
+        canonical_url: Canonical URL to look up
+        since: Only consider runs submitted at or after this time
+
+    Returns:
+        Most recent run with scraped text or None
+    """
+    return db.execute(
+        select(Run)
+        .options(undefer(Run.scraped_text))
+        .where(
+            Run.canonical_url == canonical_url,
+            Run.submitted_at >= since,
+            Run.scraped_text.is_not(None),
+        )
+        .order_by(Run.submitted_at.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+def find_duplicate_run_id(db: Session, account_id: int, canonical_url: str) -> int | None:
+    """
+    Find the ID of a completed or approved run for the same account and canonical URL.
+
+    Selects only the ID, so the lookup is answered from ix_runs_dup without
+    loading a Run object.
+
+    Args:
+        db: Database session
+        account_id: Account ID
+        canonical_url: Canonical URL to check
+
+    Returns:
+        ID of the most recent matching run or None
+    """
+    return db.execute(
+        select(Run.id)
+        .where(
+            Run.account_id == account_id,
+            Run.canonical_url == canonical_url,
+            Run.status.in_(_DUPLICATE_STATUSES),
+        )
+        .order_by(Run.submitted_at.desc())
+        .limit(1)
+    ).scalar_one_or_none()
+
+
+# ApiToken DAO
+def create_api_token(db: Session, api_token: ApiTokenCreate) -> tuple[ApiToken, str]:
+    """
+    Issue a new API token.
+
+    Args:
+        db: Database session
+        api_token: API token data
+
+    Returns:
+        Tuple of (created token instance, plaintext token). The plaintext is
+        only available here; the database stores its HMAC hash and lookup key.
+    """
+    token = secrets.token_urlsafe(32)
+    db_token = ApiToken(
+        label=api_token.label,
+        token_hash=hash_token(token, get_token_pepper()),
+        token_lookup=token_lookup_key(token),
     )
+    db.add(db_token)
+    db.commit()
+    db.refresh(db_token)
+    return db_token, token
+
+
+def revoke_api_token(db: Session, api_token: ApiToken) -> ApiToken:
+    """
+    Revoke an API token so it can no longer authenticate.
+
+    Args:
+        db: Database session
+        api_token: Token to revoke
+
+    Returns:
+        Updated token instance
+    """
+    api_token.is_active = False
+    api_token.revoked_at = datetime.now()
+    db.commit()
+    db.refresh(api_token)
+    return api_token
@@ -0,0 +1,31 @@
+"""Add api_tokens.token_lookup index
+
+Revision ID: 3c9a1f2d7e4b
+Revises: 1b475605aeae
+Create Date: 2026-10-15 09:12:40.518221
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9a1f2d7e4b"
+down_revision: str | Sequence[str] | None = "1b475605aeae"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("api_tokens", sa.Column("token_lookup", sa.String(length=16), nullable=True))
+    op.create_index(op.f("ix_api_tokens_token_lookup"), "api_tokens", ["token_lookup"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_api_tokens_token_lookup"), table_name="api_tokens")
+    with op.batch_alter_table("api_tokens") as batch_op:
+        batch_op.drop_column("token_lookup")
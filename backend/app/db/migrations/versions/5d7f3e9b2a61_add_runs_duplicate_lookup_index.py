@@ -0,0 +1,32 @@
+"""Add composite index for duplicate run lookups
+
+Revision ID: 5d7f3e9b2a61
+Revises: 8e2d47b1c5a0
+Create Date: 2026-10-15 11:42:08.531927
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7f3e9b2a61"
+down_revision: str | Sequence[str] | None = "8e2d47b1c5a0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_runs_dup",
+        "runs",
+        ["account_id", "canonical_url", "status", "submitted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_runs_dup", table_name="runs")
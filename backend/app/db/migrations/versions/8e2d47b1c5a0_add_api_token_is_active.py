@@ -0,0 +1,46 @@
+"""Add api_tokens.is_active with partial index
+
+Revision ID: 8e2d47b1c5a0
+Revises: 3c9a1f2d7e4b
+Create Date: 2026-10-15 10:03:17.204611
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2d47b1c5a0"
+down_revision: str | Sequence[str] | None = "3c9a1f2d7e4b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "api_tokens",
+        sa.Column("is_active", sa.Boolean(), server_default=sa.true(), nullable=False),
+    )
+    # Tokens revoked before this column existed stay revoked
+    api_tokens = sa.table("api_tokens", sa.column("is_active", sa.Boolean), sa.column("revoked_at"))
+    op.execute(
+        api_tokens.update().where(api_tokens.c.revoked_at.isnot(None)).values(is_active=False)
+    )
+    op.create_index(
+        "ix_api_tokens_active",
+        "api_tokens",
+        ["token_lookup"],
+        unique=False,
+        sqlite_where=sa.text("is_active"),
+        postgresql_where=sa.text("is_active"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_api_tokens_active", table_name="api_tokens")
+    with op.batch_alter_table("api_tokens") as batch_op:
+        batch_op.drop_column("is_active")
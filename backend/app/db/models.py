@@ -2,13 +2,24 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+    true,
+)
 from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.config import get_settings
 from app.db.base import Base
-from app.security.crypto import seal, unseal
+from app.security.crypto import get_encryption_key, seal, unseal
 
 
 class Account(Base):
@@ -34,14 +45,8 @@ class Account(Base):
 
     # Hybrid properties for transparent encryption/decryption
     def _get_encryption_key(self) -> bytes:
-        """Get the encryption key from settings (base64-decoded)."""
-        import base64
-
-        settings = get_settings()
-        if settings.secret_aes_key is None:
-            raise ValueError("SECRET_AES_KEY not configured")
-        # Key is stored as base64url-encoded string, decode it to bytes
-        return base64.urlsafe_b64decode(settings.secret_aes_key)
+        """Get the encryption key from settings (decoded once per key value)."""
+        return get_encryption_key()
 
     @hybrid_property
     def access_token(self) -> str | None:
@@ -86,6 +91,10 @@ class Run(Base):
     """A content generation run for a URL."""
 
     __tablename__ = "runs"
+    __table_args__ = (
+        # Covers duplicate detection: equality on the first three, newest-first by the last
+        Index("ix_runs_dup", "account_id", "canonical_url", "status", "submitted_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     submitted_at: Mapped[datetime] = mapped_column(
@@ -107,13 +116,14 @@ class Run(Base):
     tokens_out: Mapped[int | None] = mapped_column(Integer, nullable=True)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     scraped_title: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    scraped_text: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Deferred so refreshes and listings don't pull whole article bodies back
+    scraped_text: Mapped[str | None] = mapped_column(Text, nullable=True, deferred=True)
     word_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Relationships
     account: Mapped["Account"] = relationship("Account", back_populates="runs")
     tweets: Mapped[list["Tweet"]] = relationship(
-        "Tweet", back_populates="run", cascade="all, delete-orphan"
+        "Tweet", back_populates="run", cascade="all, delete-orphan", order_by="Tweet.idx"
     )
     images: Mapped[list["Image"]] = relationship(
         "Image", back_populates="run", cascade="all, delete-orphan"
@@ -174,12 +184,27 @@ class ApiToken(Base):
     """API tokens for CLI authentication."""
 
     __tablename__ = "api_tokens"
+    __table_args__ = (
+        # Partial index: auth only ever probes active tokens
+        Index(
+            "ix_api_tokens_active",
+            "token_lookup",
+            sqlite_where=text("is_active"),
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     label: Mapped[str] = mapped_column(String(255), nullable=False)
     token_hash: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    token_lookup: Mapped[str | None] = mapped_column(
+        String(16), unique=True, nullable=True, index=True
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), nullable=False
     )
+    is_active: Mapped[bool] = mapped_column(
+        Boolean, default=True, server_default=true(), nullable=False
+    )
     revoked_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
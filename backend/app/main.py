@@ -1,19 +1,36 @@
 """FastAPI application entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.api.routes import router as api_router
+from app.clients.length_client import create_length_http_client
 from app.config import get_settings
+from app.services.images import shutdown_process_pool
 from app.web.oauth_routes import router as oauth_router
 from app.web.routes import router as web_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open shared clients on startup; close them and the image pool on shutdown."""
+    app.state.length_http_client = create_length_http_client()
+    yield
+    await app.state.length_http_client.aclose()
+    shutdown_process_pool()
+
+
 app = FastAPI(
     title="Threadify",
     description="Turn blog URLs into Twitter/X threads with AI",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add session middleware for OAuth flow
@@ -31,7 +48,12 @@ app.include_router(web_router)
 app.include_router(api_router)
 
 
+# Constant probe body, serialized once. A fresh Response is still built per request
+# because middleware may append headers (e.g. Set-Cookie) to a response in place.
+_HEALTH_BODY = b'{"ok":true}'
+
+
 @app.get("/healthz")
-async def health_check() -> JSONResponse:
+async def health_check() -> Response:
     """Health check endpoint."""
-    return JSONResponse(content={"ok": True}, status_code=200)
+    return Response(content=_HEALTH_BODY, status_code=200, media_type="application/json")
@@ -1,10 +1,20 @@
 """AES-GCM encryption utilities for sealing secrets at rest."""
 
-import base64
+import hashlib
+import hmac
 import os
+from collections.abc import Sequence
+from functools import lru_cache
 
+import bcrypt
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from passlib.context import CryptContext
+
+from app.config import get_settings
+
+try:
+    import pybase64 as _b64
+except ImportError:  # "speedups" extra not installed
+    import base64 as _b64  # type: ignore[no-redef]
 
 
 class CryptoError(Exception):
@@ -19,6 +29,17 @@ class InvalidTokenError(CryptoError):
     pass
 
 
+@lru_cache(maxsize=4)
+def _get_cipher(key: bytes) -> AESGCM:
+    """
+    Get the AES-GCM cipher for a key, expanding its key schedule once.
+
+    Entries are keyed by the key bytes, so a rotated key simply gets a new
+    cipher; call _get_cipher.cache_clear() to drop retired keys from memory.
+    """
+    return AESGCM(key)
+
+
 def seal(plaintext: bytes, key: bytes) -> str:
     """
     Encrypt plaintext using AES-GCM with a random nonce.
@@ -40,18 +61,49 @@ def seal(plaintext: bytes, key: bytes) -> str:
         # Generate random 12-byte nonce
         nonce = os.urandom(12)
 
-        # Create AESGCM cipher
-        aesgcm = AESGCM(key)
-
         # Encrypt plaintext (includes authentication tag)
-        ciphertext = aesgcm.encrypt(nonce, plaintext, None)
+        ciphertext = _get_cipher(key).encrypt(nonce, plaintext, None)
+
+        return _format_sealed(nonce, ciphertext)
+
+    except Exception as e:
+        raise CryptoError(f"Encryption failed: {e}") from e
+
+
+def _format_sealed(nonce: bytes, ciphertext: bytes) -> str:
+    """Combine nonce + ciphertext, base64url-encode and add the version prefix."""
+    encoded = _b64.urlsafe_b64encode(nonce + ciphertext).decode("ascii")
+    return f"v1:{encoded}"
+
+
+def seal_many(plaintexts: Sequence[bytes], key: bytes) -> list[str]:
+    """
+    Encrypt several plaintexts with one cipher and a single nonce draw.
+
+    Equivalent to calling seal() on each item, but reads all nonces from the OS
+    in one call and skips the per-item key checks.
+
+    Args:
+        plaintexts: Data items to encrypt
+        key: 32-byte encryption key
+
+    Returns:
+        Sealed tokens in input order, each in seal()'s format
 
-        # Combine nonce + ciphertext and encode
-        sealed = nonce + ciphertext
-        encoded = base64.urlsafe_b64encode(sealed).decode("ascii")
+    Raises:
+        CryptoError: If encryption fails
+    """
+    if len(key) != 32:
+        raise CryptoError("Key must be exactly 32 bytes")
 
-        # Add version prefix
-        return f"v1:{encoded}"
+    try:
+        cipher = _get_cipher(key)
+        nonces = os.urandom(12 * len(plaintexts))
+        sealed = []
+        for i, plaintext in enumerate(plaintexts):
+            nonce = nonces[12 * i : 12 * (i + 1)]
+            sealed.append(_format_sealed(nonce, cipher.encrypt(nonce, plaintext, None)))
+        return sealed
 
     except Exception as e:
         raise CryptoError(f"Encryption failed: {e}") from e
@@ -83,7 +135,7 @@ def unseal(token: str, key: bytes) -> bytes:
         # Remove version prefix and decode
         encoded_data = token[3:]  # Skip "v1:"
         try:
-            sealed = base64.urlsafe_b64decode(encoded_data)
+            sealed = _b64.urlsafe_b64decode(encoded_data)
         except Exception as e:
             raise InvalidTokenError(f"Invalid base64 encoding: {e}") from e
 
@@ -94,10 +146,9 @@ def unseal(token: str, key: bytes) -> bytes:
         nonce = sealed[:12]
         ciphertext = sealed[12:]
 
-        # Create AESGCM cipher and decrypt
-        aesgcm = AESGCM(key)
+        # Decrypt with the cached cipher for this key
         try:
-            plaintext = aesgcm.decrypt(nonce, ciphertext, None)
+            plaintext = _get_cipher(key).decrypt(nonce, ciphertext, None)
             return plaintext
         except Exception as e:
             # This catches authentication failures (wrong key or tampered data)
@@ -111,15 +162,139 @@ def unseal(token: str, key: bytes) -> bytes:
         raise CryptoError(f"Unseal failed: {e}") from e
 
 
-# Password hashing for API tokens
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def unseal_many(tokens: Sequence[str], key: bytes) -> list[bytes]:
+    """
+    Decrypt several sealed tokens with the same key.
+
+    Args:
+        tokens: Sealed tokens from seal() or seal_many()
+        key: 32-byte encryption key
 
+    Returns:
+        Decrypted plaintexts in input order
 
+    Raises:
+        InvalidTokenError: If any token is malformed, tampered with, or uses wrong key
+        CryptoError: If decryption fails
+    """
+    return [unseal(token, key) for token in tokens]
+
+
+# Password hashing (slow by design; for human-chosen secrets)
 def hash_password(plain_password: str) -> str:
     """Hash a plain password using bcrypt."""
-    return pwd_context.hash(plain_password)  # type: ignore[no-any-return]
+    return bcrypt.hashpw(plain_password.encode("utf-8"), bcrypt.gensalt()).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password."""
-    return pwd_context.verify(plain_password, hashed_password)  # type: ignore[no-any-return]
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("ascii"))
+
+
+def token_lookup_key(token: str) -> str:
+    """
+    Derive the indexed lookup key for an API token.
+
+    The key is a truncated SHA-256 of the token, so a single indexed SELECT finds
+    the candidate row and only one hash verify is needed per request.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
+# Keyed hashing for API tokens
+def derive_token_pepper(secret_key: bytes) -> bytes:
+    """
+    Derive the HMAC key used to hash API tokens from the AES secret.
+
+    A fixed label keeps the pepper distinct from the key used for AES-GCM.
+
+    Args:
+        secret_key: Decoded SECRET_AES_KEY bytes
+
+    Returns:
+        32-byte HMAC key
+    """
+    return hmac.new(secret_key, b"threadify-api-token-v1", hashlib.sha256).digest()
+
+
+def get_encryption_key() -> bytes:
+    """
+    Get the configured SECRET_AES_KEY as raw key bytes.
+
+    Returns:
+        Decoded encryption key
+
+    Raises:
+        ValueError: If SECRET_AES_KEY is not configured
+    """
+    settings = get_settings()
+    if settings.secret_aes_key is None:
+        raise ValueError("SECRET_AES_KEY not configured")
+    return _encryption_key_for(settings.secret_aes_key)
+
+
+@lru_cache(maxsize=4)
+def _encryption_key_for(secret_aes_key: str) -> bytes:
+    """Decode SECRET_AES_KEY (base64url) once per distinct key value."""
+    return _b64.urlsafe_b64decode(secret_aes_key)
+
+
+def get_token_pepper() -> bytes:
+    """
+    Get the API token pepper for the configured SECRET_AES_KEY.
+
+    Returns:
+        32-byte HMAC key
+
+    Raises:
+        ValueError: If SECRET_AES_KEY is not configured
+    """
+    settings = get_settings()
+    if settings.secret_aes_key is None:
+        raise ValueError("SECRET_AES_KEY not configured")
+    return _token_pepper_for(settings.secret_aes_key)
+
+
+@lru_cache(maxsize=4)
+def _token_pepper_for(secret_aes_key: str) -> bytes:
+    """Decode SECRET_AES_KEY and derive its pepper once per distinct key value."""
+    return derive_token_pepper(_b64.urlsafe_b64decode(secret_aes_key))
+
+
+def hash_token(token: str, pepper: bytes) -> str:
+    """
+    Hash an API token with HMAC-SHA256.
+
+    API tokens are 256-bit random strings, so a single keyed hash is enough;
+    bcrypt's work factor only protects low-entropy human passwords.
+
+    Args:
+        token: Plaintext API token
+        pepper: Key from derive_token_pepper()
+
+    Returns:
+        Hex-encoded digest
+    """
+    return hmac.new(pepper, token.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def is_legacy_token_hash(token_hash: str) -> bool:
+    """Return True for API token hashes stored with bcrypt before HMAC hashing."""
+    return token_hash.startswith("$2")
+
+
+def verify_token(token: str, token_hash: str, pepper: bytes) -> bool:
+    """
+    Verify an API token against its stored hash in constant time.
+
+    Args:
+        token: Plaintext API token
+        token_hash: Stored hash (HMAC-SHA256 hex, or a legacy bcrypt hash)
+        pepper: Key from derive_token_pepper()
+
+    Returns:
+        True if the token matches
+    """
+    if is_legacy_token_hash(token_hash):
+        return verify_password(token, token_hash)
+    return hmac.compare_digest(hash_token(token, pepper).encode(), token_hash.encode())
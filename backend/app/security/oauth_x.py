@@ -1,6 +1,5 @@
 """OAuth2 PKCE flow for Twitter/X authentication."""
 
-import base64
 import hashlib
 import secrets
 from collections.abc import Callable
@@ -11,6 +10,11 @@ import httpx
 
 from app.config import get_settings
 
+try:
+    import pybase64 as _b64
+except ImportError:  # "speedups" extra not installed
+    import base64 as _b64  # type: ignore[no-redef]
+
 
 class OAuthError(Exception):
     """Raised when OAuth flow encounters an error."""
@@ -58,7 +62,7 @@ def generate_code_verifier() -> str:
     # Generate 32 random bytes (will be 43 chars when base64url encoded)
     random_bytes = secrets.token_bytes(32)
     # Base64url encode (no padding)
-    code_verifier = base64.urlsafe_b64encode(random_bytes).decode("ascii").rstrip("=")
+    code_verifier = _b64.urlsafe_b64encode(random_bytes).decode("ascii").rstrip("=")
     return code_verifier
 
 
@@ -75,7 +79,7 @@ def generate_code_challenge(code_verifier: str) -> str:
     # SHA256 hash the verifier
     digest = hashlib.sha256(code_verifier.encode("ascii")).digest()
     # Base64url encode (no padding)
-    code_challenge = base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+    code_challenge = _b64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
     return code_challenge
 
 
@@ -1,5 +1,26 @@
 """Budget guardrails for API cost management."""
 
+import re
+
+# Boilerplate instructions that cost tokens without changing the output.
+# Longest first, so a phrase wins over any shorter phrase it contains.
+_VERBOSE_PHRASES = sorted(
+    [
+        "Do not paraphrase, summarize, or add commentary. ",
+        "Extract key sentences and insights verbatim. ",
+        "Please make sure to ",
+        "carefully and ",
+        "ensure that ",
+        "according to Twitter's official rules",
+        "following Twitter's rules",
+        "(following Twitter's rules)",
+    ],
+    key=len,
+    reverse=True,
+)
+_VERBOSE_RE = re.compile("|".join(re.escape(phrase) for phrase in _VERBOSE_PHRASES))
+_SPACES_RE = re.compile(r" {2,}")
+
 
 class BudgetExceededError(Exception):
     """Raised when a generation request exceeds budget cap."""
@@ -19,10 +40,7 @@ def within_budget(estimate_usd: float, cap_usd: float = 0.02) -> bool:
         True if estimate is within budget, False otherwise
     """
     # Treat negative estimates as zero (edge case protection)
-    if estimate_usd < 0:
-        estimate_usd = 0.0
-
-    return estimate_usd <= cap_usd
+    return max(estimate_usd, 0.0) <= cap_usd
 
 
 def compress_prompt(prompt: str) -> str:
@@ -51,24 +69,11 @@ def compress_prompt(prompt: str) -> str:
     # Rejoin with single newlines
     compressed = "\n".join(lines)
 
-    # Further compression: remove verbose phrases
-    verbose_phrases = [
-        "Do not paraphrase, summarize, or add commentary. ",
-        "Extract key sentences and insights verbatim. ",
-        "Please make sure to ",
-        "carefully and ",
-        "ensure that ",
-        "according to Twitter's official rules",
-        "following Twitter's rules",
-        "(following Twitter's rules)",
-    ]
-
-    for phrase in verbose_phrases:
-        compressed = compressed.replace(phrase, "")
+    # Further compression: remove verbose phrases in a single pass
+    compressed = _VERBOSE_RE.sub("", compressed)
 
     # Collapse multiple spaces that may have been created
-    while "  " in compressed:
-        compressed = compressed.replace("  ", " ")
+    compressed = _SPACES_RE.sub(" ", compressed)
 
     # Clean up any resulting empty lines
     lines = [line.strip() for line in compressed.split("\n")]
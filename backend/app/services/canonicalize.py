@@ -1,7 +1,13 @@
 """URL canonicalization for deduplication and normalization."""
 
+import re
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
-from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from functools import lru_cache
+from operator import itemgetter
+from urllib.parse import parse_qs, urlencode, urlparse
 
 import httpx
 
@@ -13,34 +19,51 @@ class CanonicalizationError(Exception):
 
 
 # Common tracking parameters to remove
-TRACKING_PARAMS = {
-    # Google Analytics
-    "utm_source",
-    "utm_medium",
-    "utm_campaign",
-    "utm_term",
-    "utm_content",
-    "utm_id",
-    # Facebook
-    "fbclid",
-    "fb_action_ids",
-    "fb_action_types",
-    "fb_ref",
-    "fb_source",
-    # Twitter
-    "twclid",
-    # Other common tracking
-    "gclid",  # Google Click ID
-    "msclkid",  # Microsoft Click ID
-    "mc_cid",  # Mailchimp Campaign ID
-    "mc_eid",  # Mailchimp Email ID
-    "_hsenc",  # HubSpot
-    "_hsmi",  # HubSpot
-    "mkt_tok",  # Marketo
-    # General
-    "ref",
-    "source",
-}
+TRACKING_PARAMS = frozenset(
+    {
+        # Google Analytics
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "utm_id",
+        # Facebook
+        "fbclid",
+        "fb_action_ids",
+        "fb_action_types",
+        "fb_ref",
+        "fb_source",
+        # Twitter
+        "twclid",
+        # Other common tracking
+        "gclid",  # Google Click ID
+        "msclkid",  # Microsoft Click ID
+        "mc_cid",  # Mailchimp Campaign ID
+        "mc_eid",  # Mailchimp Email ID
+        "_hsenc",  # HubSpot
+        "_hsmi",  # HubSpot
+        "mkt_tok",  # Marketo
+        # General
+        "ref",
+        "source",
+    }
+)
+
+# A key=value pair of unreserved characters: parse_qs + urlencode would return
+# it unchanged, so such pairs can be filtered and sorted as raw strings
+_PLAIN_PARAM_RE = re.compile(r"[A-Za-z0-9_.~-]+=[A-Za-z0-9_.~-]*")
+
+
+# Redirect resolutions made with the default fetcher: (url, max_redirects) ->
+# (expires_at, final_url). Destinations can change, hence the TTL.
+_REDIRECT_CACHE_TTL = 3600.0
+_REDIRECT_CACHE_MAXSIZE = 4096
+_redirect_cache: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+_redirect_cache_lock = threading.Lock()
+
+# Pooled client for redirect chasing, reused across hops and calls
+_shared_client: httpx.Client | None = None
 
 
 def canonicalize(
@@ -73,6 +96,33 @@ def canonicalize(
     Raises:
         CanonicalizationError: If URL is malformed or redirect loop detected
     """
+    if not follow_redirects:
+        # Pure string transformation: memoized on the raw input
+        return _canonicalize_offline(url)
+
+    url = _absolute_url(url)
+    if http_get is None:
+        # Default fetcher: results are shared across calls via the TTL cache
+        url = _follow_redirects_cached(url, max_redirects)
+    else:
+        url = _follow_redirects(url, http_get, max_redirects)
+
+    return _normalize(url)
+
+
+def _absolute_url(url: str) -> str:
+    """
+    Validate a submitted URL and give it an https:// scheme if it has none (rule 1).
+
+    Args:
+        url: URL as submitted
+
+    Returns:
+        Stripped absolute URL
+
+    Raises:
+        CanonicalizationError: If the URL is empty or has no domain
+    """
     if not url or not url.strip():
         raise CanonicalizationError("URL cannot be empty")
 
@@ -92,18 +142,49 @@ def canonicalize(
     if not parsed.netloc:
         raise CanonicalizationError("URL must have a valid domain")
 
-    # Follow redirects if requested
-    if follow_redirects:
-        if http_get is None:
-            # Use default httpx client
-            http_get = _default_http_get
+    return url
 
-        url = _follow_redirects(url, http_get, max_redirects)
-        # Re-parse after following redirects
-        try:
-            parsed = urlparse(url)
-        except Exception as e:
-            raise CanonicalizationError(f"Invalid URL after redirects: {e}") from e
+
+@lru_cache(maxsize=4096)
+def _canonicalize_offline(url: str) -> str:
+    """
+    Canonicalize a raw URL without following redirects.
+
+    Keyed on the raw input, so a repeated URL skips validation and parsing
+    entirely; invalid URLs raise and are not cached.
+
+    Args:
+        url: URL as submitted
+
+    Returns:
+        Canonicalized URL string
+
+    Raises:
+        CanonicalizationError: If the URL is malformed
+    """
+    return _normalize(_absolute_url(url))
+
+
+@lru_cache(maxsize=4096)
+def _normalize(url: str) -> str:
+    """
+    Apply the offline normalization rules (3-7) to an absolute URL.
+
+    Pure function of its input, so results are memoized.
+
+    Args:
+        url: Absolute URL (after any redirects)
+
+    Returns:
+        Canonicalized URL string
+
+    Raises:
+        CanonicalizationError: If the URL cannot be parsed
+    """
+    try:
+        parsed = urlparse(url)
+    except Exception as e:
+        raise CanonicalizationError(f"Invalid URL after redirects: {e}") from e
 
     # Normalize host
     host = parsed.netloc.lower()
@@ -131,7 +212,15 @@ def canonicalize(
 
     # Normalize query parameters
     query = ""
-    if parsed.query:
+    pairs = parsed.query.split("&")
+    if all(_PLAIN_PARAM_RE.fullmatch(pair) for pair in pairs):
+        # Fast path: nothing to decode or re-encode; a stable sort by key keeps
+        # repeated keys in their original order, as parse_qs does
+        keyed = [(pair.partition("=")[0], pair) for pair in pairs]
+        kept = [item for item in keyed if item[0].lower() not in TRACKING_PARAMS]
+        kept.sort(key=itemgetter(0))
+        query = "&".join([pair for _, pair in kept])
+    elif parsed.query:
         params = parse_qs(parsed.query, keep_blank_values=True)
 
         # Remove tracking parameters
@@ -147,18 +236,31 @@ def canonicalize(
                     sorted_params.append((key, value))
             query = urlencode(sorted_params)
 
-    # Fragment is always removed (set to empty)
-    fragment = ""
+    # Reconstruct URL directly (params and fragment are always dropped); the path
+    # is never empty, so this matches what urlunparse would build
+    if query:
+        return f"{scheme}://{host}{path}?{query}"
+    return f"{scheme}://{host}{path}"
 
-    # Reconstruct URL
-    canonical_url = urlunparse((scheme, host, path, "", query, fragment))
 
-    return canonical_url
+def _get_shared_client() -> httpx.Client:
+    """Return the shared HTTP client for redirect chasing, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            follow_redirects=False,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _shared_client
 
 
 def _default_http_get(url: str) -> httpx.Response:
     """
-    Default HTTP GET function using httpx.
+    Default HTTP fetch for redirect chasing, over a pooled connection.
+
+    Sends HEAD since only the status and Location header are needed, falling
+    back to GET for servers that reject HEAD.
 
     Args:
         url: URL to fetch
@@ -166,8 +268,59 @@ def _default_http_get(url: str) -> httpx.Response:
     Returns:
         httpx.Response object
     """
-    with httpx.Client(follow_redirects=False, timeout=10.0) as client:
-        return client.get(url)
+    client = _get_shared_client()
+    response = client.head(url)
+    if response.status_code in (405, 501):
+        response = client.get(url)
+    return response
+
+
+def _follow_redirects_cached(url: str, max_redirects: int) -> str:
+    """
+    Follow redirects with the default fetcher, reusing recent results.
+
+    Resolved destinations are kept for _REDIRECT_CACHE_TTL seconds (LRU-bounded
+    to _REDIRECT_CACHE_MAXSIZE entries). Resolutions where a fetch failed are not
+    cached, so a transient network error is retried on the next call.
+
+    Args:
+        url: Starting URL
+        max_redirects: Maximum number of redirects to follow
+
+    Returns:
+        Final URL after all redirects
+
+    Raises:
+        CanonicalizationError: If too many redirects or redirect loop detected
+    """
+    key = (url, max_redirects)
+    now = time.monotonic()
+    with _redirect_cache_lock:
+        cached = _redirect_cache.get(key)
+        if cached is not None and cached[0] > now:
+            _redirect_cache.move_to_end(key)
+            return cached[1]
+
+    fetch_failed = False
+
+    def fetch(target: str) -> httpx.Response:
+        nonlocal fetch_failed
+        try:
+            return _default_http_get(target)
+        except Exception:
+            fetch_failed = True
+            raise
+
+    resolved = _follow_redirects(url, fetch, max_redirects)
+
+    if not fetch_failed:
+        with _redirect_cache_lock:
+            _redirect_cache[key] = (now + _REDIRECT_CACHE_TTL, resolved)
+            _redirect_cache.move_to_end(key)
+            while len(_redirect_cache) > _REDIRECT_CACHE_MAXSIZE:
+                _redirect_cache.popitem(last=False)
+
+    return resolved
 
 
 def _follow_redirects(
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
 
-from app.db.models import Run
+from app.db.dao import find_duplicate_run_id
 
 
 @dataclass
@@ -43,21 +43,11 @@ def check_duplicate(
     Returns:
         DuplicateDetectionResult with duplicate status and blocking decision
     """
-    # Query for existing runs with same account + canonical URL
-    # Only consider completed or approved runs as duplicates
-    existing_run = (
-        db.query(Run)
-        .filter(
-            Run.account_id == account_id,
-            Run.canonical_url == canonical_url,
-            Run.status.in_(["completed", "approved"]),
-        )
-        .order_by(Run.submitted_at.desc())
-        .first()
-    )
+    # Most recent completed or approved run for the same account + canonical URL
+    existing_run_id = find_duplicate_run_id(db, account_id, canonical_url)
 
     # No duplicate found
-    if not existing_run:
+    if existing_run_id is None:
         return DuplicateDetectionResult(is_duplicate=False)
 
     # Duplicate found - determine if should block
@@ -71,5 +61,5 @@ def check_duplicate(
         should_block = False
 
     return DuplicateDetectionResult(
-        is_duplicate=True, previous_run_id=existing_run.id, should_block=should_block
+        is_duplicate=True, previous_run_id=existing_run_id, should_block=should_block
     )
@@ -1,13 +1,26 @@
 """AI-powered thread generation using OpenAI GPT models."""
 
+import asyncio
+import hashlib
 import json
-from dataclasses import dataclass
-
-from openai import OpenAI
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from openai import AsyncOpenAI, OpenAI
 from pydantic import BaseModel, Field
 
 from app.config import get_settings
 
+try:
+    import tiktoken
+except ImportError:  # Optional "tokenizer" extra; fall back to the chars/4 heuristic
+    tiktoken = None
+
 
 class GenerationError(Exception):
     """Raised when generation fails."""
@@ -45,6 +58,12 @@ class GeneratedReferenceSchema(BaseModel):
     text: str = Field(..., description="Reference tweet text")
 
 
+class ShortenedTweetsSchema(BaseModel):
+    """Schema for rewritten oversize tweets."""
+
+    tweets: list[TweetSchema] = Field(..., description="Rewritten tweets, in input order")
+
+
 # Output dataclasses for service functions
 
 
@@ -59,6 +78,8 @@ class GeneratedThread:
     tokens_out: int
     cost_usd: float
     model_used: str
+    tokens_cached: int = 0  # Prompt tokens served from OpenAI's prompt cache
+    cached: bool = False  # Served from the local response cache (no API call, no cost)
 
 
 @dataclass
@@ -71,6 +92,8 @@ class GeneratedSingle:
     tokens_out: int
     cost_usd: float
     model_used: str
+    tokens_cached: int = 0  # Prompt tokens served from OpenAI's prompt cache
+    cached: bool = False  # Served from the local response cache (no API call, no cost)
 
 
 @dataclass
@@ -82,6 +105,16 @@ class GeneratedReference:
     tokens_out: int
     cost_usd: float
     model_used: str
+    tokens_cached: int = 0  # Prompt tokens served from OpenAI's prompt cache
+    cached: bool = False  # Served from the local response cache (no API call, no cost)
+
+
+@dataclass
+class ThreadBatchResult:
+    """Result of a thread generation batch."""
+
+    threads: dict[int, GeneratedThread]  # Keyed by article index in the submitted list
+    failed: dict[int, str]  # Article index -> reason its request produced no thread
 
 
 @dataclass
@@ -106,23 +139,69 @@ class GenerationSettings:
 
 
 # Token cost estimation (approximate rates for GPT-4o-mini and GPT-4o)
-COSTS = {
-    "gpt-4o-mini": {"input": 0.150 / 1_000_000, "output": 0.600 / 1_000_000},  # per token
-    "gpt-4o": {"input": 2.50 / 1_000_000, "output": 10.00 / 1_000_000},
+# (input, output) USD per token
+COSTS: dict[str, tuple[float, float]] = {
+    "gpt-4o-mini": (0.150 / 1_000_000, 0.600 / 1_000_000),
+    "gpt-4o": (2.50 / 1_000_000, 10.00 / 1_000_000),
+}
+
+# Output token ceilings per response schema, roomy enough for the longest valid
+# response (8 tweets of 280 chars plus JSON) so structured output is never cut off
+MAX_OUTPUT_TOKENS: dict[type[BaseModel], int] = {
+    GeneratedThreadSchema: 1500,
+    GeneratedSingleSchema: 250,
+    GeneratedReferenceSchema: 150,
+    ShortenedTweetsSchema: 800,
 }
 
+# X's tweet length limit, checked locally so only offending tweets are re-asked
+TWEET_MAX_CHARS = 280
+
+# Low temperature keeps extractive output close to the source and repeatable
+GENERATION_TEMPERATURE = 0.2
+
+# Batch API jobs are billed at half the synchronous rate
+BATCH_DISCOUNT = 0.5
+
 
-def estimate_tokens(text: str) -> int:
+@lru_cache(maxsize=8)
+def _encoding_for(model: str) -> Any | None:
     """
-    Estimate token count for text (rough approximation: 1 token ≈ 4 chars).
+    Load the tiktoken encoding for a model once per process.
+
+    Args:
+        model: Model name
+
+    Returns:
+        The model's BPE encoding, or None if tiktoken is unavailable or cannot load it
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Unknown model, or the BPE file could not be fetched
+        return None
+
+
+def estimate_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """
+    Estimate token count for text.
+
+    Uses the model's real BPE tokenizer when tiktoken is installed, otherwise a
+    rough approximation of 1 token ≈ 4 chars.
 
     Args:
         text: Input text
+        model: Model name used to pick the tokenizer
 
     Returns:
         Estimated token count
     """
-    return len(text) // 4
+    encoding = _encoding_for(model)
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
 
 
 def estimate_cost(
@@ -142,11 +221,8 @@ def estimate_cost(
     if model not in COSTS:
         model = "gpt-4o-mini"
 
-    input_tokens = estimate_tokens(prompt_text)
-    cost_in = input_tokens * COSTS[model]["input"]
-    cost_out = expected_output_tokens * COSTS[model]["output"]
-
-    return cost_in + cost_out
+    input_rate, output_rate = COSTS[model]
+    return estimate_tokens(prompt_text, model) * input_rate + expected_output_tokens * output_rate
 
 
 def choose_model(word_count: int) -> str:
@@ -164,49 +240,52 @@ def choose_model(word_count: int) -> str:
     return "gpt-4o-mini"
 
 
-def build_thread_prompt(scrape: ScrapeResult, settings: GenerationSettings) -> str:
+# Thread mode instructions, keyed by GenerationSettings.extractive
+MODE_INSTRUCTIONS = {
+    True: (
+        "Use ONLY the author's own words from the article. "
+        "Do not paraphrase, summarize, or add commentary. "
+        "Extract key sentences and insights verbatim."
+    ),
+    False: "Summarize and distill the key insights from the article in your own words.",
+}
+
+HOOK_INSTRUCTION = (
+    "Start with a compelling hook tweet that grabs attention and "
+    "makes people want to read the thread."
+)
+
+# Style instructions shared by thread and single prompts
+STYLE_INSTRUCTIONS = {
+    "conversational": "Write in a conversational, friendly tone.",
+    "analytical": "Write in an analytical, data-driven tone.",
+    "casual": "Write in a casual, relaxed tone.",
+    "enthusiastic": "Write in an enthusiastic, energetic tone.",
+}
+
+
+# Prompts put the static instructions first and the article last, so calls with the
+# same settings share a byte-identical prefix that OpenAI can serve from its prompt cache.
+
+
+@lru_cache(maxsize=64)
+def _thread_preamble(extractive: bool, style: str | None, hook: bool) -> str:
     """
-    Build the prompt for thread generation.
+    Build the static instruction part of a thread prompt.
 
     Args:
-        scrape: Scraped content
-        settings: Generation settings
+        extractive: Whether to use the author's own words only
+        style: Style profile name
+        hook: Whether to open with a hook tweet
 
     Returns:
-        Formatted prompt string
+        Preamble string, identical for identical settings
     """
-    # Base extractive instructions
-    if settings.extractive:
-        mode_instruction = (
-            "Use ONLY the author's own words from the article. "
-            "Do not paraphrase, summarize, or add commentary. "
-            "Extract key sentences and insights verbatim."
-        )
-    else:
-        mode_instruction = (
-            "Summarize and distill the key insights from the article in your own words."
-        )
-
-    # Style instruction
-    style_instruction = ""
-    if settings.style == "conversational":
-        style_instruction = "Write in a conversational, friendly tone."
-    elif settings.style == "analytical":
-        style_instruction = "Write in an analytical, data-driven tone."
-    elif settings.style == "casual":
-        style_instruction = "Write in a casual, relaxed tone."
-    elif settings.style == "enthusiastic":
-        style_instruction = "Write in an enthusiastic, energetic tone."
-
-    # Hook instruction
-    hook_instruction = ""
-    if settings.hook:
-        hook_instruction = (
-            "Start with a compelling hook tweet that grabs attention and "
-            "makes people want to read the thread."
-        )
+    mode_instruction = MODE_INSTRUCTIONS[extractive]
+    style_instruction = STYLE_INSTRUCTIONS.get(style or "", "")
+    hook_instruction = HOOK_INSTRUCTION if hook else ""
 
-    prompt = f"""You are creating a Twitter/X thread from the following article.
+    return f"""You are creating a Twitter/X thread from the article below.
 
 {mode_instruction}
 {style_instruction}
@@ -214,93 +293,251 @@ def build_thread_prompt(scrape: ScrapeResult, settings: GenerationSettings) -> s
 
 Create a thread of 3-8 tweets. Each tweet must be under 280 characters (following Twitter's rules).
 
-Article Title: {scrape.title}
-{f"Site: {scrape.site_name}" if scrape.site_name else ""}
-{f"Author: {scrape.author}" if scrape.author else ""}
-
-Article Content:
-{scrape.text}
-
 Return your response as a JSON object with this structure:
 {{
   "tweets": [{{"text": "First tweet..."}}, {{"text": "Second tweet..."}}, ...],
-  "style_used": "{settings.style or "none"}",
-  "hook_used": {str(settings.hook).lower()}
+  "style_used": "{style or "none"}",
+  "hook_used": {str(hook).lower()}
 }}
 """
-    return prompt
 
 
-def build_single_prompt(scrape: ScrapeResult, settings: GenerationSettings) -> str:
+@lru_cache(maxsize=64)
+def _single_preamble(style: str | None) -> str:
     """
-    Build the prompt for single tweet generation.
+    Build the static instruction part of a single tweet prompt.
 
     Args:
-        scrape: Scraped content
-        settings: Generation settings
+        style: Style profile name
 
     Returns:
-        Formatted prompt string
+        Preamble string, identical for identical settings
     """
-    # Style instruction
-    style_instruction = ""
-    if settings.style == "conversational":
-        style_instruction = "Write in a conversational, friendly tone."
-    elif settings.style == "analytical":
-        style_instruction = "Write in an analytical, data-driven tone."
-    elif settings.style == "casual":
-        style_instruction = "Write in a casual, relaxed tone."
-    elif settings.style == "enthusiastic":
-        style_instruction = "Write in an enthusiastic, energetic tone."
+    style_instruction = STYLE_INSTRUCTIONS.get(style or "", "")
 
-    prompt = f"""You are creating a single Twitter/X post from the following article.
+    return f"""You are creating a single Twitter/X post from the article below.
 
 Distill the key insight or most compelling point from the article into one tweet.
 The tweet must be under 280 characters (following Twitter's rules).
 {style_instruction}
 
-Article Title: {scrape.title}
-{f"Site: {scrape.site_name}" if scrape.site_name else ""}
-{f"Author: {scrape.author}" if scrape.author else ""}
+Return your response as a JSON object with this structure:
+{{
+  "text": "Your single tweet here...",
+  "style_used": "{style or "none"}"
+}}
+"""
+
 
-Article Content:
-{scrape.text}
+_REFERENCE_PREAMBLE = """You are creating a reference tweet to accompany a Twitter/X thread.
+
+Create a simple reference tweet that credits the original article below.
+Format: "Original: [Title] by [Author/Site]"
+Keep it under 280 characters.
+
+Return your response as a JSON object with this structure:
+{
+  "text": "Your reference tweet here..."
+}
+"""
+
+
+_SHORTEN_PREAMBLE = f"""You are editing tweets from a Twitter/X thread that are too long.
+
+Rewrite each numbered tweet below so it is under {TWEET_MAX_CHARS} characters.
+Keep its meaning, voice and any thread numbering such as "2/5".
+Return exactly one rewritten tweet per input tweet, in the same order.
 
 Return your response as a JSON object with this structure:
 {{
-  "text": "Your single tweet here...",
-  "style_used": "{settings.style or "none"}"
+  "tweets": [
+    {{"text": "Rewritten tweet..."}}
+  ]
 }}
 """
-    return prompt
+
+
+# Per-article template, filled once per prompt with a single format call
+_ARTICLE_HEADER_TEMPLATE = "Article Title: {}\n{}\n{}\n"
+
+
+def _article_header(title: str, site_name: str | None, author: str | None) -> str:
+    """Format the per-article title, site and author lines."""
+    return _ARTICLE_HEADER_TEMPLATE.format(
+        title,
+        "Site: " + site_name if site_name else "",
+        "Author: " + author if author else "",
+    )
+
+
+def _with_article(preamble: str, scrape: ScrapeResult) -> str:
+    """
+    Append the per-article part of thread and single prompts to a preamble.
+
+    Joined in one pass, so the article text is copied once per prompt.
+
+    Args:
+        preamble: Static instruction part of the prompt
+        scrape: Scraped content
+
+    Returns:
+        Full prompt string
+    """
+    header = _article_header(scrape.title, scrape.site_name, scrape.author)
+    return "".join((preamble, "\n", header, "\nArticle Content:\n", scrape.text, "\n"))
+
+
+def build_thread_prompt(scrape: ScrapeResult, settings: GenerationSettings) -> str:
+    """
+    Build the prompt for thread generation.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+
+    Returns:
+        Formatted prompt string
+    """
+    preamble = _thread_preamble(settings.extractive, settings.style, settings.hook)
+    return _with_article(preamble, scrape)
+
+
+def build_single_prompt(scrape: ScrapeResult, settings: GenerationSettings) -> str:
+    """
+    Build the prompt for single tweet generation.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+
+    Returns:
+        Formatted prompt string
+    """
+    return _with_article(_single_preamble(settings.style), scrape)
 
 
 def build_reference_prompt(scrape: ScrapeResult) -> str:
     """
     Build the prompt for reference tweet generation.
 
+    Only the title, site and author go into the prompt, so re-threading the same
+    article yields an identical prompt and generate_reference is served from the
+    response cache at no cost.
+
     Args:
         scrape: Scraped content
 
     Returns:
         Formatted prompt string
     """
-    prompt = f"""You are creating a reference tweet to accompany a Twitter/X thread.
+    return _reference_prompt(scrape.title, scrape.site_name, scrape.author)
 
-Create a simple reference tweet that credits the original article.
-Format: "Original: [Title] by [Author/Site]"
-Keep it under 280 characters.
 
-Article Title: {scrape.title}
-{f"Site: {scrape.site_name}" if scrape.site_name else ""}
-{f"Author: {scrape.author}" if scrape.author else ""}
+@lru_cache(maxsize=512)
+def _reference_prompt(title: str, site_name: str | None, author: str | None) -> str:
+    """Build the reference prompt from the article metadata, memoized."""
+    return f"""{_REFERENCE_PREAMBLE}
+{_article_header(title, site_name, author)}"""
 
-Return your response as a JSON object with this structure:
-{{
-  "text": "Your reference tweet here..."
-}}
-"""
-    return prompt
+
+def build_shorten_prompt(texts: list[str]) -> str:
+    """
+    Build a prompt asking to shorten oversize tweets, without the article body.
+
+    Args:
+        texts: Tweets that exceed TWEET_MAX_CHARS
+
+    Returns:
+        Formatted prompt string
+    """
+    numbered = "\n".join(f"{idx}. {text}" for idx, text in enumerate(texts, start=1))
+    return f"""{_SHORTEN_PREAMBLE}
+Tweets:
+{numbered}"""
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+class _OpenAIResult(NamedTuple, Generic[SchemaT]):
+    """Parsed structured response with its token usage."""
+
+    parsed: SchemaT
+    tokens_in: int
+    tokens_out: int
+    tokens_cached: int
+    from_cache: bool = False
+
+
+# Identical prompts (retries, preview/regenerate flows) reuse the earlier response
+# instead of paying for another completion. Values are the response JSON, revalidated
+# on every hit so callers never share a mutable pydantic instance.
+_RESPONSE_CACHE_MAXSIZE = 1024
+_response_cache: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_cache_key(
+    prompt: str, model: str, response_format: type[BaseModel]
+) -> tuple[str, str, str]:
+    """Build the response cache key from the model, schema and a prompt digest."""
+    digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+    return (model, response_format.__qualname__, digest)
+
+
+def _completion_options(
+    response_format: type[BaseModel], cache_key: tuple[str, str, str], use_cache: bool
+) -> dict[str, Any]:
+    """
+    Build the sampling options for a completion request.
+
+    Args:
+        response_format: Pydantic model for structured output
+        cache_key: Response cache key of the prompt
+        use_cache: Whether the caller accepts a repeat of an earlier response
+
+    Returns:
+        Keyword arguments for beta.chat.completions.parse
+    """
+    options: dict[str, Any] = {
+        "max_tokens": MAX_OUTPUT_TOKENS.get(response_format, 1500),
+        "temperature": GENERATION_TEMPERATURE,
+    }
+    if use_cache:
+        # Seeded from the prompt digest so a cache miss reproduces the same output
+        # as best it can; regenerate requests (use_cache=False) stay unseeded
+        options["seed"] = int(cache_key[2][:8], 16)
+    return options
+
+
+def _cached_response(
+    key: tuple[str, str, str], response_format: type[SchemaT]
+) -> _OpenAIResult[SchemaT] | None:
+    """
+    Look up a previously generated response.
+
+    Args:
+        key: Response cache key
+        response_format: Pydantic model for structured output
+
+    Returns:
+        Cached result with zero token usage, or None on a miss
+    """
+    with _response_cache_lock:
+        cached_json = _response_cache.get(key)
+        if cached_json is None:
+            return None
+        _response_cache.move_to_end(key)
+    return _OpenAIResult(response_format.model_validate_json(cached_json), 0, 0, 0, True)
+
+
+def _store_response(key: tuple[str, str, str], parsed: BaseModel) -> None:
+    """Store a generated response, evicting the least recently used entry if full."""
+    with _response_cache_lock:
+        _response_cache[key] = parsed.model_dump_json()
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > _RESPONSE_CACHE_MAXSIZE:
+            _response_cache.popitem(last=False)
 
 
 def _default_openai_client() -> OpenAI:
@@ -311,13 +548,58 @@ def _default_openai_client() -> OpenAI:
     return OpenAI(api_key=settings.openai_api_key)
 
 
+def _default_async_openai_client() -> AsyncOpenAI:
+    """Create default async OpenAI client."""
+    settings = get_settings()
+    if not settings.openai_api_key:
+        raise GenerationError("OPENAI_API_KEY not configured")
+    return AsyncOpenAI(api_key=settings.openai_api_key)
+
+
+def _parse_completion(completion: Any, response_format: type[SchemaT]) -> _OpenAIResult[SchemaT]:
+    """
+    Extract the parsed response and token usage from a completion.
+
+    Args:
+        completion: Completion returned by beta.chat.completions.parse
+        response_format: Pydantic model for structured output
+
+    Returns:
+        Parsed response with token usage
+
+    Raises:
+        GenerationError: If the completion has no content
+    """
+    # Extract usage
+    usage = completion.usage
+    tokens_in = usage.prompt_tokens if usage else 0
+    tokens_out = usage.completion_tokens if usage else 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    tokens_cached = (getattr(details, "cached_tokens", None) or 0) if details else 0
+
+    # Parse response
+    if completion.choices and completion.choices[0].message.parsed:
+        return _OpenAIResult(
+            completion.choices[0].message.parsed, tokens_in, tokens_out, tokens_cached
+        )
+    else:
+        # Fall back to manual JSON parsing if structured output failed
+        content = completion.choices[0].message.content
+        if content:
+            parsed = response_format.model_validate_json(content)
+            return _OpenAIResult(parsed, tokens_in, tokens_out, tokens_cached)
+        else:
+            raise GenerationError("Empty response from OpenAI")
+
+
 def _call_openai(
     prompt: str,
     model: str,
-    response_format: type[BaseModel],
+    response_format: type[SchemaT],
     openai_client: OpenAI | None = None,
     max_retries: int = 2,
-) -> tuple[BaseModel, int, int]:
+    use_cache: bool = True,
+) -> _OpenAIResult[SchemaT]:
     """
     Call OpenAI API with structured output and retry logic.
 
@@ -327,13 +609,20 @@ def _call_openai(
         response_format: Pydantic model for structured output
         openai_client: Optional OpenAI client (for testing)
         max_retries: Maximum number of retries for invalid JSON
+        use_cache: Reuse a cached response for an identical prompt
 
     Returns:
-        Tuple of (parsed_response, tokens_in, tokens_out)
+        Parsed response with token usage
 
     Raises:
         GenerationError: If all retries fail or API error occurs
     """
+    cache_key = _response_cache_key(prompt, model, response_format)
+    if use_cache:
+        cached = _cached_response(cache_key, response_format)
+        if cached is not None:
+            return cached
+
     if openai_client is None:
         openai_client = _default_openai_client()
 
@@ -344,23 +633,67 @@ def _call_openai(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 response_format=response_format,
+                **_completion_options(response_format, cache_key, use_cache),
             )
+            result = _parse_completion(completion, response_format)
+            _store_response(cache_key, result.parsed)
+            return result
+
+        except json.JSONDecodeError as e:
+            if attempt < max_retries:
+                continue  # Retry
+            raise GenerationError(f"Invalid JSON after {max_retries} retries: {e}") from e
+        except Exception as e:
+            raise GenerationError(f"OpenAI API error: {e}") from e
 
-            # Extract usage
-            tokens_in = completion.usage.prompt_tokens if completion.usage else 0
-            tokens_out = completion.usage.completion_tokens if completion.usage else 0
-
-            # Parse response
-            if completion.choices and completion.choices[0].message.parsed:
-                return (completion.choices[0].message.parsed, tokens_in, tokens_out)
-            else:
-                # Fall back to manual JSON parsing if structured output failed
-                content = completion.choices[0].message.content
-                if content:
-                    parsed = response_format.model_validate_json(content)
-                    return (parsed, tokens_in, tokens_out)
-                else:
-                    raise GenerationError("Empty response from OpenAI")
+    raise GenerationError(f"Failed after {max_retries} retries")
+
+
+async def _acall_openai(
+    prompt: str,
+    model: str,
+    response_format: type[SchemaT],
+    openai_client: AsyncOpenAI | None = None,
+    max_retries: int = 2,
+    use_cache: bool = True,
+) -> _OpenAIResult[SchemaT]:
+    """
+    Async variant of _call_openai, so several requests can be awaited together.
+
+    Args:
+        prompt: The prompt text
+        model: Model name
+        response_format: Pydantic model for structured output
+        openai_client: Optional AsyncOpenAI client (for testing)
+        max_retries: Maximum number of retries for invalid JSON
+        use_cache: Reuse a cached response for an identical prompt
+
+    Returns:
+        Parsed response with token usage
+
+    Raises:
+        GenerationError: If all retries fail or API error occurs
+    """
+    cache_key = _response_cache_key(prompt, model, response_format)
+    if use_cache:
+        cached = _cached_response(cache_key, response_format)
+        if cached is not None:
+            return cached
+
+    if openai_client is None:
+        openai_client = _default_async_openai_client()
+
+    for attempt in range(max_retries + 1):
+        try:
+            completion = await openai_client.beta.chat.completions.parse(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format=response_format,
+                **_completion_options(response_format, cache_key, use_cache),
+            )
+            result = _parse_completion(completion, response_format)
+            _store_response(cache_key, result.parsed)
+            return result
 
         except json.JSONDecodeError as e:
             if attempt < max_retries:
@@ -372,10 +705,151 @@ def _call_openai(
     raise GenerationError(f"Failed after {max_retries} retries")
 
 
+def _cost_usd(model: str, tokens_in: int, tokens_out: int) -> float:
+    """Calculate the cost in USD of a completion from its token usage."""
+    input_rate, output_rate = COSTS[model]
+    return tokens_in * input_rate + tokens_out * output_rate
+
+
+def _oversize_tweets(parsed: GeneratedThreadSchema) -> list[int]:
+    """Return the indices of tweets longer than TWEET_MAX_CHARS."""
+    return [idx for idx, tweet in enumerate(parsed.tweets) if len(tweet.text) > TWEET_MAX_CHARS]
+
+
+def _merge_shortened(
+    result: _OpenAIResult[GeneratedThreadSchema],
+    oversize: list[int],
+    shortened: _OpenAIResult[ShortenedTweetsSchema],
+) -> _OpenAIResult[GeneratedThreadSchema]:
+    """
+    Replace oversize tweets with their rewrites and add up the token usage.
+
+    Args:
+        result: Thread response containing oversize tweets
+        oversize: Indices of the oversize tweets
+        shortened: Response to the shorten prompt for those tweets
+
+    Returns:
+        Thread response with the rewritten tweets and combined usage. Tweets still
+        over the limit are left for the review step and length check to flag: if
+        the rewrites do not match the oversize tweets one to one, every original is
+        kept, otherwise each oversize tweet keeps the shorter of original and rewrite.
+    """
+    tweets = list(result.parsed.tweets)
+    rewrites = shortened.parsed.tweets
+    if len(rewrites) == len(oversize):
+        for idx, rewrite in zip(oversize, rewrites, strict=True):
+            if len(rewrite.text) < len(tweets[idx].text):
+                tweets[idx] = rewrite
+    return _OpenAIResult(
+        result.parsed.model_copy(update={"tweets": tweets}),
+        result.tokens_in + shortened.tokens_in,
+        result.tokens_out + shortened.tokens_out,
+        result.tokens_cached + shortened.tokens_cached,
+        result.from_cache and shortened.from_cache,
+    )
+
+
+def _shorten_oversize(
+    result: _OpenAIResult[GeneratedThreadSchema],
+    model: str,
+    openai_client: OpenAI | None,
+    use_cache: bool,
+) -> _OpenAIResult[GeneratedThreadSchema]:
+    """
+    Re-ask only for tweets over the length limit, in one small follow-up call.
+
+    Args:
+        result: Parsed thread response
+        model: Model that generated the thread
+        openai_client: Optional OpenAI client (for testing)
+        use_cache: Reuse a cached response for an identical prompt
+
+    Returns:
+        Thread response with oversize tweets rewritten (unchanged if none)
+
+    Raises:
+        GenerationError: If the follow-up call fails
+    """
+    oversize = _oversize_tweets(result.parsed)
+    if not oversize:
+        return result
+    prompt = build_shorten_prompt([result.parsed.tweets[idx].text for idx in oversize])
+    shortened = _call_openai(
+        prompt, model, ShortenedTweetsSchema, openai_client, use_cache=use_cache
+    )
+    return _merge_shortened(result, oversize, shortened)
+
+
+async def _ashorten_oversize(
+    result: _OpenAIResult[GeneratedThreadSchema],
+    model: str,
+    openai_client: AsyncOpenAI | None,
+    use_cache: bool,
+) -> _OpenAIResult[GeneratedThreadSchema]:
+    """Async variant of _shorten_oversize."""
+    oversize = _oversize_tweets(result.parsed)
+    if not oversize:
+        return result
+    prompt = build_shorten_prompt([result.parsed.tweets[idx].text for idx in oversize])
+    shortened = await _acall_openai(
+        prompt, model, ShortenedTweetsSchema, openai_client, use_cache=use_cache
+    )
+    return _merge_shortened(result, oversize, shortened)
+
+
+def _thread_result(result: _OpenAIResult[GeneratedThreadSchema], model: str) -> GeneratedThread:
+    """Convert a structured thread response to a GeneratedThread."""
+    parsed = result.parsed
+    return GeneratedThread(
+        tweets=[tweet.text for tweet in parsed.tweets],
+        style_used=parsed.style_used,
+        hook_used=parsed.hook_used,
+        tokens_in=result.tokens_in,
+        tokens_out=result.tokens_out,
+        cost_usd=_cost_usd(model, result.tokens_in, result.tokens_out),
+        model_used=model,
+        tokens_cached=result.tokens_cached,
+        cached=result.from_cache,
+    )
+
+
+def _single_result(result: _OpenAIResult[GeneratedSingleSchema], model: str) -> GeneratedSingle:
+    """Convert a structured single tweet response to a GeneratedSingle."""
+    parsed = result.parsed
+    return GeneratedSingle(
+        text=parsed.text,
+        style_used=parsed.style_used,
+        tokens_in=result.tokens_in,
+        tokens_out=result.tokens_out,
+        cost_usd=_cost_usd(model, result.tokens_in, result.tokens_out),
+        model_used=model,
+        tokens_cached=result.tokens_cached,
+        cached=result.from_cache,
+    )
+
+
+def _reference_result(
+    result: _OpenAIResult[GeneratedReferenceSchema], model: str
+) -> GeneratedReference:
+    """Convert a structured reference response to a GeneratedReference."""
+    parsed = result.parsed
+    return GeneratedReference(
+        text=parsed.text,
+        tokens_in=result.tokens_in,
+        tokens_out=result.tokens_out,
+        cost_usd=_cost_usd(model, result.tokens_in, result.tokens_out),
+        model_used=model,
+        tokens_cached=result.tokens_cached,
+        cached=result.from_cache,
+    )
+
+
 def generate_thread(
     scrape: ScrapeResult,
     settings: GenerationSettings,
     openai_client: OpenAI | None = None,
+    use_cache: bool = True,
 ) -> GeneratedThread:
     """
     Generate a Twitter thread from scraped content.
@@ -384,6 +858,7 @@ def generate_thread(
         scrape: Scraped content
         settings: Generation settings
         openai_client: Optional OpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
 
     Returns:
         Generated thread with metadata
@@ -398,32 +873,18 @@ def generate_thread(
     prompt = build_thread_prompt(scrape, settings)
 
     # Call OpenAI
-    parsed_base, tokens_in, tokens_out = _call_openai(
-        prompt, model, GeneratedThreadSchema, openai_client
-    )
+    result = _call_openai(prompt, model, GeneratedThreadSchema, openai_client, use_cache=use_cache)
 
-    # Cast to the correct type
-    parsed = GeneratedThreadSchema.model_validate(parsed_base)
-
-    # Calculate cost
-    cost_usd = (tokens_in * COSTS[model]["input"]) + (tokens_out * COSTS[model]["output"])
-
-    # Convert to output format
-    return GeneratedThread(
-        tweets=[tweet.text for tweet in parsed.tweets],
-        style_used=parsed.style_used,
-        hook_used=parsed.hook_used,
-        tokens_in=tokens_in,
-        tokens_out=tokens_out,
-        cost_usd=cost_usd,
-        model_used=model,
-    )
+    # Fix tweets over the length limit without resending the article
+    result = _shorten_oversize(result, model, openai_client, use_cache)
+    return _thread_result(result, model)
 
 
 def generate_single(
     scrape: ScrapeResult,
     settings: GenerationSettings,
     openai_client: OpenAI | None = None,
+    use_cache: bool = True,
 ) -> GeneratedSingle:
     """
     Generate a single tweet from scraped content.
@@ -432,6 +893,7 @@ def generate_single(
         scrape: Scraped content
         settings: Generation settings
         openai_client: Optional OpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
 
     Returns:
         Generated single tweet with metadata
@@ -446,29 +908,12 @@ def generate_single(
     prompt = build_single_prompt(scrape, settings)
 
     # Call OpenAI
-    parsed_base, tokens_in, tokens_out = _call_openai(
-        prompt, model, GeneratedSingleSchema, openai_client
-    )
-
-    # Cast to the correct type
-    parsed = GeneratedSingleSchema.model_validate(parsed_base)
-
-    # Calculate cost
-    cost_usd = (tokens_in * COSTS[model]["input"]) + (tokens_out * COSTS[model]["output"])
-
-    # Convert to output format
-    return GeneratedSingle(
-        text=parsed.text,
-        style_used=parsed.style_used,
-        tokens_in=tokens_in,
-        tokens_out=tokens_out,
-        cost_usd=cost_usd,
-        model_used=model,
-    )
+    result = _call_openai(prompt, model, GeneratedSingleSchema, openai_client, use_cache=use_cache)
+    return _single_result(result, model)
 
 
 def generate_reference(
-    scrape: ScrapeResult, openai_client: OpenAI | None = None
+    scrape: ScrapeResult, openai_client: OpenAI | None = None, use_cache: bool = True
 ) -> GeneratedReference:
     """
     Generate a reference tweet for the original article.
@@ -476,6 +921,7 @@ def generate_reference(
     Args:
         scrape: Scraped content
         openai_client: Optional OpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
 
     Returns:
         Generated reference tweet with metadata
@@ -490,21 +936,429 @@ def generate_reference(
     prompt = build_reference_prompt(scrape)
 
     # Call OpenAI
-    parsed_base, tokens_in, tokens_out = _call_openai(
-        prompt, model, GeneratedReferenceSchema, openai_client
+    result = _call_openai(
+        prompt, model, GeneratedReferenceSchema, openai_client, use_cache=use_cache
     )
+    return _reference_result(result, model)
 
-    # Cast to the correct type
-    parsed = GeneratedReferenceSchema.model_validate(parsed_base)
 
-    # Calculate cost
-    cost_usd = (tokens_in * COSTS[model]["input"]) + (tokens_out * COSTS[model]["output"])
+def post_texts(
+    result: GeneratedThread | GeneratedSingle, single_cap: int | None = None
+) -> list[str]:
+    """
+    Return the texts to store as a run's tweets.
 
-    # Convert to output format
-    return GeneratedReference(
-        text=parsed.text,
-        tokens_in=tokens_in,
-        tokens_out=tokens_out,
-        cost_usd=cost_usd,
-        model_used=model,
+    Args:
+        result: Generated thread or single post
+        single_cap: Maximum characters of a single post (None for no cap)
+
+    Returns:
+        The thread's tweets, or the single post as one tweet cut to single_cap
+    """
+    if isinstance(result, GeneratedSingle):
+        if single_cap is None:
+            return [result.text]
+        return [result.text[:single_cap].rstrip()]
+    return list(result.tweets)
+
+
+async def agenerate_thread(
+    scrape: ScrapeResult,
+    settings: GenerationSettings,
+    openai_client: AsyncOpenAI | None = None,
+    use_cache: bool = True,
+) -> GeneratedThread:
+    """
+    Generate a Twitter thread without blocking the event loop.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+        openai_client: Optional AsyncOpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Returns:
+        Generated thread with metadata
+
+    Raises:
+        GenerationError: If generation fails
+    """
+    model = choose_model(scrape.word_count)
+    prompt = build_thread_prompt(scrape, settings)
+    result = await _acall_openai(
+        prompt, model, GeneratedThreadSchema, openai_client, use_cache=use_cache
+    )
+    result = await _ashorten_oversize(result, model, openai_client, use_cache)
+    return _thread_result(result, model)
+
+
+async def agenerate_single(
+    scrape: ScrapeResult,
+    settings: GenerationSettings,
+    openai_client: AsyncOpenAI | None = None,
+    use_cache: bool = True,
+) -> GeneratedSingle:
+    """
+    Generate a single tweet without blocking the event loop.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+        openai_client: Optional AsyncOpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Returns:
+        Generated single tweet with metadata
+
+    Raises:
+        GenerationError: If generation fails
+    """
+    model = choose_model(scrape.word_count)
+    prompt = build_single_prompt(scrape, settings)
+    result = await _acall_openai(
+        prompt, model, GeneratedSingleSchema, openai_client, use_cache=use_cache
+    )
+    return _single_result(result, model)
+
+
+async def agenerate_reference(
+    scrape: ScrapeResult, openai_client: AsyncOpenAI | None = None, use_cache: bool = True
+) -> GeneratedReference:
+    """
+    Generate a reference tweet without blocking the event loop.
+
+    Args:
+        scrape: Scraped content
+        openai_client: Optional AsyncOpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Returns:
+        Generated reference tweet with metadata
+
+    Raises:
+        GenerationError: If generation fails
+    """
+    model = "gpt-4o-mini"
+    prompt = build_reference_prompt(scrape)
+    result = await _acall_openai(
+        prompt, model, GeneratedReferenceSchema, openai_client, use_cache=use_cache
     )
+    return _reference_result(result, model)
+
+
+async def agenerate_thread_with_reference(
+    scrape: ScrapeResult,
+    settings: GenerationSettings,
+    openai_client: AsyncOpenAI | None = None,
+    use_cache: bool = True,
+) -> tuple[GeneratedThread, GeneratedReference]:
+    """
+    Generate a thread and its reference tweet concurrently.
+
+    Both requests are in flight at once, so the total latency is that of the
+    slower call rather than the sum of both.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+        openai_client: Optional AsyncOpenAI client (for testing)
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Returns:
+        Tuple of (generated thread, generated reference tweet)
+
+    Raises:
+        GenerationError: If either generation fails
+    """
+    if openai_client is None:
+        openai_client = _default_async_openai_client()
+
+    return await asyncio.gather(
+        agenerate_thread(scrape, settings, openai_client, use_cache),
+        agenerate_reference(scrape, openai_client, use_cache),
+    )
+
+
+async def astream_thread(
+    scrape: ScrapeResult,
+    settings: GenerationSettings,
+    openai_client: AsyncOpenAI | None = None,
+    on_done: Callable[[GeneratedThread], Any] | None = None,
+    use_cache: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Generate a Twitter thread, yielding each tweet as soon as it is complete.
+
+    The structured output is streamed and parsed incrementally, so an interactive
+    caller sees the first tweet while the rest are still being generated. Oversize
+    tweets are not shortened here, since they have already been handed out.
+
+    Args:
+        scrape: Scraped content
+        settings: Generation settings
+        openai_client: Optional AsyncOpenAI client (for testing)
+        on_done: Optional callback receiving the full result with token usage
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Yields:
+        Tweet texts in thread order
+
+    Raises:
+        GenerationError: If generation fails
+    """
+    model = choose_model(scrape.word_count)
+    prompt = build_thread_prompt(scrape, settings)
+    cache_key = _response_cache_key(prompt, model, GeneratedThreadSchema)
+
+    result = _cached_response(cache_key, GeneratedThreadSchema) if use_cache else None
+    emitted = 0
+    if result is None:
+        if openai_client is None:
+            openai_client = _default_async_openai_client()
+        try:
+            async with openai_client.beta.chat.completions.stream(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                response_format=GeneratedThreadSchema,
+                stream_options={"include_usage": True},
+                **_completion_options(GeneratedThreadSchema, cache_key, use_cache),
+            ) as stream:
+                async for event in stream:
+                    if event.type != "content.delta" or not isinstance(event.parsed, dict):
+                        continue
+                    # Every tweet except the last one in the partial parse is final
+                    partial_tweets = event.parsed.get("tweets") or []
+                    while emitted < len(partial_tweets) - 1:
+                        yield partial_tweets[emitted].get("text", "")
+                        emitted += 1
+                completion = await stream.get_final_completion()
+            result = _parse_completion(completion, GeneratedThreadSchema)
+        except GenerationError:
+            raise
+        except Exception as e:
+            raise GenerationError(f"OpenAI API error: {e}") from e
+        _store_response(cache_key, result.parsed)
+
+    for tweet in result.parsed.tweets[emitted:]:
+        yield tweet.text
+
+    if on_done is not None:
+        on_done(_thread_result(result, model))
+
+
+# Batch API (non-interactive bulk generation at BATCH_DISCOUNT)
+
+_BATCH_TERMINAL_FAILURES = ("failed", "expired", "cancelled")
+
+
+def _strict_json_schema(schema: Any) -> Any:
+    """
+    Make a pydantic JSON schema acceptable to OpenAI strict structured output.
+
+    Every object forbids additional properties and lists all of its properties as
+    required; optional fields stay nullable through their anyOf, and None defaults
+    are dropped, as beta.chat.completions.parse does.
+
+    Args:
+        schema: JSON schema (or any part of one)
+
+    Returns:
+        Strict copy of the schema
+    """
+    if isinstance(schema, list):
+        return [_strict_json_schema(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+
+    strict = {
+        key: _strict_json_schema(value)
+        for key, value in schema.items()
+        if not (key == "default" and value is None)
+    }
+    if strict.get("type") == "object":
+        strict["additionalProperties"] = False
+        strict["required"] = list(strict.get("properties", {}))
+    return strict
+
+
+def _strict_response_format(response_format: type[BaseModel]) -> dict[str, Any]:
+    """Build the strict json_schema response_format for a response model."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_format.__name__,
+            "strict": True,
+            "schema": _strict_json_schema(response_format.model_json_schema()),
+        },
+    }
+
+
+# Batch requests are plain JSON, so send the strict schema beta.chat.completions.parse
+# would derive from the response model
+_THREAD_BATCH_RESPONSE_FORMAT = _strict_response_format(GeneratedThreadSchema)
+
+
+def submit_thread_batch(
+    scrapes: list[ScrapeResult],
+    settings: GenerationSettings,
+    openai_client: OpenAI | None = None,
+) -> list[str]:
+    """
+    Submit thread generation for many articles as OpenAI Batch API jobs.
+
+    A batch may only target one model, so articles are grouped by the model
+    choose_model picks for them, giving one batch per model used.
+
+    Args:
+        scrapes: Scraped articles to generate threads for
+        settings: Generation settings applied to every article
+        openai_client: Optional OpenAI client (for testing)
+
+    Returns:
+        Batch IDs to pass to wait_for_batches and retrieve_thread_batch
+
+    Raises:
+        GenerationError: If uploading or creating a batch fails
+    """
+    if openai_client is None:
+        openai_client = _default_openai_client()
+
+    lines_by_model: dict[str, list[str]] = {}
+    for idx, scrape in enumerate(scrapes):
+        model = choose_model(scrape.word_count)
+        request = {
+            "custom_id": f"{idx}:{model}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [{"role": "user", "content": build_thread_prompt(scrape, settings)}],
+                "response_format": _THREAD_BATCH_RESPONSE_FORMAT,
+                "max_tokens": MAX_OUTPUT_TOKENS[GeneratedThreadSchema],
+                "temperature": GENERATION_TEMPERATURE,
+            },
+        }
+        lines_by_model.setdefault(model, []).append(json.dumps(request))
+
+    batch_ids = []
+    try:
+        for model, lines in lines_by_model.items():
+            input_file = openai_client.files.create(
+                file=(f"threads-{model}.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = openai_client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            batch_ids.append(batch.id)
+    except Exception as e:
+        raise GenerationError(f"OpenAI batch submission failed: {e}") from e
+
+    return batch_ids
+
+
+def wait_for_batches(
+    batch_ids: list[str],
+    openai_client: OpenAI | None = None,
+    poll_interval: float = 60.0,
+    sleeper: Callable[[float], Any] | None = None,
+) -> None:
+    """
+    Block until every batch has completed.
+
+    Args:
+        batch_ids: Batch IDs returned by submit_thread_batch
+        openai_client: Optional OpenAI client (for testing)
+        poll_interval: Seconds between status checks
+        sleeper: Optional sleep function (for testing/injection)
+
+    Raises:
+        GenerationError: If a batch fails, expires or is cancelled
+    """
+    if openai_client is None:
+        openai_client = _default_openai_client()
+    if sleeper is None:
+        sleeper = time.sleep
+
+    pending = list(batch_ids)
+    while pending:
+        for batch_id in list(pending):
+            batch = openai_client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                pending.remove(batch_id)
+            elif batch.status in _BATCH_TERMINAL_FAILURES:
+                raise GenerationError(f"OpenAI batch {batch_id} {batch.status}")
+        if pending:
+            sleeper(poll_interval)
+
+
+def retrieve_thread_batch(
+    batch_ids: list[str], openai_client: OpenAI | None = None
+) -> ThreadBatchResult:
+    """
+    Collect the generated threads of completed batches.
+
+    Args:
+        batch_ids: Batch IDs returned by submit_thread_batch
+        openai_client: Optional OpenAI client (for testing)
+
+    Returns:
+        Generated threads keyed by the index of their article in the submitted list,
+        and the indices whose request failed or returned malformed output
+
+    Raises:
+        GenerationError: If a batch is not completed yet
+    """
+    if openai_client is None:
+        openai_client = _default_openai_client()
+
+    threads: dict[int, GeneratedThread] = {}
+    failed: dict[int, str] = {}
+    for batch_id in batch_ids:
+        batch = openai_client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            raise GenerationError(f"OpenAI batch {batch_id} is {batch.status}")
+
+        # Successful requests land in the output file, failed ones in the error file
+        lines: list[str] = []
+        for file_id in (batch.output_file_id, getattr(batch, "error_file_id", None)):
+            if file_id:
+                lines.extend(openai_client.files.content(file_id).text.splitlines())
+
+        for line in lines:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            idx_text, model = record["custom_id"].split(":", 1)
+            idx = int(idx_text)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                error = record.get("error") or {}
+                failed[idx] = error.get("message") or f"HTTP {response.get('status_code')}"
+                continue
+
+            body = response["body"]
+            content = body["choices"][0]["message"].get("content")
+            if not content:
+                failed[idx] = "Empty response"
+                continue
+            try:
+                parsed = GeneratedThreadSchema.model_validate_json(content)
+            except ValueError as e:
+                failed[idx] = f"Malformed output: {e}"
+                continue
+
+            usage = body.get("usage") or {}
+            details = usage.get("prompt_tokens_details") or {}
+            result = _OpenAIResult(
+                parsed,
+                usage.get("prompt_tokens", 0),
+                usage.get("completion_tokens", 0),
+                details.get("cached_tokens") or 0,
+            )
+            thread = _thread_result(result, model)
+            threads[idx] = replace(thread, cost_usd=thread.cost_usd * BATCH_DISCOUNT)
+
+    return ThreadBatchResult(threads=threads, failed=failed)
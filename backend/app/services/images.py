@@ -1,11 +1,26 @@
 """Hero image selection and processing for tweets."""
 
+import asyncio
 import io
+import multiprocessing
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 
 import httpx
-from PIL import Image
+from PIL import Image, ImageFile
+
+from app.config import get_settings
+
+try:
+    import pyvips
+except (ImportError, OSError):  # Optional "speedups" extra; OSError if libvips is missing
+    pyvips = None
+
+
+# Hard cap on downloaded image size, to bound memory on hostile candidates
+_MAX_IMAGE_BYTES = 8 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 16 * 1024
 
 
 class ImageError(Exception):
@@ -80,20 +95,143 @@ def validate_and_process(
     Raises:
         ImageError: If image is too small, invalid, or processing fails
     """
-    # Fetch image
-    if http_get is None:
-        http_get = _default_http_get
+    image_bytes = _fetch_image(image_url, http_get, min_width)
+    return _process_image(image_bytes, min_width, max_width, jpeg_quality)
+
+
+async def avalidate_and_process(
+    image_url: str,
+    min_width: int = 800,
+    max_width: int = 1600,
+    jpeg_quality: int = 85,
+) -> ProcessedImage:
+    """
+    Validate and process a hero image without blocking the event loop.
+
+    The download runs in a worker thread and the decode/resize/encode step in a
+    process pool, so several images can be prepared in parallel with asyncio.gather.
+
+    Args:
+        image_url: URL of the image to process
+        min_width: Minimum acceptable width in pixels
+        max_width: Maximum width before downscaling
+        jpeg_quality: JPEG quality (1-100)
+
+    Returns:
+        ProcessedImage with processed image data and dimensions
+
+    Raises:
+        ImageError: If image is too small, invalid, or processing fails
+    """
+    image_bytes = await asyncio.to_thread(_fetch_image, image_url, None, min_width)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_process_pool(), _process_image, image_bytes, min_width, max_width, jpeg_quality
+    )
+
+
+# Process pool for CPU-bound image work (created on first use)
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the shared image processing pool, creating it on first use.
+
+    Each server worker process gets its own pool, so it is sized by the
+    IMAGE_PROCESS_WORKERS setting rather than the CPU count.
+    """
+    global _process_pool
+    if _process_pool is None:
+        # spawn, not fork: the server process runs threads (and libvips) that a
+        # forked child would inherit in an undefined state
+        _process_pool = ProcessPoolExecutor(
+            max_workers=get_settings().image_process_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _process_pool
+
+
+def shutdown_process_pool() -> None:
+    """Shut down the image processing pool, if started (call on application shutdown)."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
 
+def _fetch_image(
+    image_url: str, http_get: Callable[[str], httpx.Response] | None, min_width: int
+) -> bytes:
+    """
+    Download image bytes.
+
+    Args:
+        image_url: URL of the image to download
+        http_get: Optional HTTP client function; streams over the pooled client if None
+        min_width: Minimum acceptable width in pixels
+
+    Returns:
+        Raw image bytes
+
+    Raises:
+        ImageError: If the download fails or the image is rejected early
+    """
     try:
+        if http_get is None:
+            return _download_image(image_url, min_width)
         response = http_get(image_url)
         if response.status_code >= 400:
             raise ImageError(f"HTTP {response.status_code} error")
-        image_bytes = response.content
+        content: bytes = response.content
+        return content
     except ImageError:
         raise
     except Exception as e:
         raise ImageError(f"Failed to fetch image: {e}") from e
 
+
+def _process_image(
+    image_bytes: bytes, min_width: int, max_width: int, jpeg_quality: int
+) -> ProcessedImage:
+    """
+    Validate, resize and re-encode downloaded image bytes (CPU-bound, picklable).
+
+    Args:
+        image_bytes: Downloaded image data
+        min_width: Minimum acceptable width in pixels
+        max_width: Maximum width before downscaling
+        jpeg_quality: JPEG quality (1-100)
+
+    Returns:
+        ProcessedImage with processed image data and dimensions
+
+    Raises:
+        ImageError: If image is too small, invalid, or processing fails
+    """
+    if pyvips is not None:
+        return _process_with_vips(image_bytes, min_width, max_width, jpeg_quality)
+    return _process_with_pillow(image_bytes, min_width, max_width, jpeg_quality)
+
+
+def _process_with_pillow(
+    image_bytes: bytes, min_width: int, max_width: int, jpeg_quality: int
+) -> ProcessedImage:
+    """
+    Validate and process an image with Pillow.
+
+    Args:
+        image_bytes: Downloaded image data
+        min_width: Minimum acceptable width in pixels
+        max_width: Maximum width before downscaling
+        jpeg_quality: JPEG quality (1-100)
+
+    Returns:
+        ProcessedImage with processed image data and dimensions
+
+    Raises:
+        ImageError: If image is too small, invalid, or processing fails
+    """
     try:
         # Open image
         image = Image.open(io.BytesIO(image_bytes))
@@ -102,6 +240,14 @@ def validate_and_process(
         if image.width < min_width:
             raise ImageError(f"Image too small: {image.width}px wide (minimum {min_width}px)")
 
+        # Target size, computed from the original dimensions
+        target_size = None
+        if image.width > max_width:
+            target_size = (max_width, int((max_width / image.width) * image.height))
+            # Let the JPEG decoder shrink by 2/4/8 while decoding (no-op for other
+            # formats), so the full-size bitmap is never allocated
+            image.draft(None, target_size)
+
         # Convert to RGB if necessary (for JPEG compatibility)
         if image.mode in ("RGBA", "P", "LA"):
             # Create white background for transparent images
@@ -113,12 +259,9 @@ def validate_and_process(
         elif image.mode != "RGB":
             image = image.convert("RGB")  # type: ignore[assignment]
 
-        # Downscale if too large
-        if image.width > max_width:
-            # Calculate new height maintaining aspect ratio
-            new_width = max_width
-            new_height = int((max_width / image.width) * image.height)
-            image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)  # type: ignore[assignment]
+        # Downscale if too large (only the residual after any draft reduction)
+        if target_size is not None and image.size != target_size:
+            image = image.resize(target_size, Image.Resampling.LANCZOS)  # type: ignore[assignment]
 
         # Strip EXIF by not copying it
         # (When we save to a new BytesIO, EXIF is not included by default)
@@ -147,6 +290,60 @@ def validate_and_process(
         raise ImageError(f"Failed to process image: {e}") from e
 
 
+def _process_with_vips(
+    image_bytes: bytes, min_width: int, max_width: int, jpeg_quality: int
+) -> ProcessedImage:
+    """
+    Validate and process an image with libvips.
+
+    Same output contract as the Pillow path, but the width check only reads the
+    header, JPEGs are shrunk while decoding, and flatten, resize and encode run
+    as one streaming SIMD pipeline instead of full-size intermediate copies.
+
+    Args:
+        image_bytes: Downloaded image data
+        min_width: Minimum acceptable width in pixels
+        max_width: Maximum width before downscaling
+        jpeg_quality: JPEG quality (1-100)
+
+    Returns:
+        ProcessedImage with processed image data and dimensions
+
+    Raises:
+        ImageError: If image is too small, invalid, or processing fails
+    """
+    try:
+        # Header only; pixels are not decoded yet
+        image = pyvips.Image.new_from_buffer(image_bytes, "", access="sequential")
+
+        # Validate minimum width
+        if image.width < min_width:
+            raise ImageError(f"Image too small: {image.width}px wide (minimum {min_width}px)")
+
+        # Downscale if too large, to the same dimensions as the Pillow path
+        if image.width > max_width:
+            new_height = int((max_width / image.width) * image.height)
+            image = pyvips.Image.thumbnail_buffer(
+                image_bytes, max_width, height=new_height, size="force", no_rotate=True
+            )
+
+        # Composite transparent images onto white, then normalise to 8-bit sRGB
+        if image.hasalpha():
+            image = image.flatten(background=[255, 255, 255])
+        if image.interpretation != "srgb" or image.bands != 3:
+            image = image.colourspace("srgb")
+
+        # Re-encode as JPEG without any metadata
+        data = image.jpegsave_buffer(Q=jpeg_quality, optimize_coding=True, keep="none")
+
+        return ProcessedImage(data=data, width=image.width, height=image.height, format="JPEG")
+
+    except ImageError:
+        raise
+    except Exception as e:
+        raise ImageError(f"Failed to process image: {e}") from e
+
+
 def alt_text_from(title: str, lede: str | None = None, max_length: int = 120) -> str:
     """
     Generate alt text for an image from article title and lede.
@@ -159,12 +356,55 @@ def alt_text_from(title: str, lede: str | None = None, max_length: int = 120) ->
     Returns:
         Alt text string, truncated to max_length
     """
+    return _fit_alt_text(title.strip(), lede.strip() if lede else "", max_length)
+
+
+def alt_text_batch(
+    titles: list[str], ledes: list[str | None] | None = None, max_length: int = 120
+) -> list[str]:
+    """
+    Generate alt texts for many articles at once (bulk runs).
+
+    Same result as calling alt_text_from per article, but every string is
+    stripped once up front instead of inside the per-article branches.
+
+    Args:
+        titles: Article titles
+        ledes: Optional ledes, one per title (None entries allowed)
+        max_length: Maximum length of each alt text (default 120 chars)
+
+    Returns:
+        Alt text strings in the order of titles
+
+    Raises:
+        ValueError: If ledes is given with a different length than titles
+    """
+    if ledes is None:
+        ledes = [None] * len(titles)
+    stripped = [
+        (title.strip(), lede.strip() if lede else "")
+        for title, lede in zip(titles, ledes, strict=True)
+    ]
+    return [_fit_alt_text(title, lede, max_length) for title, lede in stripped]
+
+
+def _fit_alt_text(title: str, lede: str, max_length: int) -> str:
+    """
+    Combine an already stripped title and lede into alt text of at most max_length.
+
+    Args:
+        title: Stripped article title
+        lede: Stripped article lede, or "" if there is none
+        max_length: Maximum length of alt text
+
+    Returns:
+        Alt text string
+    """
     # Start with title
-    alt = title.strip()
+    alt = title
 
     # Add lede if provided and there's room
-    if lede and lede.strip():
-        lede = lede.strip()
+    if lede:
         # Add separator if we have both title and lede
         combined = f"{alt}: {lede}"
         if len(combined) <= max_length:
@@ -182,16 +422,62 @@ def alt_text_from(title: str, lede: str | None = None, max_length: int = 120) ->
     return alt
 
 
-def _default_http_get(url: str) -> httpx.Response:
+# Process-wide pooled client for image downloads (created on first use)
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the shared HTTP client for image downloads, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _shared_client
+
+
+def _download_image(image_url: str, min_width: int) -> bytes:
     """
-    Default HTTP GET function using httpx.
+    Stream an image over the pooled client, stopping as soon as it is rejected.
+
+    The header is parsed from the first chunks, so images narrower than
+    min_width are rejected after a few KB instead of a full download.
 
     Args:
-        url: URL to fetch
+        image_url: URL of the image to download
+        min_width: Minimum acceptable width in pixels
 
     Returns:
-        httpx.Response object
+        Raw image bytes
+
+    Raises:
+        ImageError: On HTTP errors, images that are too small, or over _MAX_IMAGE_BYTES
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-    with httpx.Client(timeout=30.0, follow_redirects=True, headers=headers) as client:
-        return client.get(url)
+    with _get_shared_client().stream("GET", image_url) as response:
+        if response.status_code >= 400:
+            raise ImageError(f"HTTP {response.status_code} error")
+
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) > _MAX_IMAGE_BYTES:
+            raise ImageError(f"Image too large: {content_length} bytes")
+
+        buffer = bytearray()
+        parser: ImageFile.Parser | None = ImageFile.Parser()
+        for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > _MAX_IMAGE_BYTES:
+                raise ImageError(f"Image too large: over {_MAX_IMAGE_BYTES} bytes")
+
+            if parser is not None:
+                parser.feed(chunk)
+                if parser.image is not None:
+                    width = parser.image.width
+                    if width < min_width:
+                        raise ImageError(f"Image too small: {width}px wide (minimum {min_width}px)")
+                    # Header checked; the rest only needs buffering, not decoding
+                    parser = None
+
+    return bytes(buffer)
@@ -1,9 +1,11 @@
 """X/Twitter posting service."""
 
 import asyncio
+import inspect
 import random
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
 from typing import Any
 
@@ -22,6 +24,11 @@ class RateLimitError(PostError):
     pass
 
 
+# Decorrelated-jitter backoff bounds for retries (seconds)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+
 @dataclass
 class PostResult:
     """Result of posting a single tweet."""
@@ -138,6 +145,113 @@ def post_single(
     raise PostError("Failed to post tweet after retries")
 
 
+async def apost_single(
+    account_token: str,
+    text: str,
+    media: bytes | None = None,
+    media_alt: str | None = None,
+    reply_to_tweet_id: str | None = None,
+    http_post: Callable[..., Any] | None = None,
+    sleeper: Callable[[float], Awaitable[Any]] | None = None,
+    max_retries: int = 3,
+) -> PostResult:
+    """
+    Post a single tweet to X/Twitter without blocking the event loop.
+
+    Same behaviour as post_single, but the HTTP call and retry backoff are awaited.
+
+    Args:
+        account_token: OAuth access token for the account
+        text: Tweet text content
+        media: Optional media bytes to attach
+        media_alt: Optional alt text for media
+        reply_to_tweet_id: Optional tweet ID to reply to
+        http_post: Optional HTTP POST function, sync or async (for testing/injection)
+        sleeper: Optional async sleep function used for retry backoff
+        max_retries: Maximum number of retry attempts
+
+    Returns:
+        PostResult with success status and tweet ID
+
+    Raises:
+        PostError: If posting fails after retries
+        RateLimitError: If rate limit is exceeded
+    """
+    if sleeper is None:
+        sleeper = asyncio.sleep
+
+    async with AsyncExitStack() as stack:
+        if http_post is None:
+            client = await stack.enter_async_context(httpx.AsyncClient(timeout=30.0))
+            http_post = _async_http_post_for(client)
+
+        # Prepare request payload
+        payload: dict[str, Any] = {"text": text}
+
+        # Add reply if specified
+        if reply_to_tweet_id:
+            payload["reply"] = {"in_reply_to_tweet_id": reply_to_tweet_id}
+
+        # Handle media upload if provided
+        if media:
+            media_id = await _aupload_media(account_token, media, media_alt, http_post)
+            payload["media"] = {"media_ids": [media_id]}
+
+        # Post tweet with retries
+        delay = _BACKOFF_BASE
+        for attempt in range(max_retries):
+            try:
+                response = await _resolve(
+                    http_post(
+                        "https://api.twitter.com/2/tweets",
+                        json=payload,
+                        headers={
+                            "Authorization": f"Bearer {account_token}",
+                            "Content-Type": "application/json",
+                        },
+                    )
+                )
+
+                # Check for rate limit
+                if response.status_code == 429:
+                    reset_time = response.headers.get("x-rate-limit-reset")
+                    if attempt < max_retries - 1:
+                        # Wait until the window resets, but never longer than plain backoff
+                        delay = _backoff_delay(attempt, delay, reset_time)
+                        await sleeper(delay)
+                        continue
+                    raise RateLimitError(
+                        f"Rate limit exceeded. Reset at: {reset_time if reset_time else 'unknown'}"
+                    )
+
+                # Check for other errors
+                if response.status_code >= 400:
+                    error_msg = (
+                        response.json().get("errors", [{}])[0].get("message", "Unknown error")
+                    )
+                    if attempt < max_retries - 1:
+                        # Retry with jittered backoff
+                        delay = _backoff_delay(attempt, delay)
+                        await sleeper(delay)
+                        continue
+                    raise PostError(f"Failed to post tweet: {error_msg}")
+
+                # Success
+                tweet_id = response.json().get("data", {}).get("id")
+                return PostResult(success=True, tweet_id=tweet_id, text=text)
+
+            except RateLimitError:
+                raise
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    delay = _backoff_delay(attempt, delay)
+                    await sleeper(delay)
+                    continue
+                raise PostError(f"Failed to post tweet: {e}") from e
+
+    raise PostError("Failed to post tweet after retries")
+
+
 async def post_thread(
     account_token: str,
     texts: list[str],
@@ -148,12 +262,14 @@ async def post_thread(
     http_post: Callable[..., Any] | None = None,
     sleeper: Callable[[float], Any] | None = None,
     max_retries: int = 3,
+    rate_limit_delay: float = 3.0,
 ) -> ThreadPostResult:
     """
     Post a thread of tweets to X/Twitter.
 
-    Tweets are posted sequentially with a paced delay (~3s with jitter).
-    Each tweet replies to the previous one to form a thread.
+    Tweets are posted sequentially with a paced delay (~3s with jitter by default).
+    Each tweet replies to the previous one to form a thread. All tweets go
+    through one pooled AsyncClient, so only the first pays for the TLS handshake.
 
     Args:
         account_token: OAuth access token for the account
@@ -162,9 +278,10 @@ async def post_thread(
         media_alt: Optional alt text for media
         resume_from: Index to resume from (for retry logic)
         previous_tweet_ids: Tweet IDs from previous attempts
-        http_post: Optional HTTP POST function (for testing/injection)
+        http_post: Optional HTTP POST function, sync or async (for testing/injection)
         sleeper: Optional async sleep function (for testing/injection)
         max_retries: Maximum number of retry attempts per tweet
+        rate_limit_delay: Seconds between tweets (±1/6 jitter); 0 disables pacing
 
     Returns:
         ThreadPostResult with success status and tweet IDs
@@ -173,58 +290,62 @@ async def post_thread(
         Reference tweets should be posted separately as replies,
         not counted in the thread numbering.
     """
-    if http_post is None:
-        http_post = _default_http_post
-
     if sleeper is None:
         sleeper = asyncio.sleep
 
     tweet_ids = list(previous_tweet_ids) if previous_tweet_ids else []
     last_tweet_id: str | None = tweet_ids[-1] if tweet_ids else None
 
-    for idx in range(resume_from, len(texts)):
-        text = texts[idx]
+    async with AsyncExitStack() as stack:
+        if http_post is None:
+            # One keep-alive connection for the whole thread
+            client = await stack.enter_async_context(httpx.AsyncClient(timeout=30.0))
+            http_post = _async_http_post_for(client)
+
+        for idx in range(resume_from, len(texts)):
+            text = texts[idx]
+
+            # Attach media only to first tweet
+            media = media_first if idx == 0 and media_first else None
+            alt = media_alt if idx == 0 and media_alt else None
+
+            # Add delay between tweets (except before first tweet)
+            if idx > resume_from and rate_limit_delay > 0:
+                # 3s with ±0.5s jitter by default
+                jitter = rate_limit_delay / 6
+                await sleeper(rate_limit_delay + random.uniform(-jitter, jitter))
+
+            try:
+                result = await apost_single(
+                    account_token,
+                    text,
+                    media=media,
+                    media_alt=alt,
+                    reply_to_tweet_id=last_tweet_id,
+                    http_post=http_post,
+                    sleeper=sleeper,
+                    max_retries=max_retries,
+                )
 
-        # Attach media only to first tweet
-        media = media_first if idx == 0 and media_first else None
-        alt = media_alt if idx == 0 and media_alt else None
+                if not result.success or not result.tweet_id:
+                    return ThreadPostResult(
+                        success=False,
+                        tweet_ids=tweet_ids,
+                        failed_at=idx,
+                        error=result.error or "Unknown error",
+                    )
 
-        # Add delay between tweets (except before first tweet)
-        if idx > resume_from:
-            # 3s with ±0.5s jitter
-            delay = 3.0 + random.uniform(-0.5, 0.5)
-            await sleeper(delay)
+                tweet_ids.append(result.tweet_id)
+                last_tweet_id = result.tweet_id
 
-        try:
-            result = post_single(
-                account_token,
-                text,
-                media=media,
-                media_alt=alt,
-                reply_to_tweet_id=last_tweet_id,
-                http_post=http_post,
-                max_retries=max_retries,
-            )
-
-            if not result.success or not result.tweet_id:
+            except (PostError, RateLimitError) as e:
                 return ThreadPostResult(
                     success=False,
                     tweet_ids=tweet_ids,
                     failed_at=idx,
-                    error=result.error or "Unknown error",
+                    error=str(e),
                 )
 
-            tweet_ids.append(result.tweet_id)
-            last_tweet_id = result.tweet_id
-
-        except (PostError, RateLimitError) as e:
-            return ThreadPostResult(
-                success=False,
-                tweet_ids=tweet_ids,
-                failed_at=idx,
-                error=str(e),
-            )
-
     return ThreadPostResult(success=True, tweet_ids=tweet_ids)
 
 
@@ -277,9 +398,126 @@ def _upload_media(
     return media_id
 
 
+async def _aupload_media(
+    account_token: str,
+    media_bytes: bytes,
+    alt_text: str | None,
+    http_post: Callable[..., Any],
+) -> str:
+    """
+    Upload media to X/Twitter and return media ID, awaiting async HTTP functions.
+
+    Args:
+        account_token: OAuth access token
+        media_bytes: Media file bytes
+        alt_text: Optional alt text for accessibility
+        http_post: HTTP POST function, sync or async
+
+    Returns:
+        Media ID string
+
+    Raises:
+        PostError: If upload fails
+    """
+    response = await _resolve(
+        http_post(
+            "https://upload.twitter.com/1.1/media/upload.json",
+            data={"media": media_bytes},
+            headers={"Authorization": f"Bearer {account_token}"},
+        )
+    )
+
+    if response.status_code >= 400:
+        raise PostError("Failed to upload media")
+
+    media_data = response.json()
+    media_id: str = media_data.get("media_id_string", "")
+
+    # Add alt text if provided
+    if alt_text and media_id:
+        await _resolve(
+            http_post(
+                "https://upload.twitter.com/1.1/media/metadata/create.json",
+                json={"media_id": media_id, "alt_text": {"text": alt_text}},
+                headers={
+                    "Authorization": f"Bearer {account_token}",
+                    "Content-Type": "application/json",
+                },
+            )
+        )
+
+    return media_id
+
+
+def _backoff_delay(attempt: int, previous: float, reset_header: str | None = None) -> float:
+    """
+    Compute how long to wait before the next retry.
+
+    When X sends an x-rate-limit-reset epoch, wait until then, capped at the
+    exponential backoff for this attempt. Otherwise use decorrelated jitter, so
+    concurrent posters do not retry in lockstep.
+
+    Args:
+        attempt: Zero-based attempt that just failed
+        previous: Delay used before the previous retry (or the base delay)
+        reset_header: Value of the x-rate-limit-reset header, if any
+
+    Returns:
+        Delay in seconds
+    """
+    if reset_header:
+        try:
+            reset_at = float(reset_header)
+        except ValueError:
+            pass
+        else:
+            return min(max(0.0, reset_at - time.time()), 2.0**attempt + random.uniform(0, 1))
+    return min(_BACKOFF_CAP, random.uniform(_BACKOFF_BASE, previous * 3))
+
+
+async def _resolve(response: Any) -> Any:
+    """Await the result of an injected HTTP function if it is async."""
+    if inspect.isawaitable(response):
+        return await response
+    return response
+
+
+def _async_http_post_for(client: httpx.AsyncClient) -> Callable[..., Awaitable[Any]]:
+    """
+    Build an async HTTP POST function bound to a shared AsyncClient.
+
+    Args:
+        client: AsyncClient whose connection pool is reused across calls
+
+    Returns:
+        Async POST function that returns the response without raising on HTTP
+        errors, so callers can inspect 429s and other status codes themselves
+    """
+
+    async def _post(url: str, **kwargs: Any) -> Any:
+        return await client.post(url, **kwargs)
+
+    return _post
+
+
+# Process-wide pooled client for synchronous posting (created on first use)
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the shared HTTP client for posting, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _shared_client
+
+
 def _default_http_post(url: str, **kwargs: Any) -> Any:
     """
-    Default HTTP POST function using httpx.
+    Default HTTP POST function using httpx, over a pooled connection.
 
     Args:
         url: URL to POST to
@@ -288,7 +526,6 @@ def _default_http_post(url: str, **kwargs: Any) -> Any:
     Returns:
         httpx Response object
     """
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(url, **kwargs)
-        response.raise_for_status()
-        return response
+    response = _get_shared_client().post(url, **kwargs)
+    response.raise_for_status()
+    return response
@@ -1,12 +1,22 @@
 """Web content scraping with trafilatura and readability-lxml fallback."""
 
+import re
 from collections.abc import Callable
 from dataclasses import dataclass
 
 import httpx
+import lxml.html
 import trafilatura
+from lxml import etree
 from readability import Document
 
+# Runs of whitespace collapsed to a single space in extracted text
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Hard cap on downloaded page size; anything past it is dropped, not parsed
+_MAX_HTML_BYTES = 5 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class ScraperError(Exception):
     """Raised when content scraping fails."""
@@ -72,8 +82,11 @@ def scrape(
     if not html or not html.strip():
         raise ScraperError("Empty HTML content")
 
-    # Extract metadata first (works on original HTML)
-    metadata = _extract_metadata(html)
+    # Parse once: metadata and the <title> tag come from the head, and trafilatura
+    # extracts from the same tree instead of parsing the page again
+    tree = _parse_html(html)
+    metadata, hero_candidates = _extract_metadata(tree)
+    page_title = _extract_title(tree, metadata)
 
     # Try trafilatura first
     title = None
@@ -81,7 +94,7 @@ def scrape(
 
     try:
         extracted = trafilatura.extract(
-            html,
+            tree if tree is not None else html,
             include_comments=False,
             include_tables=False,
             no_fallback=False,
@@ -89,8 +102,8 @@ def scrape(
         )
 
         if extracted:
-            # Trafilatura doesn't return title separately, extract it
-            title = _extract_title(html, metadata)
+            # Trafilatura doesn't return title separately, use the page title
+            title = page_title
             text = extracted.strip()
 
             # Check if we got enough content
@@ -100,7 +113,9 @@ def scrape(
                 return _build_result(
                     title=title,
                     text=text,
+                    word_count=word_count,
                     metadata=metadata,
+                    hero_candidates=hero_candidates,
                     min_word_count=min_word_count,
                 )
     except Exception:
@@ -110,93 +125,159 @@ def scrape(
     # Fallback to readability-lxml
     try:
         doc = Document(html)
-        title = doc.title() or _extract_title(html, metadata)
+        title = doc.title() or page_title
         text = _extract_text_from_html(doc.summary())
 
         if not text or not text.strip():
             raise ScraperError("No text content extracted")
 
+        # Whitespace is already normalized to single spaces, so count them instead
+        # of splitting the text into a throwaway list
         return _build_result(
-            title=title, text=text, metadata=metadata, min_word_count=min_word_count
+            title=title,
+            text=text,
+            word_count=text.count(" ") + 1,
+            metadata=metadata,
+            hero_candidates=hero_candidates,
+            min_word_count=min_word_count,
         )
     except Exception as e:
         raise ScraperError(f"Both trafilatura and readability failed: {e}") from e
 
 
+# Process-wide pooled client for page fetches (created on first use)
+_shared_client: httpx.Client | None = None
+
+
+def _get_shared_client() -> httpx.Client:
+    """Return the shared HTTP client for scraping, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.Client(
+            timeout=30.0,
+            follow_redirects=True,
+            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"},
+            limits=httpx.Limits(
+                max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+            ),
+        )
+    return _shared_client
+
+
 def _default_http_get(url: str) -> httpx.Response:
     """
-    Default HTTP GET function using httpx.
+    Default HTTP GET function using httpx, over a pooled keep-alive connection.
+
+    The body is streamed and truncated at _MAX_HTML_BYTES, so a giant or hostile
+    page cannot pin the worker's memory; the article text is near the start of
+    the document anyway.
 
     Args:
         url: URL to fetch
 
     Returns:
-        httpx.Response object
+        httpx.Response object holding at most _MAX_HTML_BYTES of (decoded) body
     """
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
-    with httpx.Client(timeout=30.0, follow_redirects=True, headers=headers) as client:
-        return client.get(url)
+    with _get_shared_client().stream("GET", url) as response:
+        buffer = bytearray()
+        for chunk in response.iter_bytes(_STREAM_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) >= _MAX_HTML_BYTES:
+                del buffer[_MAX_HTML_BYTES:]
+                break
+
+    # iter_bytes already undid any Content-Encoding, so drop the headers that
+    # describe the wire body rather than the bytes kept here
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name not in ("content-encoding", "content-length", "transfer-encoding")
+    ]
+    return httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=bytes(buffer),
+        request=response.request,
+    )
 
 
-def _extract_metadata(html: str) -> dict[str, str]:
+def _parse_html(html: str) -> lxml.html.HtmlElement | None:
     """
-    Extract metadata from HTML (og:*, twitter:*, etc.).
+    Parse HTML into an lxml tree in a single C-level pass.
 
     Args:
         html: HTML content
 
     Returns:
-        Dictionary of metadata
+        Document root, or None if nothing could be parsed
     """
-    from html.parser import HTMLParser
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # Unicode input with an XML encoding declaration must be parsed as bytes
+        try:
+            return lxml.html.document_fromstring(html.encode("utf-8"))
+        except Exception:
+            return None
+    except Exception:
+        # HTML parsing errors are non-fatal
+        return None
 
+
+def _head_of(tree: lxml.html.HtmlElement | None) -> lxml.html.HtmlElement | None:
+    """Return the document head, where metadata and the <title> tag live."""
+    if tree is None:
+        return None
+    head = tree.find("head")
+    return head if head is not None else tree
+
+
+def _extract_metadata(
+    tree: lxml.html.HtmlElement | None,
+) -> tuple[dict[str, str], list[str]]:
+    """
+    Extract metadata from HTML (og:*, twitter:*, etc.).
+
+    Args:
+        tree: Parsed HTML document
+
+    Returns:
+        Tuple of (metadata dictionary, hero image candidate URLs)
+    """
     metadata: dict[str, str] = {}
     hero_images: list[str] = []
 
-    class MetaParser(HTMLParser):
-        def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-            if tag == "meta":
-                attr_dict = dict(attrs)
-                property_val = attr_dict.get("property", "")
-                name_val = attr_dict.get("name", "")
-                content_val = attr_dict.get("content")
-
-                if not content_val:
-                    return
-
-                # Open Graph metadata
-                if property_val and property_val.startswith("og:"):
-                    key = property_val
-                    metadata[key] = content_val
-                    if property_val == "og:image":
-                        hero_images.append(content_val)
-
-                # Twitter metadata
-                if name_val and name_val.startswith("twitter:"):
-                    key = name_val
-                    metadata[key] = content_val
-                    if name_val == "twitter:image":
-                        hero_images.append(content_val)
-
-                # Site name
-                if name_val in ("application-name", "site_name"):
-                    metadata["site_name"] = content_val
-
-    parser = MetaParser()
-    try:
-        parser.feed(html)
-    except Exception:
-        # HTML parsing errors are non-fatal
-        pass
+    head = _head_of(tree)
+    if head is None:
+        return metadata, hero_images
+
+    for meta in head.iter("meta"):
+        content_val = meta.get("content")
+        if not content_val:
+            continue
+        property_val = meta.get("property", "")
+        name_val = meta.get("name", "")
 
-    # Store hero candidates in metadata
-    if hero_images:
-        metadata["_hero_candidates"] = ",".join(hero_images)
+        # Open Graph metadata
+        if property_val.startswith("og:"):
+            metadata[property_val] = content_val
+            if property_val == "og:image":
+                hero_images.append(content_val)
 
-    return metadata
+        # Twitter metadata
+        if name_val.startswith("twitter:"):
+            metadata[name_val] = content_val
+            if name_val == "twitter:image":
+                hero_images.append(content_val)
 
+        # Site name
+        if name_val in ("application-name", "site_name"):
+            metadata["site_name"] = content_val
 
-def _extract_title(html: str, metadata: dict[str, str]) -> str:
+    return metadata, hero_images
+
+
+def _extract_title(tree: lxml.html.HtmlElement | None, metadata: dict[str, str]) -> str:
     """
     Extract page title from HTML or metadata.
 
@@ -207,7 +288,7 @@ def _extract_title(html: str, metadata: dict[str, str]) -> str:
     4. "[no-title]"
 
     Args:
-        html: HTML content
+        tree: Parsed HTML document
         metadata: Extracted metadata
 
     Returns:
@@ -220,33 +301,11 @@ def _extract_title(html: str, metadata: dict[str, str]) -> str:
         return metadata["twitter:title"].strip()
 
     # Try <title> tag
-    from html.parser import HTMLParser
-
-    class TitleParser(HTMLParser):
-        def __init__(self) -> None:
-            super().__init__()
-            self.title = ""
-            self.in_title = False
-
-        def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-            if tag == "title":
-                self.in_title = True
-
-        def handle_endtag(self, tag: str) -> None:
-            if tag == "title":
-                self.in_title = False
-
-        def handle_data(self, data: str) -> None:
-            if self.in_title:
-                self.title += data
-
-    parser = TitleParser()
-    try:
-        parser.feed(html)
-        if parser.title.strip():
-            return parser.title.strip()
-    except Exception:
-        pass
+    head = _head_of(tree)
+    if head is not None:
+        title = (head.findtext(".//title") or "").strip()
+        if title:
+            return title
 
     return "[no-title]"
 
@@ -261,41 +320,24 @@ def _extract_text_from_html(html: str) -> str:
     Returns:
         Plain text with normalized whitespace
     """
-    import re
-    from html.parser import HTMLParser
-
-    class TextExtractor(HTMLParser):
-        def __init__(self) -> None:
-            super().__init__()
-            self.text_parts: list[str] = []
-            self.skip_tags = {"script", "style", "noscript"}
-            self.current_tag: str | None = None
-
-        def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-            self.current_tag = tag
-
-        def handle_endtag(self, tag: str) -> None:
-            self.current_tag = None
-
-        def handle_data(self, data: str) -> None:
-            if self.current_tag not in self.skip_tags:
-                text = data.strip()
-                if text:
-                    self.text_parts.append(text)
-
-    parser = TextExtractor()
-    try:
-        parser.feed(html)
-        text = " ".join(parser.text_parts)
-        # Normalize multiple spaces to single space
-        text = re.sub(r"\s+", " ", text)
-        return text.strip()
-    except Exception:
+    tree = _parse_html(html)
+    if tree is None:
         return ""
 
+    etree.strip_elements(tree, etree.Comment, "script", "style", "noscript", with_tail=False)
+    text = " ".join(part.strip() for part in tree.itertext() if part.strip())
+    # Normalize multiple spaces to single space
+    text = _WHITESPACE_RE.sub(" ", text)
+    return text.strip()
+
 
 def _build_result(
-    title: str, text: str, metadata: dict[str, str], min_word_count: int
+    title: str,
+    text: str,
+    word_count: int,
+    metadata: dict[str, str],
+    hero_candidates: list[str],
+    min_word_count: int,
 ) -> ScrapedContent:
     """
     Build ScrapedContent result from extracted data.
@@ -303,22 +345,14 @@ def _build_result(
     Args:
         title: Page title
         text: Extracted text content
+        word_count: Number of words in text (counted once by the caller)
         metadata: Page metadata
+        hero_candidates: Hero image URLs found in the metadata, in page order
         min_word_count: Minimum word count threshold
 
     Returns:
         ScrapedContent instance
     """
-    # Count words
-    word_count = len(text.split())
-
-    # Extract hero candidates
-    hero_candidates = []
-    if "_hero_candidates" in metadata:
-        hero_candidates = metadata["_hero_candidates"].split(",")
-        # Remove from metadata (internal use only)
-        metadata = {k: v for k, v in metadata.items() if k != "_hero_candidates"}
-
     # Extract site name
     site_name = metadata.get("og:site_name") or metadata.get("site_name")
 
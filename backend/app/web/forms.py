@@ -1,11 +1,15 @@
 """Form schemas for web UI."""
 
-from pydantic import BaseModel, HttpUrl
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ConfigDict, HttpUrl, TypeAdapter, ValidationError
 
 
 class SubmitForm(BaseModel):
     """Form data for URL submission."""
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     url: HttpUrl
     account_id: int
     mode: str = "review"
@@ -14,13 +18,34 @@ class SubmitForm(BaseModel):
     summary_mode: str = "extractive"
     thread_cap: int = 12
     single_cap: int = 1400
-    include_reference: bool = True
+    # Unchecked checkboxes are not submitted at all, so they default to off
+    include_reference: bool = False
     utm_campaign: str = "threadify"
-    include_image: bool = True
-    include_hook: bool = True
+    include_image: bool = False
+    include_hook: bool = False
     force: bool = False
+    force_rescrape: bool = False
+
+
+# Built once at import, so requests only run the compiled validator
+_submit_form_adapter = TypeAdapter(SubmitForm)
+
+
+async def parse_submit_form(request: Request) -> SubmitForm:
+    """
+    Validate the submission form in a single call.
+
+    Args:
+        request: FastAPI request carrying the url-encoded form
 
-    class Config:
-        """Pydantic config."""
+    Returns:
+        Validated submission form
 
-        str_strip_whitespace = True
+    Raises:
+        RequestValidationError: If a field is missing or invalid (422)
+    """
+    form = await request.form()
+    try:
+        return _submit_form_adapter.validate_python(dict(form))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors()) from e
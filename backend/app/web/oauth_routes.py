@@ -1,5 +1,7 @@
 """OAuth2 routes for Twitter/X authentication."""
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
@@ -12,6 +14,7 @@ from app.security.oauth_x import (
     exchange_code_for_tokens,
     start_oauth_flow,
 )
+from app.web.routes import invalidate_account_choices
 
 router = APIRouter(prefix="/oauth/x", tags=["oauth"])
 
@@ -71,8 +74,9 @@ async def oauth_callback(
     redirect_uri = str(request.url_for("oauth_callback"))
 
     try:
-        # Exchange code for tokens
-        tokens = exchange_code_for_tokens(
+        # Exchange code for tokens (blocking HTTP, so run it in a worker thread)
+        tokens = await asyncio.to_thread(
+            exchange_code_for_tokens,
             code=code,
             code_verifier=stored_verifier,
             redirect_uri=redirect_uri,
@@ -107,6 +111,9 @@ async def oauth_callback(
             account.refresh_token = tokens.refresh_token  # type: ignore[method-assign]
             db.commit()
 
+        # Show the new account on the submission form right away
+        invalidate_account_choices()
+
         # Clear session
         request.session.pop("oauth_verifier", None)
         request.session.pop("oauth_state", None)
@@ -1,22 +1,42 @@
 """Web UI routes for Threadify."""
 
-import json
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple
 
+import orjson
 from fastapi import APIRouter, Depends, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy.orm import Session
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.db.base import get_db
-from app.db.dao import create_run, create_tweet
+from app.db.dao import create_run, create_tweets_bulk, find_recent_scrape
 from app.db.models import Account, Run, Tweet
 from app.db.schema import RunCreate, TweetCreate
 from app.services.budget import within_budget
 from app.services.canonicalize import CanonicalizationError, canonicalize
 from app.services.duplicate_detection import check_duplicate
-from app.services.generate import GenerationError, generate_thread
-from app.services.images import alt_text_from, pick_hero, validate_and_process
-from app.services.scraper import ScraperError, scrape
+from app.services.generate import (
+    GeneratedSingle,
+    GeneratedThread,
+    GenerationError,
+    GenerationSettings,
+    ScrapeResult,
+    generate_single,
+    generate_thread,
+    post_texts,
+)
+from app.services.images import (
+    ProcessedImage,
+    alt_text_from,
+    avalidate_and_process,
+    pick_hero,
+)
+from app.services.scraper import ScrapedContent, ScraperError, scrape
+from app.web.forms import SubmitForm, parse_submit_form
 
 router = APIRouter()
 
@@ -24,6 +44,110 @@ router = APIRouter()
 templates = Jinja2Templates(directory="backend/app/web/templates")
 
 
+class AccountChoice(NamedTuple):
+    """Account entry for the submission form's account picker."""
+
+    id: int
+    handle: str
+
+
+# The account list rarely changes, so the index page reuses it for a short while
+# instead of querying on every load. Plain tuples are cached, never ORM objects.
+_ACCOUNT_CHOICES_TTL = 30.0
+_account_choices: tuple[float, list[AccountChoice]] | None = None
+
+
+def _get_account_choices(db: Session) -> list[AccountChoice]:
+    """
+    Return the accounts for the submission form, from cache when fresh.
+
+    Args:
+        db: Database session
+
+    Returns:
+        List of account choices
+    """
+    global _account_choices
+    now = time.monotonic()
+    if _account_choices is not None and now - _account_choices[0] < _ACCOUNT_CHOICES_TTL:
+        return _account_choices[1]
+
+    choices = [AccountChoice(*row) for row in db.query(Account.id, Account.handle).all()]
+    _account_choices = (now, choices)
+    return choices
+
+
+def invalidate_account_choices() -> None:
+    """Drop the cached account list (call after accounts are added or changed)."""
+    global _account_choices
+    _account_choices = None
+
+
+# Resubmitting a URL reuses the article text stored by a run this recent
+_SCRAPE_REUSE_TTL = timedelta(hours=24)
+
+
+async def _process_hero_or_none(hero_url: str | None) -> ProcessedImage | None:
+    """
+    Download and process a hero image, skipping it on any failure.
+
+    Args:
+        hero_url: Hero image URL, or None if no image was requested
+
+    Returns:
+        Processed image, or None if there is none or processing failed
+    """
+    if hero_url is None:
+        return None
+    try:
+        return await avalidate_and_process(hero_url)
+    except Exception:
+        # If image processing fails, continue without image
+        return None
+
+
+def _generation_settings(
+    run_type: str, style: str | None, summary_mode: str | None, include_hook: bool
+) -> GenerationSettings:
+    """
+    Map the submit form options onto generator settings.
+
+    Args:
+        run_type: Run type (thread or single)
+        style: Writing style
+        summary_mode: Summary mode (extractive or abstractive)
+        include_hook: Whether a thread should open with a hook
+
+    Returns:
+        Generation settings
+    """
+    return GenerationSettings(
+        mode=run_type,
+        style=style,
+        hook=include_hook and run_type == "thread",
+        extractive=(summary_mode or "extractive") == "extractive",
+    )
+
+
+async def _generate(
+    scrape_input: ScrapeResult, settings: GenerationSettings, use_cache: bool = True
+) -> GeneratedThread | GeneratedSingle:
+    """
+    Generate a thread or single post (blocking OpenAI call, off the event loop).
+
+    Args:
+        scrape_input: Article to generate from
+        settings: Generation settings; mode selects thread or single post
+        use_cache: Reuse the response to an identical earlier prompt (False to regenerate)
+
+    Returns:
+        Generated thread, or single post when settings.mode is "single"
+    """
+    if settings.mode == "single":
+        return await asyncio.to_thread(generate_single, scrape_input, settings, use_cache=use_cache)
+    return await asyncio.to_thread(generate_thread, scrape_input, settings, use_cache=use_cache)
+
+
 @router.get("/", response_class=HTMLResponse)
 async def index(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
     """
@@ -37,7 +161,7 @@ async def index(request: Request, db: Session = Depends(get_db)) -> HTMLResponse
         HTML response with submission form
     """
     # Get list of connected accounts
-    accounts = db.query(Account).all()
+    accounts = _get_account_choices(db)
 
     return templates.TemplateResponse(
         request=request,
@@ -48,21 +172,36 @@ async def index(request: Request, db: Session = Depends(get_db)) -> HTMLResponse
     )
 
 
+def _recent_scrape(db: Session, canonical_url: str) -> ScrapedContent | None:
+    """
+    Rebuild scraped content stored by a recent run of the same canonical URL.
+
+    Args:
+        db: Database session
+        canonical_url: Canonical URL being submitted
+
+    Returns:
+        Scraped content without hero candidates, or None if nothing fresh is stored
+    """
+    since = datetime.now(UTC).replace(tzinfo=None) - _SCRAPE_REUSE_TTL
+    previous = find_recent_scrape(db, canonical_url, since)
+    if previous is None or previous.scraped_text is None:
+        return None
+    word_count = previous.word_count or len(previous.scraped_text.split())
+    return ScrapedContent(
+        title=previous.scraped_title or "",
+        text=previous.scraped_text,
+        site_name=None,
+        word_count=word_count,
+        too_short=False,
+        hero_candidates=[],
+        metadata={},
+    )
+
+
 @router.post("/submit")
 async def submit(
-    url: str = Form(...),
-    account_id: int = Form(...),
-    mode: str = Form("review"),
-    type: str = Form("thread"),
-    style: str = Form("punchy"),
-    summary_mode: str = Form("extractive"),
-    thread_cap: int = Form(12),
-    single_cap: int = Form(1400),
-    include_reference: str | None = Form(None),
-    utm_campaign: str = Form("threadify"),
-    include_image: str | None = Form(None),
-    include_hook: str | None = Form(None),
-    force: str | None = Form(None),
+    form: SubmitForm = Depends(parse_submit_form),
     db: Session = Depends(get_db),
 ) -> RedirectResponse:
     """
@@ -78,19 +217,7 @@ async def submit(
     7. Store Run and Tweets
 
     Args:
-        url: Blog URL to convert
-        account_id: Target X/Twitter account ID
-        mode: "review" or "auto"
-        type: "thread" or "single"
-        style: Style profile for generation
-        summary_mode: "extractive" or "commentary"
-        thread_cap: Max tweets in thread
-        single_cap: Max characters in single post
-        include_reference: Whether to include reference reply
-        utm_campaign: UTM campaign parameter
-        include_image: Whether to include hero image
-        include_hook: Whether to include hook (for threads)
-        force: Force flag to override duplicate detection
+        form: Validated submission form (URL, account, mode, type and generation options)
         db: Database session
 
     Returns:
@@ -99,11 +226,9 @@ async def submit(
     Raises:
         HTTPException: On validation or processing errors
     """
-    # Convert checkbox values to booleans
-    force_bool = force == "on"
-    include_reference_bool = include_reference == "on"
-    include_image_bool = include_image == "on"
-    include_hook_bool = include_hook == "on"
+    url = str(form.url)
+    account_id = form.account_id
+    mode = form.mode
 
     # Validate account exists
     account = db.query(Account).filter(Account.id == account_id).first()
@@ -111,12 +236,12 @@ async def submit(
         raise HTTPException(status_code=404, detail="Account not found")
 
     try:
-        # Step 1: Canonicalize URL
-        canonical_url = canonicalize(url)
+        # Step 1: Canonicalize URL (redirect chasing is blocking I/O)
+        canonical_url = await asyncio.to_thread(canonicalize, url)
 
         # Step 2: Check for duplicates
         duplicate_check = check_duplicate(
-            db, account_id, canonical_url, mode=mode, force=force_bool
+            db, account_id, canonical_url, mode=mode, force=form.force
         )
 
         if duplicate_check.should_block:
@@ -125,47 +250,35 @@ async def submit(
                 detail=f"This URL has already been posted from this account (Run #{duplicate_check.previous_run_id}). Use --force to override.",
             )
 
-        # Step 3: Scrape content
-        scraped = scrape(url)
+        # Step 3: Scrape content (blocking fetch and extraction, off the event loop),
+        # unless this URL was scraped recently. Hero candidates are not stored, so
+        # image runs always fetch the page.
+        scraped = None
+        if not form.force_rescrape and not form.include_image:
+            scraped = _recent_scrape(db, canonical_url)
+        if scraped is None:
+            scraped = await asyncio.to_thread(scrape, url)
+
+        # Step 4: Select hero image (if enabled)
+        hero_url = None
+        if form.include_image and scraped.hero_candidates:
+            hero_url = pick_hero(scraped.hero_candidates)
 
-        # Step 4: Select and process hero image (if enabled)
-        hero_image_bytes = None
-        hero_alt_text = None
+        # Step 5: Generate thread/post with AI while the hero image is processed
+        generation_input = ScrapeResult(
+            title=scraped.title, text=scraped.text, word_count=scraped.word_count
+        )
+        generation_settings = _generation_settings(
+            form.type, form.style, form.summary_mode, form.include_hook
+        )
+        hero_image, generation_result = await asyncio.gather(
+            _process_hero_or_none(hero_url), _generate(generation_input, generation_settings)
+        )
+        tweet_texts = post_texts(generation_result, form.single_cap)
 
-        if include_image_bool and scraped.hero_candidates:
-            hero_url = pick_hero(scraped.hero_candidates)
-            if hero_url:
-                try:
-                    hero_image_bytes = validate_and_process(hero_url)
-                    # Generate alt text from title + lede
-                    hero_alt_text = alt_text_from(scraped.title, scraped.title)
-                except Exception:
-                    # If image processing fails, continue without image
-                    pass
-
-        # Step 5: Generate thread/post with AI
-        if type == "thread":
-            generation_result = generate_thread(  # type: ignore[call-arg]
-                title=scraped.title,
-                content=scraped.text,
-                word_count=scraped.word_count,
-                style=style,
-                summary_mode=summary_mode,
-                max_tweets=thread_cap,
-                include_hook=include_hook_bool,
-            )
-        else:
-            # Single post generation would go here
-            # For now, simplified version
-            generation_result = generate_thread(  # type: ignore[call-arg]
-                title=scraped.title,
-                content=scraped.text,
-                word_count=scraped.word_count,
-                style=style,
-                summary_mode=summary_mode,
-                max_tweets=1,
-                include_hook=False,
-            )
+        hero_image_bytes = hero_image.data if hero_image is not None else None
+        # Generate alt text from title + lede
+        hero_alt_text = alt_text_from(scraped.title, scraped.title) if hero_image_bytes else None
 
         # Step 6: Check budget
         if not within_budget(generation_result.cost_usd):
@@ -174,14 +287,14 @@ async def submit(
 
         # Step 7: Store Run in database
         settings = {
-            "style": style,
-            "summary_mode": summary_mode,
-            "thread_cap": thread_cap,
-            "single_cap": single_cap,
-            "include_reference": include_reference_bool,
-            "utm_campaign": utm_campaign,
-            "include_image": include_image_bool,
-            "include_hook": include_hook_bool,
+            "style": form.style,
+            "summary_mode": form.summary_mode,
+            "thread_cap": form.thread_cap,
+            "single_cap": form.single_cap,
+            "include_reference": form.include_reference,
+            "utm_campaign": form.utm_campaign,
+            "include_image": form.include_image,
+            "include_hook": form.include_hook,
         }
 
         run = create_run(
@@ -190,9 +303,10 @@ async def submit(
                 account_id=account_id,
                 url=url,
                 mode=mode,
-                type=type,
-                settings_json=json.dumps(settings),
+                type=form.type,
+                settings_json=orjson.dumps(settings).decode(),
             ),
+            commit=False,
         )
 
         # Update run with scraped data and costs
@@ -204,25 +318,30 @@ async def submit(
         run.tokens_out = generation_result.tokens_out
         run.cost_estimate = generation_result.cost_usd
         run.status = "review"  # Always go to review in MVP
-        db.commit()
-        db.refresh(run)
 
-        # Step 8: Store Tweets
-        for idx, tweet_text in enumerate(generation_result.tweets):
-            create_tweet(
-                db,
+        # Capture before the commit expires the instance (avoids a reload query)
+        run_id = run.id
+
+        # Step 8: Store Tweets in the same transaction as the run
+        create_tweets_bulk(
+            db,
+            [
                 TweetCreate(
-                    run_id=run.id,
+                    run_id=run_id,
                     idx=idx,
                     role="content",
                     text=tweet_text,
                     media_alt=hero_alt_text if idx == 0 and hero_image_bytes else None,
-                ),
-            )
+                )
+                for idx, tweet_text in enumerate(tweet_texts)
+            ],
+            commit=False,
+        )
+        db.commit()
 
         # Redirect to review page
         return RedirectResponse(
-            url=f"/review/{run.id}",
+            url=f"/review/{run_id}",
             status_code=303,  # See Other (POST -> GET redirect)
         )
 
@@ -252,26 +371,24 @@ async def review(run_id: int, request: Request, db: Session = Depends(get_db)) -
     Raises:
         HTTPException: If run not found
     """
-    # Get run with tweets
-    run = db.query(Run).filter(Run.id == run_id).first()
+    # Get run with its account joined in and its tweets (ordered by index) loaded
+    # in one follow-up query, instead of a round-trip per relation
+    run = (
+        db.query(Run)
+        .options(joinedload(Run.account), selectinload(Run.tweets))
+        .filter(Run.id == run_id)
+        .one_or_none()
+    )
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    # Get associated account
-    account = db.query(Account).filter(Account.id == run.account_id).first()
-
-    # Get tweets ordered by index
-    from app.db.dao import get_tweets_by_run
-
-    tweets = get_tweets_by_run(db, run_id)
-
     return templates.TemplateResponse(
         request=request,
         name="review.html",
         context={
             "run": run,
-            "account": account,
-            "tweets": tweets,
+            "account": run.account,
+            "tweets": run.tweets,
         },
     )
 
@@ -334,6 +451,56 @@ async def update_alt_text(
     return RedirectResponse(url=f"/review/{run_id}", status_code=303)
 
 
+async def _regenerate_tweets(
+    db: Session, run: Run, title: str, content: str, word_count: int
+) -> None:
+    """
+    Generate a fresh thread or post for a run and replace its tweets and costs.
+
+    Args:
+        db: Database session
+        run: Run to regenerate
+        title: Article title
+        content: Article text
+        word_count: Article word count
+    """
+    # Parse settings from JSON
+    settings = {}
+    if run.settings_json:
+        settings = orjson.loads(run.settings_json)
+
+    # Regenerate with same settings
+    generation_result = await _generate(
+        ScrapeResult(title=title, text=content, word_count=word_count),
+        _generation_settings(
+            run.type,
+            settings.get("style", "punchy"),
+            settings.get("summary_mode", "extractive"),
+            settings.get("include_hook", True),
+        ),
+        use_cache=False,  # A regenerate must not be served the cached response
+    )
+
+    # Replace the tweets and update costs in one transaction
+    db.execute(delete(Tweet).where(Tweet.run_id == run.id))
+    create_tweets_bulk(
+        db,
+        [
+            TweetCreate(run_id=run.id, idx=idx, role="content", text=tweet_text)
+            for idx, tweet_text in enumerate(
+                post_texts(generation_result, settings.get("single_cap"))
+            )
+        ],
+        commit=False,
+    )
+
+    # Update run with new costs
+    run.tokens_in = generation_result.tokens_in
+    run.tokens_out = generation_result.tokens_out
+    run.cost_estimate = generation_result.cost_usd
+    db.commit()
+
+
 @router.post("/review/{run_id}/regenerate")
 async def regenerate_thread(
     run_id: int,
@@ -342,6 +509,9 @@ async def regenerate_thread(
     """
     Regenerate entire thread with same settings.
 
+    Reuses the article text stored on the run instead of fetching the page again;
+    use the rescrape endpoint to pick up changes to the article.
+
     Args:
         run_id: Run ID to regenerate
         db: Database session
@@ -353,46 +523,47 @@ async def regenerate_thread(
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
+    if run.scraped_text is None:
+        # Nothing stored to regenerate from (older runs); fetch the page instead
+        return await rescrape_thread(run_id, db)
+
     try:
-        # Re-scrape content
-        scraped = scrape(run.url)
-
-        # Parse settings from JSON
-        settings = {}
-        if run.settings_json:
-            settings = json.loads(run.settings_json)
-
-        # Regenerate with same settings
-        generation_result = generate_thread(  # type: ignore[call-arg]
-            title=scraped.title,
-            content=scraped.text,
-            word_count=scraped.word_count,
-            style=settings.get("style", "punchy"),
-            summary_mode=settings.get("summary_mode", "extractive"),
-            max_tweets=settings.get("thread_cap", 12),
-            include_hook=settings.get("include_hook", True),
+        await _regenerate_tweets(
+            db, run, run.scraped_title or "", run.scraped_text, run.word_count or 0
         )
+        return RedirectResponse(url=f"/review/{run_id}", status_code=303)
 
-        # Delete old tweets
-        db.query(Tweet).filter(Tweet.run_id == run_id).delete()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Regeneration failed: {e}") from e
 
-        # Create new tweets
-        for idx, tweet_text in enumerate(generation_result.tweets):
-            create_tweet(
-                db,
-                TweetCreate(
-                    run_id=run_id,
-                    idx=idx,
-                    role="content",
-                    text=tweet_text,
-                ),
-            )
 
-        # Update run with new costs
-        run.tokens_in = generation_result.tokens_in
-        run.tokens_out = generation_result.tokens_out
-        run.cost_estimate = generation_result.cost_usd
-        db.commit()
+@router.post("/review/{run_id}/rescrape")
+async def rescrape_thread(
+    run_id: int,
+    db: Session = Depends(get_db),
+) -> RedirectResponse:
+    """
+    Fetch the article again and regenerate the thread from the fresh content.
+
+    Args:
+        run_id: Run ID to regenerate
+        db: Database session
+
+    Returns:
+        Redirect to review page with new content
+    """
+    run = db.query(Run).filter(Run.id == run_id).first()
+    if not run:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    try:
+        # Re-scrape content (blocking fetch and extraction, off the event loop)
+        scraped = await asyncio.to_thread(scrape, run.url)
+
+        run.scraped_title = scraped.title
+        run.scraped_text = scraped.text
+        run.word_count = scraped.word_count
+        await _regenerate_tweets(db, run, scraped.title, scraped.text, scraped.word_count)
 
         return RedirectResponse(url=f"/review/{run_id}", status_code=303)
 
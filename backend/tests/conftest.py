@@ -1,10 +1,26 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+from app.config import get_settings
 from app.main import app
+from app.web.routes import invalidate_account_choices
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache() -> None:
+    """Re-read settings per test so monkeypatched env vars take effect."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_account_choices() -> None:
+    """Start every test without a cached account list (each test has its own DB)."""
+    invalidate_account_choices()
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create a test client for the FastAPI app."""
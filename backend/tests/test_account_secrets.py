@@ -1,31 +1,65 @@
 """Tests for Account model encrypted token storage."""
 
+import base64
 import os
+from collections.abc import Generator
 
 import pytest
 from app.db.base import Base
 from app.db.models import Account
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture(scope="module")
+def engine() -> Generator[Engine, None, None]:
+    """Create the in-memory schema once for the whole module."""
+    engine = create_engine("sqlite:///:memory:", echo=False, poolclass=StaticPool)
+
+    # Commits inside a test must only release a SAVEPOINT of the outer transaction,
+    # which needs SQLAlchemy rather than pysqlite to emit BEGIN
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(conn) -> None:
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture
-def db_session(monkeypatch: pytest.MonkeyPatch) -> Session:
-    """Create a temporary in-memory SQLite database for testing with encryption key."""
+def db_session(engine: Engine, monkeypatch: pytest.MonkeyPatch) -> Generator[Session, None, None]:
+    """
+    Open a session inside a transaction that is rolled back after the test.
+
+    Tests flush rather than commit unless they check persistence across sessions;
+    the token setters encrypt on assignment either way.
+    """
     # Set a test encryption key
     test_key = os.urandom(32)
-    import base64
-
     monkeypatch.setenv("SECRET_AES_KEY", base64.urlsafe_b64encode(test_key).decode("ascii"))
 
-    engine = create_engine("sqlite:///:memory:", echo=False)
-    Base.metadata.create_all(bind=engine)
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test only release a SAVEPOINT of the outer transaction
+    TestSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
     session = TestSessionLocal()
     try:
         yield session
     finally:
         session.close()
+        transaction.rollback()
+        connection.close()
 
 
 def test_account_access_token_encryption(db_session: Session) -> None:
@@ -35,7 +69,7 @@ def test_account_access_token_encryption(db_session: Session) -> None:
     account.access_token = "secret_access_token_12345"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Verify ciphertext is stored (not plaintext)
@@ -54,7 +88,7 @@ def test_account_refresh_token_encryption(db_session: Session) -> None:
     account.refresh_token = "secret_refresh_token_67890"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Verify ciphertext is stored (not plaintext)
@@ -73,7 +107,7 @@ def test_account_both_tokens_encryption(db_session: Session) -> None:
     account.refresh_token = "refresh_xyz789"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Both are encrypted
@@ -94,7 +128,7 @@ def test_account_null_tokens(db_session: Session) -> None:
     account.refresh_token = None
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # No encrypted data stored
@@ -112,14 +146,14 @@ def test_account_update_token(db_session: Session) -> None:
     account.access_token = "original_token"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     original_encrypted = account.token_encrypted
 
     # Update the token
     account.access_token = "new_token"
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Encrypted value changed
@@ -137,13 +171,13 @@ def test_account_clear_token(db_session: Session) -> None:
     account.refresh_token = "refresh_to_clear"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Clear both tokens
     account.access_token = None
     account.refresh_token = None
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Both should be None
@@ -185,7 +219,7 @@ def test_account_unicode_tokens(db_session: Session) -> None:
     account.access_token = "token_with_émojis_🔐_and_中文"
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Encrypted
@@ -205,8 +239,13 @@ def test_account_long_tokens(db_session: Session) -> None:
     account.access_token = long_token
 
     db_session.add(account)
-    db_session.commit()
+    db_session.flush()
     db_session.refresh(account)
 
     # Still works
     assert account.access_token == long_token
+
+
+def test_account_writes_are_rolled_back_between_tests(db_session: Session) -> None:
+    """Test that each test starts from an empty table despite the shared schema."""
+    assert db_session.query(Account).count() == 0
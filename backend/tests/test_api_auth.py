@@ -0,0 +1,104 @@
+"""Tests for API token authentication."""
+
+import base64
+import os
+
+import pytest
+from app.api.auth import verify_api_token
+from app.db.base import Base
+from app.db.dao import create_api_token, revoke_api_token
+from app.db.schema import ApiTokenCreate
+from app.security.crypto import hash_password, is_legacy_token_hash, token_lookup_key
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture
+def db_session(monkeypatch: pytest.MonkeyPatch) -> Session:
+    """Create a temporary in-memory SQLite database for testing with encryption key."""
+    monkeypatch.setenv("SECRET_AES_KEY", base64.urlsafe_b64encode(os.urandom(32)).decode("ascii"))
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(bind=engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def _credentials(token: str) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+
+def test_create_api_token_stores_hash_and_lookup(db_session: Session) -> None:
+    """Test that issuing a token stores only its hash and lookup key."""
+    api_token, plaintext = create_api_token(db_session, ApiTokenCreate(label="cli"))
+
+    assert api_token.id is not None
+    assert api_token.token_hash != plaintext
+    assert api_token.token_lookup == token_lookup_key(plaintext)
+    assert plaintext not in api_token.token_lookup
+    assert api_token.is_active is True
+
+
+def test_verify_api_token_accepts_valid_token(db_session: Session) -> None:
+    """Test that a valid token resolves to its ApiToken row."""
+    create_api_token(db_session, ApiTokenCreate(label="other"))
+    api_token, plaintext = create_api_token(db_session, ApiTokenCreate(label="cli"))
+
+    result = verify_api_token(_credentials(plaintext), db_session)
+
+    assert result.id == api_token.id
+
+
+def test_verify_api_token_rejects_unknown_token(db_session: Session) -> None:
+    """Test that an unknown token is rejected with 401."""
+    create_api_token(db_session, ApiTokenCreate(label="cli"))
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_api_token(_credentials("not-a-real-token"), db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_verify_api_token_rejects_revoked_token(db_session: Session) -> None:
+    """Test that a revoked token is rejected with 401."""
+    api_token, plaintext = create_api_token(db_session, ApiTokenCreate(label="cli"))
+    revoke_api_token(db_session, api_token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_api_token(_credentials(plaintext), db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_verify_api_token_upgrades_legacy_bcrypt_hash(db_session: Session) -> None:
+    """Test that a token stored with bcrypt still verifies and is rehashed with HMAC."""
+    api_token, plaintext = create_api_token(db_session, ApiTokenCreate(label="cli"))
+    api_token.token_hash = hash_password(plaintext)
+    db_session.commit()
+
+    result = verify_api_token(_credentials(plaintext), db_session)
+
+    assert result.id == api_token.id
+    assert not is_legacy_token_hash(result.token_hash)
+    assert verify_api_token(_credentials(plaintext), db_session).id == api_token.id
+
+
+def test_verify_api_token_without_secret_key_is_unavailable(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a missing SECRET_AES_KEY is reported as 503, not an unhandled error."""
+    from app.config import get_settings
+
+    _, plaintext = create_api_token(db_session, ApiTokenCreate(label="cli"))
+    monkeypatch.delenv("SECRET_AES_KEY")
+    get_settings.cache_clear()
+
+    with pytest.raises(HTTPException) as exc_info:
+        verify_api_token(_credentials(plaintext), db_session)
+
+    assert exc_info.value.status_code == 503
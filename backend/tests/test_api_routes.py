@@ -0,0 +1,320 @@
+"""Tests for the CLI-facing API routes."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import httpx
+import pytest
+from app.api.auth import get_current_api_token
+from app.api.dependencies import get_length_client
+from app.clients.length_client import AsyncLengthClient
+from app.db.base import Base, get_db
+from app.db.models import Account, ApiToken, Run, Tweet
+from app.main import app
+from app.services.canonicalize import canonicalize
+from app.services.generate import GeneratedThread
+from app.services.images import ProcessedImage
+from app.services.scraper import ScrapedContent
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def db_session() -> Session:
+    """Create a temporary in-memory SQLite database for testing."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    session = TestSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def test_account(db_session: Session) -> Account:
+    """Create a test account."""
+    account = Account(handle="testuser", provider="x", scopes="tweet.read tweet.write")
+    db_session.add(account)
+    db_session.commit()
+    db_session.refresh(account)
+    return account
+
+
+@pytest.fixture
+def mock_services():
+    """Mock network-bound services for the submit pipeline."""
+    mock_scraped = ScrapedContent(
+        title="Test Article Title",
+        text="This is test article content that is long enough to be valid.",
+        site_name="example.com",
+        word_count=100,
+        too_short=False,
+        hero_candidates=[],
+        metadata={},
+    )
+    mock_generation = GeneratedThread(
+        tweets=["Tweet 1/2", "Tweet 2/2"],
+        style_used="punchy",
+        hook_used=False,
+        tokens_in=100,
+        tokens_out=50,
+        cost_usd=0.001,
+        model_used="gpt-4o-mini",
+    )
+
+    with (
+        patch("app.api.routes.canonicalize") as mock_canon,
+        patch("app.api.routes.scrape") as mock_scrape,
+        patch("app.api.routes.generate_thread", autospec=True) as mock_gen,
+    ):
+        mock_canon.side_effect = lambda url: canonicalize(url, follow_redirects=False)
+        mock_scrape.return_value = mock_scraped
+        mock_gen.return_value = mock_generation
+        yield {"scrape": mock_scrape, "generate_thread": mock_gen}
+
+
+def _valid_lengths(request: httpx.Request) -> httpx.Response:
+    """Answer every length check as valid."""
+    count = len(json.loads(request.content)["texts"])
+    return httpx.Response(
+        200,
+        json={
+            "results": [
+                {
+                    "isValid": True,
+                    "weightedLength": 9,
+                    "permillage": 32,
+                    "validRange": {"start": 0, "end": 9},
+                }
+            ]
+            * count
+        },
+    )
+
+
+def _invalid_lengths(request: httpx.Request) -> httpx.Response:
+    """Answer every length check as too long."""
+    count = len(json.loads(request.content)["texts"])
+    return httpx.Response(
+        200,
+        json={
+            "results": [
+                {
+                    "isValid": False,
+                    "weightedLength": 300,
+                    "permillage": 1071,
+                    "validRange": {"start": 0, "end": 299},
+                }
+            ]
+            * count
+        },
+    )
+
+
+def _override_length_service(handler) -> list[httpx.Request]:
+    """Answer length checks with handler and return the requests it receives."""
+    requests: list[httpx.Request] = []
+
+    def record(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return handler(request)
+
+    length_client = AsyncLengthClient(
+        base_url="http://length.test",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(record)),
+    )
+    app.dependency_overrides[get_length_client] = lambda: length_client
+    return requests
+
+
+@pytest.fixture
+def client(db_session: Session, mock_services) -> TestClient:
+    """Create a test client with database, auth and length service overridden."""
+    app.dependency_overrides[get_db] = lambda: db_session
+    app.dependency_overrides[get_current_api_token] = lambda: ApiToken(label="test")
+    _override_length_service(_valid_lengths)
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_api_submit_review_stores_run_and_tweets(
+    client: TestClient, db_session: Session, test_account: Account
+) -> None:
+    """Test that a review submission stores the run and its tweets together."""
+    response = client.post("/api/submit", json={"url": "https://example.com/post"})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "review"
+
+    run = db_session.query(Run).filter(Run.id == data["run_id"]).one()
+    assert run.account_id == test_account.id
+    assert run.canonical_url == "https://example.com/post"
+    assert run.status == "review"
+    tweets = db_session.query(Tweet).filter(Tweet.run_id == run.id).order_by(Tweet.idx).all()
+    assert [tweet.text for tweet in tweets] == ["Tweet 1/2", "Tweet 2/2"]
+
+
+def test_api_submit_auto_blocks_duplicate(
+    client: TestClient, db_session: Session, test_account: Account
+) -> None:
+    """Test that a second auto submission of the same URL is rejected with 409."""
+    payload = {"url": "https://example.com/post", "mode": "auto"}
+
+    first = client.post("/api/submit", json=payload)
+    second = client.post("/api/submit", json=payload)
+
+    assert first.status_code == 200
+    assert first.json()["status"] == "completed"
+    assert [tweet["text"] for tweet in first.json()["tweets"]] == ["Tweet 1/2", "Tweet 2/2"]
+    assert second.status_code == 409
+    assert db_session.query(Run).count() == 1
+
+
+def test_api_submit_duplicate_rechecked_inside_transaction(
+    client: TestClient, db_session: Session, test_account: Account, mock_services
+) -> None:
+    """Test that a duplicate stored while generating is caught before insert."""
+    payload = {"url": "https://example.com/post", "mode": "auto"}
+
+    def _concurrent_submit(*args, **kwargs):
+        # Simulate another request committing the same URL mid-pipeline
+        db_session.add(
+            Run(
+                account_id=test_account.id,
+                url="https://example.com/post",
+                canonical_url="https://example.com/post",
+                mode="auto",
+                type="thread",
+                status="approved",
+            )
+        )
+        db_session.commit()
+        return mock_services["scrape"].return_value
+
+    mock_services["scrape"].side_effect = _concurrent_submit
+
+    response = client.post("/api/submit", json=payload)
+
+    assert response.status_code == 409
+    assert db_session.query(Run).count() == 1
+    assert db_session.query(Tweet).count() == 0
+
+
+def test_api_submit_force_allows_duplicate(
+    client: TestClient, db_session: Session, test_account: Account
+) -> None:
+    """Test that force=True lets an auto submission repeat a URL."""
+    payload = {"url": "https://example.com/post", "mode": "auto"}
+
+    client.post("/api/submit", json=payload)
+    response = client.post("/api/submit", json={**payload, "force": True})
+
+    assert response.status_code == 200
+    assert db_session.query(Run).count() == 2
+
+
+def test_api_submit_processes_hero_image(
+    client: TestClient, db_session: Session, test_account: Account, mock_services
+) -> None:
+    """Test that the hero image is processed and its alt text stored on the first tweet."""
+    mock_services["scrape"].return_value.hero_candidates = ["https://example.com/hero.jpg"]
+
+    with patch("app.api.routes.avalidate_and_process") as mock_img:
+        mock_img.return_value = ProcessedImage(data=b"jpeg", width=1200, height=630)
+        response = client.post(
+            "/api/submit", json={"url": "https://example.com/post", "image": True}
+        )
+
+    assert response.status_code == 200
+    mock_img.assert_called_once_with("https://example.com/hero.jpg")
+    tweets = db_session.query(Tweet).order_by(Tweet.idx).all()
+    assert tweets[0].media_alt is not None
+    assert tweets[1].media_alt is None
+
+
+def test_api_submit_single_stores_one_tweet(
+    client: TestClient, db_session: Session, test_account: Account, mock_services
+) -> None:
+    """Test that a single-post submission stores exactly one tweet, cut to single_cap."""
+    from app.services.generate import GeneratedSingle
+
+    with patch("app.api.routes.generate_single", autospec=True) as mock_single:
+        mock_single.return_value = GeneratedSingle(
+            text="Single post text that runs long",
+            style_used=None,
+            tokens_in=100,
+            tokens_out=20,
+            cost_usd=0.001,
+            model_used="gpt-4o-mini",
+        )
+        response = client.post(
+            "/api/submit",
+            json={"url": "https://example.com/post", "type": "single", "single_cap": 16},
+        )
+
+    assert response.status_code == 200
+    mock_services["generate_thread"].assert_not_called()
+    assert [tweet.text for tweet in db_session.query(Tweet).all()] == ["Single post text"]
+
+
+def test_api_submit_auto_returns_separated_permalinks(
+    client: TestClient, test_account: Account
+) -> None:
+    """Test that permalinks keep the run ID and tweet index apart."""
+    response = client.post("/api/submit", json={"url": "https://example.com/post", "mode": "auto"})
+
+    data = response.json()
+    run_id = data["run_id"]
+    assert [tweet["permalink"] for tweet in data["tweets"]] == [
+        f"https://twitter.com/user/status/{run_id}/0",
+        f"https://twitter.com/user/status/{run_id}/1",
+    ]
+
+
+def test_api_submit_skips_length_check_by_default(
+    client: TestClient, test_account: Account
+) -> None:
+    """Test that auto submissions post without consulting the length service."""
+    length_requests = _override_length_service(_invalid_lengths)
+
+    response = client.post("/api/submit", json={"url": "https://example.com/post", "mode": "auto"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "completed"
+    assert length_requests == []
+
+
+def test_api_submit_length_check_forces_review(
+    client: TestClient, test_account: Account, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that enabled length checks send over-long tweets to review."""
+    monkeypatch.setenv("API_LENGTH_CHECK", "true")
+    length_requests = _override_length_service(_invalid_lengths)
+
+    response = client.post("/api/submit", json={"url": "https://example.com/post", "mode": "auto"})
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "review"
+    assert len(length_requests) == 1
+
+
+def test_get_length_client_uses_app_state_client() -> None:
+    """Test that the dependency wraps the AsyncClient stored on app.state."""
+    state = SimpleNamespace()
+    request = SimpleNamespace(app=SimpleNamespace(state=state))
+
+    first = get_length_client(request)  # type: ignore[arg-type]
+    second = get_length_client(request)  # type: ignore[arg-type]
+
+    assert first._client is state.length_http_client
+    assert second._client is first._client
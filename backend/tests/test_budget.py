@@ -126,3 +126,17 @@ def test_compress_prompt_whitespace_only() -> None:
     """Test that whitespace-only prompts are handled."""
     compressed = compress_prompt("   \n\n   \n   ")
     assert compressed.strip() == ""
+
+
+def test_compress_prompt_removes_whole_parenthesized_phrase() -> None:
+    """Test that the longer parenthesized phrase is removed without leaving ()."""
+    prompt = "Each tweet must be under 280 characters (following Twitter's rules)."
+
+    assert compress_prompt(prompt) == "Each tweet must be under 280 characters ."
+
+
+def test_compress_prompt_collapses_long_space_runs() -> None:
+    """Test that long runs of spaces collapse to one in a single pass."""
+    prompt = "Article:" + " " * 10000 + "content"
+
+    assert compress_prompt(prompt) == "Article: content"
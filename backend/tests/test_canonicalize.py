@@ -1,7 +1,12 @@
 """Tests for URL canonicalization."""
 
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlencode
+
+import app.services.canonicalize as canonicalize_module
+import httpx
 import pytest
-from app.services.canonicalize import CanonicalizationError, canonicalize
+from app.services.canonicalize import TRACKING_PARAMS, CanonicalizationError, canonicalize
 from httpx import Response
 
 
@@ -267,3 +272,106 @@ def test_canonicalize_strips_whitespace() -> None:
     url = "  https://example.com/path  "
     result = canonicalize(url, follow_redirects=False)
     assert result == "https://example.com/path"
+
+
+def test_canonicalize_caches_default_redirect_resolution(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that repeat URLs reuse the resolved redirect instead of refetching."""
+    calls = []
+
+    def mock_default_http_get(url: str) -> Response:
+        calls.append(url)
+        if url == "https://short.example/abc":
+            return Response(301, headers={"location": "https://example.com/article"})
+        return Response(200)
+
+    monkeypatch.setattr(canonicalize_module, "_redirect_cache", OrderedDict())
+    monkeypatch.setattr(canonicalize_module, "_default_http_get", mock_default_http_get)
+
+    first = canonicalize("https://short.example/abc")
+    second = canonicalize("https://short.example/abc")
+
+    assert first == second == "https://example.com/article"
+    assert calls == ["https://short.example/abc", "https://example.com/article"]
+
+
+def test_canonicalize_does_not_cache_failed_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a transient fetch error is retried on the next call."""
+    calls = []
+
+    def mock_default_http_get(url: str) -> Response:
+        calls.append(url)
+        raise Exception("Network error")
+
+    monkeypatch.setattr(canonicalize_module, "_redirect_cache", OrderedDict())
+    monkeypatch.setattr(canonicalize_module, "_default_http_get", mock_default_http_get)
+
+    canonicalize("https://short.example/abc")
+    canonicalize("https://short.example/abc")
+
+    assert len(calls) == 2
+
+
+def test_default_http_get_uses_head_with_get_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that redirects are probed with HEAD, retrying with GET if HEAD is rejected."""
+    methods = []
+
+    def handler(request: httpx.Request) -> Response:
+        methods.append((request.method, request.url.path))
+        if request.url.path == "/short":
+            return Response(301, headers={"location": "https://example.com/no-head"})
+        if request.method == "HEAD":
+            return Response(405)
+        return Response(200)
+
+    monkeypatch.setattr(
+        canonicalize_module, "_shared_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    assert canonicalize_module._default_http_get("https://example.com/short").status_code == 301
+    assert canonicalize_module._default_http_get("https://example.com/no-head").status_code == 200
+    assert methods == [("HEAD", "/short"), ("HEAD", "/no-head"), ("GET", "/no-head")]
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "id=42",
+        "page=",
+        "utm_source=x",
+        "Ref=home",
+        "q=a b",
+        "q=%2F",
+        "flag",
+        "b=2&a=1",
+        "b=2&a=9&a=1&utm_source=x&B=3",
+        "a=1&&b=2",
+        "a=1&b=%7E",
+    ],
+)
+def test_canonicalize_query_fast_path_matches_full_path(query: str) -> None:
+    """Test that the raw-pair fast path gives the same result as parse_qs."""
+    expected_params = [
+        (key, value)
+        for key, values in sorted(parse_qs(query, keep_blank_values=True).items())
+        if key.lower() not in TRACKING_PARAMS
+        for value in values
+    ]
+    expected_query = urlencode(expected_params)
+    expected = "https://example.com/p" + (f"?{expected_query}" if expected_query else "")
+
+    assert canonicalize(f"https://example.com/p?{query}", follow_redirects=False) == expected
+
+
+def test_canonicalize_offline_memoizes_raw_url() -> None:
+    """Test that repeated offline calls are served from the cache, but errors are not cached."""
+    url = "WWW.Example.com/cached/?utm_source=x"
+    first = canonicalize(url, follow_redirects=False)
+    hits = canonicalize_module._canonicalize_offline.cache_info().hits
+
+    assert canonicalize(url, follow_redirects=False) == first == "https://example.com/cached"
+    assert canonicalize_module._canonicalize_offline.cache_info().hits == hits + 1
+    for _ in range(2):
+        with pytest.raises(CanonicalizationError):
+            canonicalize("   ", follow_redirects=False)
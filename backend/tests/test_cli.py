@@ -5,12 +5,20 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-from app.cli import app
+from app.cli import app, load_config
 from typer.testing import CliRunner
 
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache() -> None:
+    """Re-read the config file per test since each test uses its own home dir."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
 @pytest.fixture
 def mock_config_dir(tmp_path: Path) -> Path:
     """Create a temporary config directory."""
@@ -44,7 +52,7 @@ def test_cli_version() -> None:
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_submit_review_mode(
     mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path
 ) -> None:
@@ -72,7 +80,7 @@ def test_cli_submit_review_mode(
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_submit_auto_mode(
     mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path
 ) -> None:
@@ -102,7 +110,7 @@ def test_cli_submit_auto_mode(
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_with_account(
     mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path
 ) -> None:
@@ -123,7 +131,7 @@ def test_cli_with_account(
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_with_style(mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path) -> None:
     """Test specifying style."""
     mock_home.return_value = mock_config_file.parent.parent
@@ -142,7 +150,7 @@ def test_cli_with_style(mock_post: MagicMock, mock_home: MagicMock, mock_config_
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_with_type_single(
     mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path
 ) -> None:
@@ -182,6 +190,24 @@ def test_cli_configure(mock_home: MagicMock, tmp_path: Path) -> None:
     assert config["api_url"] == "https://api.example.com"
 
 
+@patch("app.cli.Path.home")
+def test_load_config_is_cached_until_configure(
+    mock_home: MagicMock, mock_config_file: Path
+) -> None:
+    """Test that config is read once and re-read after configure saves it."""
+    mock_home.return_value = mock_config_file.parent.parent
+
+    assert load_config()["api_token"] == "test-token-123"
+
+    # Edits on disk are not picked up while cached
+    mock_config_file.write_text(json.dumps({"api_token": "edited", "api_url": "x"}))
+    assert load_config()["api_token"] == "test-token-123"
+
+    result = runner.invoke(app, ["configure"], input="new-token\nhttps://api.example.com\n")
+    assert result.exit_code == 0
+    assert load_config()["api_token"] == "new-token"
+
+
 @patch("app.cli.Path.home")
 def test_cli_no_config_file(mock_home: MagicMock, tmp_path: Path) -> None:
     """Test CLI when config file doesn't exist."""
@@ -195,7 +221,7 @@ def test_cli_no_config_file(mock_home: MagicMock, tmp_path: Path) -> None:
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_api_error(mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path) -> None:
     """Test handling API errors."""
     mock_home.return_value = mock_config_file.parent.parent
@@ -213,7 +239,7 @@ def test_cli_api_error(mock_post: MagicMock, mock_home: MagicMock, mock_config_f
 
 
 @patch("app.cli.Path.home")
-@patch("httpx.post")
+@patch("httpx.Client.post")
 def test_cli_with_all_options(
     mock_post: MagicMock, mock_home: MagicMock, mock_config_file: Path
 ) -> None:
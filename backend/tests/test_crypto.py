@@ -4,7 +4,20 @@ import base64
 import os
 
 import pytest
-from app.security.crypto import CryptoError, InvalidTokenError, seal, unseal
+from app.config import get_settings
+from app.security.crypto import (
+    CryptoError,
+    InvalidTokenError,
+    derive_token_pepper,
+    get_encryption_key,
+    hash_password,
+    hash_token,
+    seal,
+    seal_many,
+    unseal,
+    unseal_many,
+    verify_token,
+)
 
 
 @pytest.fixture
@@ -163,3 +176,55 @@ def test_seal_unicode_text(test_key: bytes) -> None:
     decrypted = unseal(sealed, test_key)
     assert decrypted == plaintext
     assert decrypted.decode("utf-8") == "Hello 世界! 🔐"
+
+
+def test_seal_many_unseal_many_roundtrip(test_key: bytes) -> None:
+    """Test batch sealing matches single unseal and uses a fresh nonce per item."""
+    plaintexts = [b"access-token", b"refresh-token", b"access-token"]
+
+    tokens = seal_many(plaintexts, test_key)
+
+    assert len(set(tokens)) == 3
+    assert [unseal(token, test_key) for token in tokens] == plaintexts
+    assert unseal_many(tokens, test_key) == plaintexts
+    assert seal_many([], test_key) == []
+
+
+def test_unseal_many_with_wrong_key_raises_error(test_key: bytes, another_key: bytes) -> None:
+    """Test batch unsealing fails if any token was sealed with another key."""
+    tokens = [seal(b"one", test_key), seal(b"two", another_key)]
+
+    with pytest.raises(InvalidTokenError):
+        unseal_many(tokens, test_key)
+
+
+def test_hash_token_verifies_only_with_same_pepper(test_key: bytes, another_key: bytes) -> None:
+    """Test HMAC token hashes verify with their pepper and no other."""
+    pepper = derive_token_pepper(test_key)
+    token_hash = hash_token("api-token", pepper)
+
+    assert verify_token("api-token", token_hash, pepper)
+    assert not verify_token("other-token", token_hash, pepper)
+    assert not verify_token("api-token", token_hash, derive_token_pepper(another_key))
+
+
+def test_verify_token_accepts_legacy_bcrypt_hash(test_key: bytes) -> None:
+    """Test tokens hashed with bcrypt before the HMAC switch still verify."""
+    pepper = derive_token_pepper(test_key)
+    legacy_hash = hash_password("api-token")
+
+    assert verify_token("api-token", legacy_hash, pepper)
+    assert not verify_token("other-token", legacy_hash, pepper)
+
+
+def test_get_encryption_key_follows_configured_key(
+    monkeypatch: pytest.MonkeyPatch, test_key: bytes, another_key: bytes
+) -> None:
+    """Test that the decoded key is cached per value, so a changed key takes effect."""
+    monkeypatch.setenv("SECRET_AES_KEY", base64.urlsafe_b64encode(test_key).decode("ascii"))
+    get_settings.cache_clear()
+    assert get_encryption_key() == test_key
+
+    monkeypatch.setenv("SECRET_AES_KEY", base64.urlsafe_b64encode(another_key).decode("ascii"))
+    get_settings.cache_clear()
+    assert get_encryption_key() == another_key
@@ -1,21 +1,29 @@
 """Tests for database models and DAO operations."""
 
+from pathlib import Path
+
 import pytest
-from app.db.base import Base
+from app.config import Settings
+from app.db.base import Base, configure_sqlite_transactions, engine_options
 from app.db.dao import (
     create_account,
     create_run,
     create_tweet,
+    create_tweets_bulk,
+    find_duplicate_run,
     get_account,
     get_account_by_handle,
+    get_account_for_update,
     get_run,
     get_runs_by_account,
     get_tweet,
     get_tweets_by_run,
 )
 from app.db.schema import AccountCreate, RunCreate, TweetCreate
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool, StaticPool
 
 
 @pytest.fixture
@@ -130,6 +138,67 @@ def test_create_and_get_tweet(db_session: Session) -> None:
     assert tweets[1].text == "Second tweet in thread"
 
 
+def test_run_scraped_text_is_not_reloaded(db_session: Session) -> None:
+    """Test that refreshing a run leaves the large scraped_text unloaded."""
+    account = create_account(db_session, AccountCreate(handle="@reader", provider="x"))
+    run = create_run(
+        db_session,
+        RunCreate(account_id=account.id, url="https://example.com/long", mode="review"),
+    )
+    run.scraped_text = "word " * 10000
+    db_session.commit()
+    db_session.refresh(run)
+
+    assert "scraped_text" not in inspect(run).dict
+    assert run.scraped_text == "word " * 10000
+
+
+def test_create_tweets_bulk(db_session: Session) -> None:
+    """Test creating a whole thread of tweets in one call."""
+    account = create_account(db_session, AccountCreate(handle="@bulk", provider="x"))
+    run = create_run(
+        db_session,
+        RunCreate(
+            account_id=account.id, url="https://example.com/test", mode="auto", type="thread"
+        ),
+    )
+
+    tweets = create_tweets_bulk(
+        db_session,
+        [
+            TweetCreate(run_id=run.id, idx=idx, role="content", text=f"Tweet {idx}")
+            for idx in range(3)
+        ],
+    )
+
+    assert [tweet.idx for tweet in tweets] == [0, 1, 2]
+    assert all(tweet.id is not None for tweet in tweets)
+
+    stored = get_tweets_by_run(db_session, run.id)
+    assert [tweet.text for tweet in stored] == ["Tweet 0", "Tweet 1", "Tweet 2"]
+
+
+def test_create_run_without_commit_rolls_back(db_session: Session) -> None:
+    """Test that commit=False leaves the run and tweets to the caller's transaction."""
+    account = create_account(db_session, AccountCreate(handle="@txn", provider="x"))
+    run = create_run(
+        db_session,
+        RunCreate(account_id=account.id, url="https://example.com/txn", mode="auto", type="thread"),
+        commit=False,
+    )
+    assert run.id is not None
+
+    create_tweets_bulk(
+        db_session,
+        [TweetCreate(run_id=run.id, idx=0, role="content", text="Tweet 0")],
+        commit=False,
+    )
+    db_session.rollback()
+
+    assert get_run(db_session, run.id) is None
+    assert get_tweets_by_run(db_session, run.id) == []
+
+
 def test_account_runs_relationship(db_session: Session) -> None:
     """Test the relationship between accounts and runs."""
     account = create_account(db_session, AccountCreate(handle="@reltest", provider="x"))
@@ -174,3 +243,89 @@ def test_run_tweets_relationship(db_session: Session) -> None:
     assert len(run.tweets) == 2
     assert tweet1 in run.tweets
     assert tweet2 in run.tweets
+
+
+def test_engine_options_size_pool_for_file_database() -> None:
+    """Test that file-backed databases get a sized, pre-pinged pool."""
+    settings = Settings(database_url="sqlite:///./data/test.db", app_env="test")
+
+    options = engine_options(settings)
+    engine = create_engine(settings.database_url, **options)
+
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == settings.db_pool_recycle
+    assert isinstance(engine.pool, QueuePool)
+    assert engine.pool.size() == settings.db_pool_size
+    engine.dispose()
+
+
+def test_engine_options_share_in_memory_connection() -> None:
+    """Test that in-memory SQLite uses a single shared connection."""
+    options = engine_options(Settings(database_url="sqlite:///:memory:", app_env="test"))
+
+    assert options["poolclass"] is StaticPool
+    assert "pool_size" not in options
+
+
+def test_account_lock_serializes_sqlite_writers(tmp_path: Path) -> None:
+    """Test that a second session cannot pass the locked duplicate check concurrently."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'lock.db'}", connect_args={"timeout": 0.1})
+    configure_sqlite_transactions(engine)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autoflush=False, bind=engine)
+    with SessionLocal() as setup:
+        account_id = create_account(setup, AccountCreate(handle="@lock", provider="x")).id
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        # The first submit holds the lock through its check and insert
+        assert get_account_for_update(first, account_id) is not None
+        assert find_duplicate_run(first, account_id, "https://example.com/a") is None
+
+        # The second submit cannot even start its check meanwhile
+        with pytest.raises(OperationalError, match="locked"):
+            get_account_for_update(second, account_id)
+        second.rollback()
+
+        run = create_run(
+            first,
+            RunCreate(account_id=account_id, url="https://example.com/a", mode="auto"),
+            commit=False,
+        )
+        run.canonical_url = "https://example.com/a"
+        run.status = "approved"
+        first.commit()
+
+        # Once the first commits, the second sees its run and would be rejected
+        get_account_for_update(second, account_id)
+        assert find_duplicate_run(second, account_id, "https://example.com/a") is not None
+    finally:
+        first.close()
+        second.close()
+        engine.dispose()
+
+
+def test_open_read_session_does_not_block_sqlite_writer(tmp_path: Path) -> None:
+    """Test that a session that has only read does not hold a lock against writers."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'read.db'}", connect_args={"timeout": 0.1})
+    configure_sqlite_transactions(engine)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autoflush=False, bind=engine)
+    with SessionLocal() as setup:
+        account_id = create_account(setup, AccountCreate(handle="@read", provider="x")).id
+
+    reader, writer = SessionLocal(), SessionLocal()
+    try:
+        # A submit reads before its long scrape/generation awaits and stays open
+        assert find_duplicate_run(reader, account_id, "https://example.com/a") is None
+
+        create_run(writer, RunCreate(account_id=account_id, url="https://example.com/b"))
+
+        assert find_duplicate_run(reader, account_id, "https://example.com/a") is None
+        # Like the submit handlers, end the read before taking the write lock
+        reader.commit()
+        assert get_account_for_update(reader, account_id) is not None
+    finally:
+        reader.close()
+        writer.close()
+        engine.dispose()
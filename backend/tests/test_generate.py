@@ -1,6 +1,11 @@
 """Tests for AI generation service."""
 
+import asyncio
+import json
+from collections import OrderedDict
+
 import pytest
+from app.services import generate as generate_module
 from app.services.generate import (
     GeneratedReference,
     GeneratedSingle,
@@ -8,6 +13,10 @@ from app.services.generate import (
     GenerationError,
     GenerationSettings,
     ScrapeResult,
+    agenerate_reference,
+    agenerate_thread,
+    agenerate_thread_with_reference,
+    astream_thread,
     build_reference_prompt,
     build_single_prompt,
     build_thread_prompt,
@@ -17,9 +26,24 @@ from app.services.generate import (
     generate_reference,
     generate_single,
     generate_thread,
+    retrieve_thread_batch,
+    submit_thread_batch,
+    wait_for_batches,
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_response_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with an empty response cache."""
+    monkeypatch.setattr(generate_module, "_response_cache", OrderedDict())
+
+
+@pytest.fixture
+def char_heuristic(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Force the chars/4 token estimate even when tiktoken is installed."""
+    monkeypatch.setattr(generate_module, "_encoding_for", lambda model: None)
+
+
 @pytest.fixture
 def sample_scrape() -> ScrapeResult:
     """Create a sample scrape result for testing."""
@@ -183,19 +207,40 @@ def mock_openai_reference():
     return MockClient()
 
 
-def test_estimate_tokens() -> None:
+def test_estimate_tokens(char_heuristic) -> None:
     """Test token estimation (rough approximation)."""
     text = "This is a test string"  # 21 chars
     tokens = estimate_tokens(text)
     assert tokens == 5  # 21 // 4
 
 
-def test_estimate_tokens_empty() -> None:
+def test_estimate_tokens_empty(char_heuristic) -> None:
     """Test token estimation with empty string."""
     assert estimate_tokens("") == 0
 
 
-def test_estimate_cost_gpt4o_mini() -> None:
+def test_estimate_tokens_uses_model_encoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a loaded tokenizer is used for the count and the cost."""
+
+    class FakeEncoding:
+        def encode(self, text, disallowed_special=()):
+            return text.split()
+
+    seen = []
+
+    def fake_encoding_for(model):
+        seen.append(model)
+        return FakeEncoding()
+
+    monkeypatch.setattr(generate_module, "_encoding_for", fake_encoding_for)
+
+    assert estimate_tokens("one two three") == 3
+    cost = estimate_cost("one two three four", expected_output_tokens=0, model="gpt-4o")
+    assert cost == pytest.approx(4 * 2.50 / 1_000_000)
+    assert seen == ["gpt-4o-mini", "gpt-4o"]
+
+
+def test_estimate_cost_gpt4o_mini(char_heuristic) -> None:
     """Test cost estimation for gpt-4o-mini."""
     prompt = "a" * 400  # 400 chars = ~100 tokens
     cost = estimate_cost(prompt, expected_output_tokens=50, model="gpt-4o-mini")
@@ -203,7 +248,7 @@ def test_estimate_cost_gpt4o_mini() -> None:
     assert cost == pytest.approx(0.000045, rel=1e-6)
 
 
-def test_estimate_cost_gpt4o() -> None:
+def test_estimate_cost_gpt4o(char_heuristic) -> None:
     """Test cost estimation for gpt-4o."""
     prompt = "a" * 400  # 400 chars = ~100 tokens
     cost = estimate_cost(prompt, expected_output_tokens=50, model="gpt-4o")
@@ -275,6 +320,136 @@ def test_build_reference_prompt(sample_scrape: ScrapeResult) -> None:
     assert "TechBlog" in prompt
 
 
+def test_build_prompts_share_static_prefix(
+    sample_scrape: ScrapeResult, long_scrape: ScrapeResult
+) -> None:
+    """Test that prompts with the same settings start with the same instructions."""
+    settings = GenerationSettings(mode="thread", style="casual", hook=True)
+
+    first = build_thread_prompt(sample_scrape, settings)
+    second = build_thread_prompt(long_scrape, settings)
+
+    prefix = first[: first.index("Article Title:")]
+    assert second.startswith(prefix)
+    assert '"hook_used": true' in prefix
+    assert sample_scrape.title not in prefix
+    assert build_single_prompt(long_scrape, settings).index("Article Title:") > 0
+    assert build_reference_prompt(long_scrape).index("Article Title:") > 0
+
+
+def test_generate_records_cached_tokens(sample_scrape: ScrapeResult) -> None:
+    """Test that cached prompt tokens reported by OpenAI are kept on the result."""
+    from types import SimpleNamespace
+
+    from app.services.generate import GeneratedReferenceSchema
+
+    completion = SimpleNamespace(
+        choices=[
+            SimpleNamespace(message=SimpleNamespace(parsed=GeneratedReferenceSchema(text="Ref")))
+        ],
+        usage=SimpleNamespace(
+            prompt_tokens=1200,
+            completion_tokens=10,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+        ),
+    )
+    client = SimpleNamespace(
+        beta=SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(parse=lambda **kwargs: completion))
+        )
+    )
+
+    result = generate_reference(sample_scrape, openai_client=client)
+
+    assert result.tokens_in == 1200
+    assert result.tokens_cached == 1024
+
+
+def test_generate_thread_shortens_oversize_tweets(sample_scrape: ScrapeResult) -> None:
+    """Test that only oversize tweets are re-asked, without the article body."""
+    from types import SimpleNamespace
+
+    from app.services.generate import (
+        GeneratedThreadSchema,
+        ShortenedTweetsSchema,
+        TweetSchema,
+    )
+
+    prompts: list[str] = []
+
+    def parse(**kwargs):
+        prompts.append(kwargs["messages"][0]["content"])
+        if kwargs["response_format"] is ShortenedTweetsSchema:
+            parsed = ShortenedTweetsSchema(tweets=[TweetSchema(text="Short 2/2")])
+            usage = SimpleNamespace(prompt_tokens=80, completion_tokens=10)
+        else:
+            parsed = GeneratedThreadSchema(
+                tweets=[TweetSchema(text="Fine 1/2"), TweetSchema(text="x" * 300)]
+            )
+            usage = SimpleNamespace(prompt_tokens=500, completion_tokens=150)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))], usage=usage
+        )
+
+    client = SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=parse)))
+    )
+
+    result = generate_thread(sample_scrape, GenerationSettings(), openai_client=client)
+
+    assert result.tweets == ["Fine 1/2", "Short 2/2"]
+    assert result.tokens_in == 580
+    assert result.tokens_out == 160
+    assert len(prompts) == 2
+    assert "x" * 300 in prompts[1]
+    assert sample_scrape.text not in prompts[1]
+    assert "Fine 1/2" not in prompts[1]
+
+
+@pytest.mark.parametrize(
+    ("rewrites", "expected"),
+    [
+        ([], "x" * 300),
+        (["Short 2/3", "Short 3/3"], "x" * 300),
+        (["y" * 290], "y" * 290),
+        (["z" * 310], "x" * 300),
+    ],
+    ids=["missing", "extra", "still-oversize", "longer"],
+)
+def test_generate_thread_keeps_thread_on_bad_shorten_response(
+    sample_scrape: ScrapeResult, rewrites: list[str], expected: str
+) -> None:
+    """Test that unusable rewrites fall back to the original tweet instead of failing."""
+    from types import SimpleNamespace
+
+    from app.services.generate import (
+        GeneratedThreadSchema,
+        ShortenedTweetsSchema,
+        TweetSchema,
+    )
+
+    def parse(**kwargs):
+        if kwargs["response_format"] is ShortenedTweetsSchema:
+            parsed = ShortenedTweetsSchema(tweets=[TweetSchema(text=text) for text in rewrites])
+        else:
+            parsed = GeneratedThreadSchema(
+                tweets=[TweetSchema(text="Fine 1/2"), TweetSchema(text="x" * 300)]
+            )
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=10)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))], usage=usage
+        )
+
+    client = SimpleNamespace(
+        beta=SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(parse=parse)))
+    )
+
+    result = generate_thread(sample_scrape, GenerationSettings(), openai_client=client)
+
+    assert result.tweets == ["Fine 1/2", expected]
+    assert result.tokens_in == 200  # The shorten call is still paid for
+
+
 def test_generate_thread_success(sample_scrape: ScrapeResult, mock_openai_thread) -> None:
     """Test successful thread generation."""
     settings = GenerationSettings(mode="thread", style="conversational", hook=True)
@@ -422,3 +597,446 @@ def test_generate_with_budget_check(sample_scrape: ScrapeResult, mock_openai_thr
     # Now generate (should succeed because it's within budget)
     result = generate_thread(sample_scrape, settings, openai_client=mock_openai_thread)
     assert result.cost_usd > 0
+
+
+class MockAsyncOpenAI:
+    """Async OpenAI stand-in that answers from the sync mocks after a short delay."""
+
+    def __init__(self, thread_client, reference_client, delay: float = 0.05):
+        self.beta = self
+        self.chat = self
+        self.completions = self
+        self.thread_client = thread_client
+        self.reference_client = reference_client
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def parse(self, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if kwargs["response_format"].__name__ == "GeneratedReferenceSchema":
+            return self.reference_client.beta.chat.completions.parse(**kwargs)
+        return self.thread_client.beta.chat.completions.parse(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_agenerate_thread_matches_sync(
+    sample_scrape: ScrapeResult, mock_openai_thread, mock_openai_reference
+) -> None:
+    """Test that the async thread variant returns the same result as the sync one."""
+    settings = GenerationSettings(mode="thread")
+    client = MockAsyncOpenAI(mock_openai_thread, mock_openai_reference)
+
+    result = await agenerate_thread(sample_scrape, settings, openai_client=client)
+
+    assert result == generate_thread(
+        sample_scrape, settings, openai_client=mock_openai_thread, use_cache=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_agenerate_reference_success(
+    sample_scrape: ScrapeResult, mock_openai_thread, mock_openai_reference
+) -> None:
+    """Test async reference generation."""
+    client = MockAsyncOpenAI(mock_openai_thread, mock_openai_reference)
+
+    result = await agenerate_reference(sample_scrape, openai_client=client)
+
+    assert result == generate_reference(
+        sample_scrape, openai_client=mock_openai_reference, use_cache=False
+    )
+
+
+@pytest.mark.asyncio
+async def test_agenerate_thread_with_reference_runs_concurrently(
+    sample_scrape: ScrapeResult, mock_openai_thread, mock_openai_reference
+) -> None:
+    """Test that the thread and reference requests are in flight at the same time."""
+    client = MockAsyncOpenAI(mock_openai_thread, mock_openai_reference)
+
+    thread, reference = await agenerate_thread_with_reference(
+        sample_scrape, GenerationSettings(mode="thread"), openai_client=client
+    )
+
+    assert len(thread.tweets) == 3
+    assert reference.model_used == "gpt-4o-mini"
+    assert client.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_agenerate_with_api_error(sample_scrape: ScrapeResult) -> None:
+    """Test that async API errors are wrapped like the sync ones."""
+
+    class MockBrokenAsyncClient:
+        def __init__(self):
+            self.beta = self
+            self.chat = self
+            self.completions = self
+
+        async def parse(self, **kwargs):
+            raise Exception("API connection failed")
+
+    with pytest.raises(GenerationError, match="OpenAI API error"):
+        await agenerate_thread(
+            sample_scrape, GenerationSettings(mode="thread"), openai_client=MockBrokenAsyncClient()
+        )
+
+
+class CountingClient:
+    """Wrap a mock OpenAI client and count parse calls."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.calls = 0
+        self.beta = self
+        self.chat = self
+        self.completions = self
+
+    def parse(self, **kwargs):
+        self.calls += 1
+        return self.inner.beta.chat.completions.parse(**kwargs)
+
+
+def test_generate_reuses_cached_response(sample_scrape: ScrapeResult, mock_openai_thread) -> None:
+    """Test that an identical prompt is answered from the cache at no cost."""
+    settings = GenerationSettings(mode="thread")
+    client = CountingClient(mock_openai_thread)
+
+    first = generate_thread(sample_scrape, settings, openai_client=client)
+    second = generate_thread(sample_scrape, settings, openai_client=client)
+
+    assert client.calls == 1
+    assert second.tweets == first.tweets
+    assert second.cached is True
+    assert second.cost_usd == 0
+    assert first.cached is False
+
+
+def test_generate_reference_reused_across_article_text(mock_openai_reference) -> None:
+    """Test that a reference for the same title, site and author is not regenerated."""
+    client = CountingClient(mock_openai_reference)
+    original = ScrapeResult(
+        title="T", text="First draft", word_count=2, site_name="Blog", author="Ann"
+    )
+    edited = ScrapeResult(
+        title="T", text="Edited body text", word_count=3, site_name="Blog", author="Ann"
+    )
+
+    generate_reference(original, openai_client=client)
+    result = generate_reference(edited, openai_client=client)
+
+    assert client.calls == 1
+    assert result.cached is True
+    assert result.cost_usd == 0
+
+
+def test_generate_bypasses_cache_when_disabled(
+    sample_scrape: ScrapeResult, mock_openai_thread
+) -> None:
+    """Test that use_cache=False always calls the API (regenerate flows)."""
+    settings = GenerationSettings(mode="thread")
+    client = CountingClient(mock_openai_thread)
+
+    generate_thread(sample_scrape, settings, openai_client=client)
+    result = generate_thread(sample_scrape, settings, openai_client=client, use_cache=False)
+
+    assert client.calls == 2
+    assert result.cached is False
+
+
+def test_generate_cache_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch, mock_openai_reference
+) -> None:
+    """Test that the response cache is bounded."""
+    monkeypatch.setattr(generate_module, "_RESPONSE_CACHE_MAXSIZE", 2)
+    client = CountingClient(mock_openai_reference)
+
+    for title in ("A", "B", "C", "A"):
+        generate_reference(ScrapeResult(title=title, text="", word_count=0), openai_client=client)
+
+    assert client.calls == 4
+    assert len(generate_module._response_cache) == 2
+
+
+def test_generate_bounds_output_and_seeds_cached_requests(
+    sample_scrape: ScrapeResult, mock_openai_single
+) -> None:
+    """Test that requests cap output tokens, lower temperature and seed by prompt."""
+    calls = []
+
+    class RecordingClient(CountingClient):
+        def parse(self, **kwargs):
+            calls.append(kwargs)
+            return super().parse(**kwargs)
+
+    settings = GenerationSettings(mode="single")
+    client = RecordingClient(mock_openai_single)
+
+    generate_single(sample_scrape, settings, openai_client=client)
+    generate_single(sample_scrape, settings, openai_client=client, use_cache=False)
+
+    assert calls[0]["max_tokens"] == 250
+    assert calls[0]["temperature"] == 0.2
+    assert isinstance(calls[0]["seed"], int)
+    assert "seed" not in calls[1]  # Regenerate requests stay unseeded
+
+
+class FakeBatchClient:
+    """In-memory stand-in for the OpenAI files and batches endpoints."""
+
+    def __init__(self, statuses: list[str] | None = None, malformed: set[str] | None = None):
+        self.files = self
+        self.batches = self
+        self.uploads: dict[str, list[dict]] = {}
+        self.statuses = statuses or ["completed"]
+        self.malformed = malformed or set()  # Article indices answered with bad JSON
+        self.retrievals = 0
+
+    # files.create / batches.create share the client, told apart by kwargs
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        if "file" in kwargs:
+            file_id = f"file-{len(self.uploads)}"
+            _, data = kwargs["file"]
+            self.uploads[file_id] = [json.loads(line) for line in data.decode().splitlines()]
+            return SimpleNamespace(id=file_id)
+        return SimpleNamespace(id=kwargs["input_file_id"].replace("file", "batch"))
+
+    def retrieve(self, batch_id):
+        from types import SimpleNamespace
+
+        status = self.statuses[min(self.retrievals, len(self.statuses) - 1)]
+        self.retrievals += 1
+        return SimpleNamespace(
+            status=status, output_file_id=batch_id.replace("batch", "file") + "-out"
+        )
+
+    def content(self, file_id):
+        from types import SimpleNamespace
+
+        lines = []
+        for request in self.uploads[file_id.removesuffix("-out")]:
+            idx = request["custom_id"].split(":")[0]
+            tweets = [{"text": f"Article {idx} tweet"}]
+            content = "{not json" if idx in self.malformed else json.dumps({"tweets": tweets})
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": request["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": {
+                                "choices": [{"message": {"content": content}}],
+                                "usage": {"prompt_tokens": 1000, "completion_tokens": 100},
+                            },
+                        },
+                        "error": None,
+                    }
+                )
+            )
+        return SimpleNamespace(text="\n".join(lines))
+
+
+def test_submit_thread_batch_groups_requests_by_model(
+    sample_scrape: ScrapeResult, long_scrape: ScrapeResult
+) -> None:
+    """Test that batch requests are split into one batch per model."""
+    client = FakeBatchClient()
+
+    batch_ids = submit_thread_batch(
+        [sample_scrape, long_scrape, sample_scrape], GenerationSettings(), openai_client=client
+    )
+
+    assert len(batch_ids) == 2
+    models = {
+        request["body"]["model"]: [r["custom_id"] for r in requests]
+        for requests in client.uploads.values()
+        for request in requests[:1]
+    }
+    assert models == {"gpt-4o-mini": ["0:gpt-4o-mini", "2:gpt-4o-mini"], "gpt-4o": ["1:gpt-4o"]}
+
+
+def test_submit_thread_batch_request_body(sample_scrape: ScrapeResult) -> None:
+    """Test the exact batch request line, including the strict thread schema."""
+    client = FakeBatchClient()
+    settings = GenerationSettings()
+
+    submit_thread_batch([sample_scrape], settings, openai_client=client)
+
+    (request,) = next(iter(client.uploads.values()))
+    assert request == {
+        "custom_id": "0:gpt-4o-mini",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": build_thread_prompt(sample_scrape, settings)}],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "GeneratedThreadSchema",
+                    "strict": True,
+                    "schema": {
+                        "$defs": {
+                            "TweetSchema": {
+                                "description": "Schema for a single tweet in a thread.",
+                                "properties": {
+                                    "text": {
+                                        "description": "Tweet text content",
+                                        "title": "Text",
+                                        "type": "string",
+                                    }
+                                },
+                                "required": ["text"],
+                                "title": "TweetSchema",
+                                "type": "object",
+                                "additionalProperties": False,
+                            }
+                        },
+                        "description": "Schema for generated thread output.",
+                        "properties": {
+                            "tweets": {
+                                "description": "List of tweets in the thread",
+                                "items": {"$ref": "#/$defs/TweetSchema"},
+                                "title": "Tweets",
+                                "type": "array",
+                            },
+                            "style_used": {
+                                "anyOf": [{"type": "string"}, {"type": "null"}],
+                                "description": "Style applied (if any)",
+                                "title": "Style Used",
+                            },
+                            "hook_used": {
+                                "default": False,
+                                "description": "Whether a hook was used",
+                                "title": "Hook Used",
+                                "type": "boolean",
+                            },
+                        },
+                        "required": ["tweets", "style_used", "hook_used"],
+                        "title": "GeneratedThreadSchema",
+                        "type": "object",
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "max_tokens": 1500,
+            "temperature": 0.2,
+        },
+    }
+
+
+def test_retrieve_thread_batch_maps_results_and_discounts_cost(
+    sample_scrape: ScrapeResult, long_scrape: ScrapeResult
+) -> None:
+    """Test that batch results come back keyed by article index at half cost."""
+    client = FakeBatchClient()
+    batch_ids = submit_thread_batch(
+        [sample_scrape, long_scrape], GenerationSettings(), openai_client=client
+    )
+
+    result = retrieve_thread_batch(batch_ids, openai_client=client)
+
+    assert result.threads[0].tweets == ["Article 0 tweet"]
+    assert result.threads[1].model_used == "gpt-4o"
+    expected = (1000 * 0.150 / 1_000_000 + 100 * 0.600 / 1_000_000) * 0.5
+    assert result.threads[0].cost_usd == pytest.approx(expected)
+    assert result.failed == {}
+
+
+def test_retrieve_thread_batch_reports_malformed_output(sample_scrape: ScrapeResult) -> None:
+    """Test that an article with unparseable output is reported instead of dropped."""
+    client = FakeBatchClient(malformed={"1"})
+    batch_ids = submit_thread_batch(
+        [sample_scrape, sample_scrape], GenerationSettings(), openai_client=client
+    )
+
+    result = retrieve_thread_batch(batch_ids, openai_client=client)
+
+    assert list(result.threads) == [0]
+    assert list(result.failed) == [1]
+    assert result.failed[1].startswith("Malformed output")
+
+
+def test_wait_for_batches_polls_until_complete() -> None:
+    """Test that waiting polls with the injected sleeper until completion."""
+    client = FakeBatchClient(statuses=["validating", "in_progress", "completed"])
+    sleeps: list[float] = []
+
+    wait_for_batches(["batch-0"], openai_client=client, poll_interval=5, sleeper=sleeps.append)
+
+    assert sleeps == [5, 5]
+
+
+def test_wait_for_batches_raises_on_failure() -> None:
+    """Test that a failed batch raises GenerationError."""
+    client = FakeBatchClient(statuses=["failed"])
+
+    with pytest.raises(GenerationError, match="failed"):
+        wait_for_batches(["batch-0"], openai_client=client, sleeper=lambda seconds: None)
+
+
+class FakeStreamClient:
+    """AsyncOpenAI stand-in whose stream replays partial parses of a thread."""
+
+    def __init__(self, tweets: list[str], log: list[str]):
+        self.beta = self
+        self.chat = self
+        self.completions = self
+        self.tweets = tweets
+        self.log = log
+
+    def stream(self, **kwargs):
+        from types import SimpleNamespace
+
+        from app.services.generate import GeneratedThreadSchema, TweetSchema
+
+        client = self
+
+        class Stream:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def __aiter__(self):
+                for count in range(1, len(client.tweets) + 1):
+                    client.log.append(f"chunk {count}")
+                    partial = {"tweets": [{"text": text} for text in client.tweets[:count]]}
+                    yield SimpleNamespace(type="content.delta", parsed=partial)
+
+            async def get_final_completion(self):
+                parsed = GeneratedThreadSchema(
+                    tweets=[TweetSchema(text=text) for text in client.tweets]
+                )
+                return SimpleNamespace(
+                    choices=[SimpleNamespace(message=SimpleNamespace(parsed=parsed))],
+                    usage=SimpleNamespace(prompt_tokens=500, completion_tokens=150),
+                )
+
+        return Stream()
+
+
+@pytest.mark.asyncio
+async def test_astream_thread_yields_tweets_before_stream_ends(
+    sample_scrape: ScrapeResult,
+) -> None:
+    """Test that completed tweets are yielded while later ones are still streaming."""
+    log: list[str] = []
+    results: list[GeneratedThread] = []
+    client = FakeStreamClient(["One 1/3", "Two 2/3", "Three 3/3"], log)
+
+    async for tweet in astream_thread(
+        sample_scrape, GenerationSettings(), openai_client=client, on_done=results.append
+    ):
+        log.append(tweet)
+
+    assert log == ["chunk 1", "chunk 2", "One 1/3", "chunk 3", "Two 2/3", "Three 3/3"]
+    assert results[0].tweets == ["One 1/3", "Two 2/3", "Three 3/3"]
+    assert results[0].tokens_in == 500
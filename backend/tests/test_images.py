@@ -1,12 +1,17 @@
 """Tests for hero image selection and processing."""
 
 import io
+from typing import Any
 
+import httpx
 import pytest
+from app.services import images as images_module
 from app.services.images import (
     ImageError,
     ProcessedImage,
+    alt_text_batch,
     alt_text_from,
+    avalidate_and_process,
     pick_hero,
     validate_and_process,
 )
@@ -101,6 +106,25 @@ def test_validate_and_process_downscales_large_image() -> None:
     assert result.format == "JPEG"
 
 
+def test_validate_and_process_shrinks_jpeg_while_decoding(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that very large JPEGs are reduced by the decoder before resizing."""
+    monkeypatch.setattr(images_module, "pyvips", None)
+    http_get = mock_http_get(create_test_image(4000, 3000))
+    resized_from = []
+    original_resize = Image.Image.resize
+
+    def spy_resize(self, size, *args, **kwargs):
+        resized_from.append(self.size)
+        return original_resize(self, size, *args, **kwargs)
+
+    monkeypatch.setattr(Image.Image, "resize", spy_resize)
+
+    result = validate_and_process("https://example.com/huge.jpg", http_get=http_get)
+
+    assert (result.width, result.height) == (1600, 1200)
+    assert resized_from == [(2000, 1500)]
+
+
 def test_validate_and_process_rejects_small_image() -> None:
     """Test that images below minimum width are rejected."""
     # Create 500x300 image (below 800px minimum)
@@ -282,6 +306,21 @@ def test_alt_text_custom_max_length() -> None:
     assert result.startswith("Test Title")
 
 
+def test_alt_text_batch_matches_alt_text_from() -> None:
+    """Test that the batch variant returns the same alt texts as per-call generation."""
+    titles = ["  Test Title  ", "A" * 150, "A" * 110, "Great Article"]
+    ledes = ["  Test lede  ", None, "Short summary", "B" * 100]
+
+    result = alt_text_batch(titles, ledes, max_length=120)
+
+    assert result == [
+        alt_text_from(t, lede, max_length=120) for t, lede in zip(titles, ledes, strict=True)
+    ]
+    assert alt_text_batch(["Only Title"]) == ["Only Title"]
+    with pytest.raises(ValueError):
+        alt_text_batch(["One", "Two"], ["Lede"])
+
+
 def test_validate_and_process_maintains_aspect_ratio() -> None:
     """Test that aspect ratio is maintained during downscaling."""
     # Create 1800x900 image (2:1 aspect ratio)
@@ -313,3 +352,144 @@ def test_validate_and_process_palette_mode_conversion() -> None:
     img = Image.open(io.BytesIO(result.data))
     assert img.mode == "RGB"
     assert result.format == "JPEG"
+
+
+def test_shared_client_is_reused() -> None:
+    """Test that default downloads go through one pooled client."""
+    images_module._shared_client = None
+    try:
+        client = images_module._get_shared_client()
+
+        assert images_module._get_shared_client() is client
+        assert client.follow_redirects is True
+        assert "Mozilla" in client.headers["User-Agent"]
+    finally:
+        images_module._shared_client = None
+
+
+def _stream_client(content: bytes, requested: list[str], headers: dict | None = None) -> Any:
+    """Create an httpx client that serves content and records requested URLs."""
+
+    def handler(request: httpx.Request) -> Response:
+        requested.append(str(request.url))
+        return Response(200, content=content, headers=headers)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_default_download_uses_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that validate_and_process downloads through the shared client by default."""
+    requested: list[str] = []
+    client = _stream_client(create_test_image(1000, 500), requested)
+    monkeypatch.setattr(images_module, "_shared_client", client)
+
+    result = validate_and_process("https://example.com/a.jpg")
+    validate_and_process("https://example.com/b.jpg")
+
+    assert result.width == 1000
+    assert requested == ["https://example.com/a.jpg", "https://example.com/b.jpg"]
+
+
+def test_default_download_rejects_small_image_from_header(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a narrow image is rejected before the whole body is read."""
+    small = create_test_image(400, 300)
+    body = small + b"\0" * (4 * images_module._STREAM_CHUNK_SIZE)
+    chunks_read = []
+
+    class CountingStream(httpx.SyncByteStream):
+        def __iter__(self):
+            for start in range(0, len(body), images_module._STREAM_CHUNK_SIZE):
+                chunks_read.append(start)
+                yield body[start : start + images_module._STREAM_CHUNK_SIZE]
+
+    client = httpx.Client(
+        transport=httpx.MockTransport(lambda request: Response(200, stream=CountingStream()))
+    )
+    monkeypatch.setattr(images_module, "_shared_client", client)
+
+    with pytest.raises(ImageError, match="too small"):
+        validate_and_process("https://example.com/small.jpg")
+
+    assert len(chunks_read) == 1
+
+
+def test_default_download_enforces_size_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that downloads over the byte cap are rejected."""
+    monkeypatch.setattr(images_module, "_MAX_IMAGE_BYTES", 1024)
+    image_data = create_test_image(1000, 500)
+    monkeypatch.setattr(images_module, "_shared_client", _stream_client(image_data, []))
+
+    with pytest.raises(ImageError, match="too large"):
+        validate_and_process("https://example.com/big.jpg")
+
+
+def test_vips_and_pillow_paths_agree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the libvips fast path matches the Pillow output dimensions."""
+    pytest.importorskip("pyvips")
+    image_data = create_test_image(3000, 2000, with_exif=True)
+    http_get = mock_http_get(image_data)
+
+    fast = validate_and_process("https://example.com/a.jpg", http_get=http_get)
+    monkeypatch.setattr(images_module, "pyvips", None)
+    slow = validate_and_process("https://example.com/a.jpg", http_get=http_get)
+
+    assert (fast.width, fast.height) == (slow.width, slow.height) == (1600, 1066)
+    assert Image.open(io.BytesIO(fast.data)).getexif() == {}
+
+
+@pytest.mark.asyncio
+async def test_avalidate_and_process_uses_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the async variant downloads, then processes in the process pool."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    requested: list[str] = []
+    monkeypatch.setattr(
+        images_module, "_shared_client", _stream_client(create_test_image(2000, 1000), requested)
+    )
+    pool = ThreadPoolExecutor(max_workers=1)  # Stands in for the process pool
+    monkeypatch.setattr(images_module, "_get_process_pool", lambda: pool)
+    submitted = []
+    original_submit = pool.submit
+
+    def spy_submit(fn, *args, **kwargs):
+        submitted.append(fn)
+        return original_submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(pool, "submit", spy_submit)
+
+    result = await avalidate_and_process("https://example.com/a.jpg")
+
+    assert (result.width, result.height) == (1600, 800)
+    assert requested == ["https://example.com/a.jpg"]
+    assert submitted == [images_module._process_image]
+    pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_avalidate_and_process_in_real_process_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that processing errors cross the process boundary as ImageError."""
+    monkeypatch.setattr(images_module, "_shared_client", _stream_client(b"not an image" * 100, []))
+
+    with pytest.raises(ImageError, match="Failed to process image"):
+        await avalidate_and_process("https://example.com/broken.jpg")
+
+
+def test_process_pool_sized_from_settings_and_shut_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the pool takes its size from settings and is released on shutdown."""
+    from app.config import get_settings
+
+    monkeypatch.setenv("IMAGE_PROCESS_WORKERS", "1")
+    get_settings.cache_clear()
+    monkeypatch.setattr(images_module, "_process_pool", None)
+
+    pool = images_module._get_process_pool()
+    assert pool._max_workers == 1
+    assert images_module._get_process_pool() is pool
+
+    images_module.shutdown_process_pool()
+
+    assert images_module._process_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(abs, -1)
@@ -1,7 +1,14 @@
 """Tests for the length service HTTP client."""
 
+import json as jsonlib
+
+import httpx
 import pytest
-from app.clients.length_client import LengthClient
+from app.clients.length_client import (
+    AsyncLengthClient,
+    LengthClient,
+    LengthServiceError,
+)
 
 
 @pytest.fixture
@@ -25,7 +32,7 @@ def mock_httpx_client(monkeypatch: pytest.MonkeyPatch) -> list:
         def __init__(self, *args, **kwargs):
             pass
 
-        def post(self, url: str, json: dict):
+        def post(self, url: str, json: dict, **kwargs):
             requests.append({"url": url, "json": json})
 
             # Return mocked responses based on the request
@@ -58,9 +65,10 @@ def mock_httpx_client(monkeypatch: pytest.MonkeyPatch) -> list:
         def close(self):
             pass
 
-    import httpx
+    from app.clients import length_client
 
     monkeypatch.setattr(httpx, "Client", MockClient)
+    monkeypatch.setattr(length_client, "_shared_client", None)
     return requests
 
 
@@ -76,8 +84,8 @@ def test_length_client_check_valid_text(mock_httpx_client: list) -> None:
 
     # Verify request was made
     assert len(mock_httpx_client) == 1
-    assert mock_httpx_client[0]["url"] == "http://test:8080/length/check"
-    assert mock_httpx_client[0]["json"] == {"text": "Hello world"}
+    assert mock_httpx_client[0]["url"] == "http://test:8080/length/batch"
+    assert mock_httpx_client[0]["json"] == {"texts": ["Hello world"]}
 
 
 def test_length_client_check_empty_text(mock_httpx_client: list) -> None:
@@ -146,3 +154,109 @@ def test_length_client_strips_trailing_slash() -> None:
     """Test that trailing slash is removed from base URL."""
     client = LengthClient(base_url="http://test:8080/")
     assert client.base_url == "http://test:8080"
+
+
+def test_length_client_instances_share_http_client(mock_httpx_client: list) -> None:
+    """Test that clients reuse one pooled HTTP client across instances."""
+    first = LengthClient(base_url="http://test:8080")
+    second = LengthClient(base_url="http://test:8080")
+    first.close()
+
+    assert first._client is second._client
+
+    second.check("Still usable after close")
+    assert len(mock_httpx_client) == 1
+
+
+def test_length_client_uses_injected_client() -> None:
+    """Test that an explicitly injected HTTP client is used."""
+    injected = httpx.Client()
+    client = LengthClient(base_url="http://test:8080", client=injected)
+
+    assert client._client is injected
+    injected.close()
+
+
+def _mock_length_transport(requests: list) -> httpx.MockTransport:
+    """Build a MockTransport that mimics the Node length service."""
+
+    def result_for(text: str) -> dict:
+        return {
+            "isValid": 0 < len(text) <= 280,
+            "weightedLength": len(text),
+            "permillage": int((len(text) / 280) * 1000),
+            "validRange": {"start": 0, "end": 280},
+        }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = jsonlib.loads(request.content)
+        requests.append({"url": str(request.url), "json": body})
+        if not all(isinstance(text, str) for text in body["texts"]):
+            return httpx.Response(400, json={"error": "all texts must be strings"})
+        return httpx.Response(200, json={"results": [result_for(t) for t in body["texts"]]})
+
+    return httpx.MockTransport(handler)
+
+
+def _refuse_connection(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("Connection refused", request=request)
+
+
+@pytest.mark.parametrize(
+    ("handler", "message"),
+    [
+        (_refuse_connection, "Failed to check batch lengths"),
+        (lambda request: httpx.Response(503, text="down"), "Failed to check batch lengths"),
+        (lambda request: httpx.Response(400, text="bad"), "Invalid request: bad"),
+        (lambda request: httpx.Response(200, text="<html>"), "Malformed response"),
+        (lambda request: httpx.Response(200, json={"results": []}), "0 results for 1"),
+    ],
+    ids=["unreachable", "server-error", "bad-request-text", "not-json", "missing-result"],
+)
+def test_length_client_check_failure_raises_length_service_error(handler, message: str) -> None:
+    """Test that every failure of check surfaces as LengthServiceError."""
+    with httpx.Client(transport=httpx.MockTransport(handler)) as http:
+        client = LengthClient(base_url="http://test:8080", client=http)
+        with pytest.raises(LengthServiceError, match=message):
+            client.check("Hello world")
+
+
+async def test_async_length_client_check() -> None:
+    """Test checking a tweet with the async client."""
+    requests: list = []
+    async with httpx.AsyncClient(transport=_mock_length_transport(requests)) as http:
+        client = AsyncLengthClient(base_url="http://test:8080", client=http)
+        result = await client.check("Hello world")
+
+    assert result.is_valid is True
+    assert result.weighted_length == 11
+    assert requests == [
+        {"url": "http://test:8080/length/batch", "json": {"texts": ["Hello world"]}}
+    ]
+
+
+async def test_async_length_client_check_batch() -> None:
+    """Test checking several tweets in one async request."""
+    requests: list = []
+    async with httpx.AsyncClient(transport=_mock_length_transport(requests)) as http:
+        client = AsyncLengthClient(base_url="http://test:8080", client=http)
+        results = await client.check_batch(["First", "a" * 300])
+
+    assert [r.is_valid for r in results] == [True, False]
+    assert len(requests) == 1
+
+
+async def test_async_length_client_bad_request() -> None:
+    """Test that a 400 from the service raises LengthServiceError."""
+    async with httpx.AsyncClient(transport=_mock_length_transport([])) as http:
+        client = AsyncLengthClient(base_url="http://test:8080", client=http)
+        with pytest.raises(LengthServiceError, match="Invalid request"):
+            await client.check_batch(["ok", None])  # type: ignore[list-item]
+
+
+async def test_async_length_client_leaves_shared_client_open() -> None:
+    """Test that closing the wrapper does not close an injected shared client."""
+    async with httpx.AsyncClient(transport=_mock_length_transport([])) as http:
+        async with AsyncLengthClient(base_url="http://test:8080", client=http):
+            pass
+        assert http.is_closed is False
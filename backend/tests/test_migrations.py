@@ -82,6 +82,8 @@ def test_migrations_upgrade_head(temp_db: str) -> None:
         "tokens_out",
     }
     assert expected_runs_cols.issubset(runs_columns)
+    runs_indexes = {index["name"] for index in inspector.get_indexes("runs")}
+    assert "ix_runs_dup" in runs_indexes
 
     # Verify tweets table has expected columns
     tweets_columns = {col["name"] for col in inspector.get_columns("tweets")}
@@ -4,10 +4,13 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+import httpx
 import pytest
+from app.services import post_x as post_x_module
 from app.services.post_x import (
     PostError,
     RateLimitError,
+    apost_single,
     post_single,
     post_thread,
 )
@@ -414,3 +417,162 @@ async def test_post_thread_rate_limit_retry() -> None:
     # Assert
     assert result.success is True
     assert call_count == 2  # Rate limited once, then succeeded
+
+
+@pytest.mark.asyncio
+async def test_apost_single_awaits_async_http_post() -> None:
+    """Test that apost_single works with an async HTTP function."""
+    # Arrange
+    sync_post = mock_http_post_success("5555555555")
+
+    async def async_post(url: str, **kwargs: Any) -> MockResponse:
+        return sync_post(url, **kwargs)
+
+    # Act
+    result = await apost_single(
+        "test_token_123", "Async tweet", media=b"image_data", http_post=async_post
+    )
+
+    # Assert
+    assert result.success is True
+    assert result.tweet_id == "5555555555"
+
+
+@pytest.mark.asyncio
+async def test_apost_single_backs_off_with_sleeper() -> None:
+    """Test that retry backoff is awaited instead of blocking the event loop."""
+    # Arrange
+    sleep_calls: list[float] = []
+
+    async def sleeper_track(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    # Act & Assert
+    with pytest.raises(PostError, match="Failed to post tweet"):
+        await apost_single(
+            "test_token_123",
+            "This will fail",
+            http_post=mock_http_post_failure(500),
+            sleeper=sleeper_track,
+            max_retries=3,
+        )
+    assert len(sleep_calls) == 2
+    assert 1.0 <= sleep_calls[0] <= 3.0
+    assert 1.0 <= sleep_calls[1] <= sleep_calls[0] * 3
+
+
+@pytest.mark.asyncio
+async def test_apost_single_honors_rate_limit_reset() -> None:
+    """Test that a 429 whose window has already reset is retried without waiting."""
+    # Arrange
+    sleep_calls: list[float] = []
+    call_count = 0
+
+    async def sleeper_track(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    def http_post_reset_then_success(url: str, **kwargs: Any) -> MockResponse:
+        nonlocal call_count
+        call_count += 1
+        if call_count == 1:
+            return MockResponse(
+                status_code=429,
+                json_data={"errors": [{"message": "Rate limited"}]},
+                headers={"x-rate-limit-reset": str(int(datetime.now().timestamp()) - 1)},
+            )
+        return MockResponse(
+            status_code=201,
+            json_data={"data": {"id": "after_reset", "text": kwargs["json"]["text"]}},
+            headers={},
+        )
+
+    # Act
+    result = await apost_single(
+        "test_token_123",
+        "Rate limited tweet",
+        http_post=http_post_reset_then_success,
+        sleeper=sleeper_track,
+    )
+
+    # Assert
+    assert result.tweet_id == "after_reset"
+    assert sleep_calls == [0.0]
+
+
+@pytest.mark.asyncio
+async def test_post_thread_without_pacing() -> None:
+    """Test that rate_limit_delay=0 posts the thread without pacing sleeps."""
+    # Arrange
+    sleep_calls: list[float] = []
+
+    async def sleeper_track(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    # Act
+    result = await post_thread(
+        "test_token_123",
+        ["Tweet 1", "Tweet 2", "Tweet 3"],
+        http_post=mock_http_post_success(),
+        sleeper=sleeper_track,
+        rate_limit_delay=0,
+    )
+
+    # Assert
+    assert result.success is True
+    assert sleep_calls == []
+
+
+def _patch_async_client(monkeypatch: pytest.MonkeyPatch, handler: Any) -> None:
+    """Route the default AsyncClient of post_x through a MockTransport."""
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs: Any) -> httpx.AsyncClient:
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(post_x_module.httpx, "AsyncClient", client_factory)
+
+
+@pytest.mark.asyncio
+async def test_apost_single_default_client_reports_api_error(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that HTTP errors from the default client reach the status code checks."""
+    # Arrange
+    _patch_async_client(
+        monkeypatch,
+        lambda request: httpx.Response(403, json={"errors": [{"message": "Forbidden text"}]}),
+    )
+
+    async def no_sleep(seconds: float) -> None:
+        pass
+
+    # Act & Assert
+    with pytest.raises(PostError, match="Forbidden text"):
+        await apost_single("test_token_123", "Denied", sleeper=no_sleep, max_retries=2)
+
+
+@pytest.mark.asyncio
+async def test_apost_single_default_client_honors_rate_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a real 429 from the default client waits for the reset and raises RateLimitError."""
+    # Arrange
+    sleep_calls: list[float] = []
+    reset_at = str(int(datetime.now().timestamp()))
+    _patch_async_client(
+        monkeypatch,
+        lambda request: httpx.Response(
+            429,
+            json={"errors": [{"message": "Too Many Requests"}]},
+            headers={"x-rate-limit-reset": reset_at},
+        ),
+    )
+
+    async def sleeper_track(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    # Act & Assert
+    with pytest.raises(RateLimitError, match=reset_at):
+        await apost_single("test_token_123", "Limited", sleeper=sleeper_track, max_retries=3)
+    assert len(sleep_calls) == 2
+    assert all(delay <= 1.0 for delay in sleep_calls)
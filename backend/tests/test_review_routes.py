@@ -8,6 +8,7 @@ import pytest
 from app.db.base import Base, engine
 from app.main import app
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 
@@ -110,6 +111,28 @@ def test_review_page_shows_tweets(client: TestClient, test_run: Any) -> None:
     assert "Tweet 3/3" in content
 
 
+def test_review_page_loads_run_in_two_queries(
+    client: TestClient, test_run: Any, db_session: Session
+) -> None:
+    """Test that the run, its account and its tweets are loaded eagerly."""
+    statements: list[str] = []
+
+    def _record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    run_id = test_run.id
+    db_session.expire_all()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        response = client.get(f"/review/{run_id}")
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+
+    assert response.status_code == 200
+    assert "@testuser" in response.content.decode()
+    assert len(statements) == 2
+
+
 def test_review_page_shows_article_title(client: TestClient, test_run: Any) -> None:
     """Test that review page shows scraped article title."""
     response = client.get(f"/review/{test_run.id}")
@@ -187,7 +210,7 @@ def test_regenerate_thread(client: TestClient, test_run: Any, db_session: Sessio
 
     with (
         patch("app.web.routes.scrape") as mock_scrape,
-        patch("app.web.routes.generate_thread") as mock_gen,
+        patch("app.web.routes.generate_thread", autospec=True) as mock_gen,
     ):
 
         from app.services.generate import GeneratedThread
@@ -224,3 +247,82 @@ def test_regenerate_thread(client: TestClient, test_run: Any, db_session: Sessio
         assert tweets[0].text == "New tweet 1/3"
         assert tweets[1].text == "New tweet 2/3"
         assert tweets[2].text == "New tweet 3/3"
+
+        # The stored article text is reused instead of fetching the page again
+        mock_scrape.assert_not_called()
+        assert mock_gen.call_args.args[0].text == "Test content"
+        assert mock_gen.call_args.kwargs["use_cache"] is False
+
+
+def test_rescrape_thread_fetches_fresh_content(
+    client: TestClient, test_run: Any, db_session: Session
+) -> None:
+    """Test that rescrape fetches the article again and regenerates from it."""
+    from app.db.models import Run, Tweet
+    from app.services.generate import GeneratedThread
+    from app.services.scraper import ScrapedContent
+
+    with (
+        patch("app.web.routes.scrape") as mock_scrape,
+        patch("app.web.routes.generate_thread", autospec=True) as mock_gen,
+    ):
+        mock_scrape.return_value = ScrapedContent(
+            title="Updated Article",
+            text="Updated content",
+            site_name="example.com",
+            word_count=120,
+            too_short=False,
+            hero_candidates=[],
+            metadata={},
+        )
+        mock_gen.return_value = GeneratedThread(
+            tweets=["Fresh tweet 1/2", "Fresh tweet 2/2"],
+            style_used="punchy",
+            hook_used=True,
+            tokens_in=100,
+            tokens_out=50,
+            cost_usd=0.002,
+            model_used="gpt-4o-mini",
+        )
+
+        response = client.post(f"/review/{test_run.id}/rescrape", follow_redirects=False)
+
+    assert response.status_code == 303
+    mock_scrape.assert_called_once_with("https://example.com/article")
+    assert mock_gen.call_args.args[0].text == "Updated content"
+    run = db_session.query(Run).filter(Run.id == test_run.id).one()
+    db_session.refresh(run)
+    assert run.scraped_text == "Updated content"
+    tweets = db_session.query(Tweet).filter(Tweet.run_id == test_run.id).order_by(Tweet.idx).all()
+    assert [tweet.text for tweet in tweets] == ["Fresh tweet 1/2", "Fresh tweet 2/2"]
+
+
+def test_regenerate_runs_generation_off_event_loop(client: TestClient, test_run: Any) -> None:
+    """Test that the blocking OpenAI call does not run on the event loop."""
+    import asyncio
+
+    from app.services.generate import GeneratedThread
+
+    loop_running: list[bool] = []
+
+    def fake_generate(*args: Any, **kwargs: Any) -> GeneratedThread:
+        try:
+            asyncio.get_running_loop()
+            loop_running.append(True)
+        except RuntimeError:
+            loop_running.append(False)
+        return GeneratedThread(
+            tweets=["Tweet 1/1"],
+            style_used="punchy",
+            hook_used=True,
+            tokens_in=10,
+            tokens_out=5,
+            cost_usd=0.001,
+            model_used="gpt-4o-mini",
+        )
+
+    with patch("app.web.routes.generate_thread", side_effect=fake_generate):
+        response = client.post(f"/review/{test_run.id}/regenerate", follow_redirects=False)
+
+    assert response.status_code == 303
+    assert loop_running == [False]
@@ -1,6 +1,10 @@
 """Tests for web content scraping."""
 
+import gzip
+
+import httpx
 import pytest
+from app.services import scraper as scraper_module
 from app.services.scraper import ScraperError, scrape
 from httpx import Response
 
@@ -253,6 +257,21 @@ def test_scrape_hero_candidates_from_metadata() -> None:
     assert any("image1.jpg" in url for url in result.hero_candidates)
 
 
+def test_scrape_hero_candidates_keep_commas_in_urls() -> None:
+    """Test that image URLs containing commas come through intact."""
+    html = """<html><head>
+    <meta property="og:image" content="https://cdn.example.com/img?w=1200,h=630">
+    <meta name="twitter:image" content="https://cdn.example.com/card.jpg">
+    </head><body><p>Short body.</p></body></html>"""
+    result = scrape("https://example.com/commas", http_get=mock_http_get(html))
+
+    assert result.hero_candidates == [
+        "https://cdn.example.com/img?w=1200,h=630",
+        "https://cdn.example.com/card.jpg",
+    ]
+    assert "_hero_candidates" not in result.metadata
+
+
 def test_scrape_whitespace_normalization() -> None:
     """Test that whitespace in extracted text is normalized."""
     html_whitespace = """
@@ -272,3 +291,73 @@ def test_scrape_whitespace_normalization() -> None:
     # Should normalize whitespace
     assert "    " not in result.text  # No excessive spaces
     assert len(result.text) > 0
+
+
+def test_scrape_metadata_with_xml_declaration() -> None:
+    """Test that pages starting with an XML encoding declaration still yield metadata."""
+    html = "<?xml version='1.0' encoding='utf-8'?>" + HTML_WITH_METADATA.strip().removeprefix(
+        "<!DOCTYPE html>"
+    )
+    http_get = mock_http_get(html)
+    result = scrape("https://example.com/xhtml", http_get=http_get)
+
+    assert result.site_name == "Example Site"
+    assert result.hero_candidates == [
+        "https://example.com/image1.jpg",
+        "https://example.com/image2.jpg",
+    ]
+
+
+def test_scrape_default_fetch_reuses_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that default fetches go through one pooled client instead of a new one each."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> Response:
+        paths.append(request.url.path)
+        return Response(200, text=SAMPLE_BLOG_POST)
+
+    monkeypatch.setattr(
+        scraper_module, "_shared_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    scrape("https://example.com/one")
+    scrape("https://example.com/two")
+
+    assert paths == ["/one", "/two"]
+    assert scraper_module._get_shared_client() is scraper_module._shared_client
+
+
+def test_scrape_reads_metadata_from_head_only() -> None:
+    """Test that metadata comes from the head and body markup is not mistaken for it."""
+    html = HTML_WITH_METADATA.replace(
+        "<body>",
+        '<body><meta property="og:image" content="https://example.com/body.jpg" />',
+    )
+    http_get = mock_http_get(html)
+    result = scrape("https://example.com/head", http_get=http_get)
+
+    assert result.hero_candidates == [
+        "https://example.com/image1.jpg",
+        "https://example.com/image2.jpg",
+    ]
+
+
+def test_default_fetch_truncates_oversized_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the default fetch stops reading at the byte cap and decodes gzip once."""
+    monkeypatch.setattr(scraper_module, "_MAX_HTML_BYTES", 1024)
+    body = gzip.compress(("<p>word</p>" * 1000).encode())
+
+    def handler(request: httpx.Request) -> Response:
+        return Response(
+            200, content=body, headers={"Content-Encoding": "gzip", "Content-Type": "text/html"}
+        )
+
+    monkeypatch.setattr(
+        scraper_module, "_shared_client", httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    response = scraper_module._default_http_get("https://example.com/huge")
+
+    assert response.status_code == 200
+    assert len(response.content) == 1024
+    assert response.text.startswith("<p>word</p>")
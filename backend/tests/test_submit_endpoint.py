@@ -7,6 +7,7 @@ from app.db.base import Base, engine
 from app.db.models import Account, Run
 from app.main import app
 from app.services.generate import GeneratedThread
+from app.services.images import ProcessedImage
 from app.services.scraper import ScrapedContent
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
@@ -71,9 +72,9 @@ def mock_services():
     with (
         patch("app.web.routes.canonicalize") as mock_canon,
         patch("app.web.routes.scrape") as mock_scrape,
-        patch("app.web.routes.generate_thread") as mock_gen,
+        patch("app.web.routes.generate_thread", autospec=True) as mock_gen,
         patch("app.web.routes.pick_hero") as mock_hero,
-        patch("app.web.routes.validate_and_process") as mock_img,
+        patch("app.web.routes.avalidate_and_process") as mock_img,
     ):
 
         mock_canon.side_effect = (
@@ -82,14 +83,14 @@ def mock_services():
         mock_scrape.return_value = mock_scraped
         mock_gen.return_value = mock_generation
         mock_hero.return_value = "https://example.com/image.jpg"
-        mock_img.return_value = b"fake_image_bytes"
+        mock_img.return_value = ProcessedImage(data=b"fake_image_bytes", width=1200, height=630)
 
         yield {
             "canonicalize": mock_canon,
             "scrape": mock_scrape,
             "generate_thread": mock_gen,
             "pick_hero": mock_hero,
-            "validate_and_process": mock_img,
+            "avalidate_and_process": mock_img,
         }
 
 
@@ -168,6 +169,39 @@ def test_submit_creates_run_in_database(
     assert run.type == "thread"
 
 
+def test_submit_single_stores_one_capped_tweet(
+    client: TestClient, test_account: Account, db_session: Session, mock_services
+) -> None:
+    """Test that a single-post run stores exactly one tweet, cut to single_cap."""
+    from app.db.models import Tweet
+    from app.services.generate import GeneratedSingle
+
+    form_data = {
+        "url": "https://example.com/article",
+        "account_id": str(test_account.id),
+        "mode": "review",
+        "type": "single",
+        "single_cap": "300",
+    }
+
+    with patch("app.web.routes.generate_single", autospec=True) as mock_single:
+        mock_single.return_value = GeneratedSingle(
+            text="x" * 400,
+            style_used="punchy",
+            tokens_in=100,
+            tokens_out=50,
+            cost_usd=0.001,
+            model_used="gpt-4o-mini",
+        )
+        response = client.post("/submit", data=form_data, follow_redirects=False)
+
+    assert response.status_code == 303
+    mock_services["generate_thread"].assert_not_called()
+    assert mock_single.call_args.args[1].mode == "single"
+    tweets = db_session.query(Tweet).all()
+    assert [tweet.text for tweet in tweets] == ["x" * 300]
+
+
 def test_submit_redirects_to_review_page(client: TestClient, test_account: Account) -> None:
     """Test that submit redirects to review page with run_id."""
     # Arrange
@@ -355,3 +389,79 @@ def test_submit_with_invalid_account_id(client: TestClient) -> None:
 
     # Assert
     assert response.status_code in [400, 404]  # Bad request or not found
+
+
+def test_submit_processes_hero_image_without_blocking(
+    client: TestClient, test_account: Account, db_session: Session, mock_services
+) -> None:
+    """Test that the hero image is processed asynchronously and its alt text stored."""
+    from app.db.models import Tweet
+
+    # Arrange
+    form_data = {
+        "url": "https://example.com/article",
+        "account_id": str(test_account.id),
+        "mode": "review",
+        "type": "thread",
+        "include_image": "on",
+    }
+
+    # Act
+    response = client.post("/submit", data=form_data, follow_redirects=False)
+
+    # Assert
+    assert response.status_code in [302, 303]
+    mock_services["avalidate_and_process"].assert_awaited_once_with("https://example.com/image.jpg")
+    tweets = db_session.query(Tweet).order_by(Tweet.idx).all()
+    assert tweets[0].media_alt == "Test Article Title: Test Article Title"
+    assert tweets[1].media_alt is None
+
+
+def test_submit_reuses_recent_scrape_of_same_url(
+    client: TestClient, test_account: Account, db_session: Session, mock_services
+) -> None:
+    """Test that a recent run's stored article text is reused instead of scraping."""
+    # Arrange - a run of the same canonical URL stored its scraped article
+    db_session.add(
+        Run(
+            account_id=test_account.id,
+            url="https://example.com/article?ref=feed",
+            canonical_url="https://example.com/article",
+            mode="review",
+            type="thread",
+            status="review",
+            scraped_title="Stored Title",
+            scraped_text="Stored article text",
+            word_count=3,
+        )
+    )
+    db_session.commit()
+    form_data = {"url": "https://example.com/article", "account_id": str(test_account.id)}
+
+    # Act
+    response = client.post("/submit", data=form_data, follow_redirects=False)
+    forced = client.post(
+        "/submit", data={**form_data, "force_rescrape": "on"}, follow_redirects=False
+    )
+
+    # Assert
+    assert response.status_code == forced.status_code == 303
+    first_call = mock_services["generate_thread"].call_args_list[0]
+    scrape_input, generation_settings = first_call.args
+    assert scrape_input.title == "Stored Title"
+    assert scrape_input.text == "Stored article text"
+    assert generation_settings.mode == "thread"
+    mock_services["scrape"].assert_called_once_with("https://example.com/article")
+
+
+def test_submit_rejects_invalid_url(client: TestClient, test_account: Account) -> None:
+    """Test that the submission form is validated before the pipeline runs."""
+    # Arrange
+    form_data = {"url": "not a url", "account_id": str(test_account.id)}
+
+    # Act
+    response = client.post("/submit", data=form_data)
+
+    # Assert
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["url"]
@@ -146,3 +146,25 @@ def test_index_page_has_submit_button(client: TestClient) -> None:
     # Assert
     assert response.status_code == 200
     assert b'type="submit"' in response.content or b"Submit" in response.content
+
+
+def test_index_page_caches_account_list(
+    client: TestClient, test_account: Account, db_session: Session
+) -> None:
+    """Test that the account list is reused until it is invalidated."""
+    from app.web.routes import invalidate_account_choices
+
+    # Arrange
+    first = client.get("/")
+    db_session.add(Account(handle="lateuser", provider="x", scopes="tweet.read"))
+    db_session.commit()
+
+    # Act
+    cached = client.get("/")
+    invalidate_account_choices()
+    refreshed = client.get("/")
+
+    # Assert
+    assert "@testuser" in first.text
+    assert "@lateuser" not in cached.text
+    assert "@lateuser" in refreshed.text